@@ -23,7 +23,6 @@
 import arcpy
 import os
 import sys
-from xml.dom import minidom
 
 import Base
 
@@ -60,54 +59,25 @@ class AddFields(Base.Base):
         return True
 
     def init(self, config):
-
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("\nError: MosaicDataset node not found! Invalid schema.", self.const_critical_text)
             return False
+        if (self.m_base.m_mdName == ''):
+            self.m_base.m_mdName = model.md.name
 
-        try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                    if (node.nodeName == 'Name'):
-                        try:
-                            if (self.m_base.m_mdName == ''):
-                                self.m_base.m_mdName = node.firstChild.nodeValue
-                            break
-                        except:
-                            Error = True
-        except:
-            self.log("\nError: reading MosaicDataset nodes.", self.const_critical_text)
-            return False
-
-        Nodelist = self.m_base.m_doc.getElementsByTagName("Fields")
-        if (Nodelist.length == 0):
+        if (model.md.fields is None):
             self.log("Error: Fields node not found! Invalid schema.", self.const_critical_text)
             return False
 
-        try:
-            for node in Nodelist[0].childNodes:
-                if (node.nodeType == minidom.Node.ELEMENT_NODE):
-                    for n in node.childNodes:
-                        if(n.nodeType == minidom.Node.ELEMENT_NODE):
-                            nodeName = n.nodeName.upper()
-                            if (nodeName == 'NAME'):
-                                self.fieldNameList.append(n.firstChild.nodeValue)
-                            elif(nodeName == 'TYPE'):
-                                self.fieldTypeList.append(n.firstChild.nodeValue)
-                            elif(nodeName == 'LENGTH'):
-                                try:
-                                    self.fieldLengthList.append(n.firstChild.nodeValue)
-                                except:
-                                    self.fieldLengthList.append('')
-        except:
-            self.log("\nError: Reading fields information!", self.const_critical_text)
-            return False
-
-        fields_len = len(self.fieldNameList)
-        if (len(self.fieldTypeList) != fields_len or len(self.fieldLengthList) != fields_len):
-            self.log("\nError: Number of Field(Name, Type, Len) do not match!", self.const_critical_text)
-            return False
+        for field in model.md.fields:
+            if (field.name is None or
+                field.type is None or
+                    field.length is None):
+                self.log("\nError: Number of Field(Name, Type, Len) do not match!", self.const_critical_text)
+                return False
+            self.fieldNameList.append(field.name)
+            self.fieldTypeList.append(field.type)
+            self.fieldLengthList.append(field.length)
 
         return True
@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: ARTCache.py
+# Description: Parse-once cache of the raster type (ART) templates and their per process (-artdem) copies.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import atexit
+import shutil
+import hashlib
+import tempfile
+import threading
+from xml.dom import minidom
+
+_lock = threading.RLock()
+_docs = {}          # template path -> (stamp, parsed document)
+_variants = {}      # (template path, stamp, workspace, dataset) -> path of the updated copy or None if unchanged.
+_folder = None      # (pid, folder) of the copies of this process.
+
+
+def getPathKey(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def getStamp(path):
+    stat = os.stat(path)
+    return (stat.st_mtime, stat.st_size)
+
+
+def getDocument(path):
+    """Returns the parsed ART (path). It's parsed once per process unless the file changes. The document must not be modified."""
+    key = getPathKey(path)
+    stamp = getStamp(path)
+    with _lock:
+        entry = _docs.get(key)
+        if (entry is None or
+                entry[0] != stamp):
+            entry = _docs[key] = (stamp, minidom.parse(path))
+        return entry[1]
+
+
+def _removeFolder(pid, folder):
+    if os.getpid() == pid:     # not by forked pool workers that inherited the folder.
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def getFolder():
+    """Returns the temp folder of the ART copies of this process, removed on exit."""
+    global _folder
+    with _lock:
+        if (_folder is None or
+                _folder[0] != os.getpid()):
+            _folder = (os.getpid(), tempfile.mkdtemp(prefix='mdcs_art_{}_'.format(os.getpid())))
+            _variants.clear()
+            atexit.register(_removeFolder, *_folder)
+        return _folder[1]
+
+
+def getVariant(template, workspace, dataset, update):
+    """Returns the path of a copy of the ART (template) with the DEM (workspace, dataset) values set by (update)(doc, workspace, dataset)
+    or None if (update) returns False. Copies are made once per (template, workspace, dataset) and process, (template) isn't modified."""
+    stamp = getStamp(template)
+    with _lock:
+        folder = getFolder()
+        key = (getPathKey(template), stamp, workspace, dataset)
+        if key in _variants:
+            path = _variants[key]
+            if (path is None or
+                    os.path.exists(path)):
+                return path
+        doc = getDocument(template).cloneNode(True)
+        path = None
+        if update(doc, workspace, dataset):
+            path = os.path.join(folder, hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16], os.path.basename(template))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as writer:
+                writer.write(doc.toxml())
+        _variants[key] = path
+        return path
+    # ends
@@ -22,9 +22,18 @@
 
 import arcpy
 import os
-from xml.dom import minidom
+import time
+from datetime import timedelta
 
 import Base
+import Planner
+import SourceManifest
+import SourceDiscovery
+import ChunkProgress
+import ARTCache
+
+CatalogOIDField = 'OBJECTID'
+CallbackFlush = 'flush'     # set in (info) of the extra callback call made once all AddRaster nodes of a mosaic dataset are done.
 
 
 class AddRasters(Base.Base):
@@ -37,24 +46,118 @@ class AddRasters(Base.Base):
         self.m_sources = base.m_sources
 
         self.m_base = base
+        self.m_lastObjectIDs = {}   # mosaic dataset path -> max OBJECTID, valid until the next write to its catalog.
 
     def AddCallBack(self, fnc):
+        # fnc(gdbPath, mdName, info) is called after each AddRaster node that added items and once more with info['flush'] set.
         self.callback_functions.append(fnc)
         return True
 
-    def getLastObjectID(self, gdb, md):
+    def flushCallbacks(self, sourceID):
+        """Calls the callbacks with info['flush'] set, i.e. to write what they deferred for the AddRaster nodes of (sourceID)"""
+        info = self.sMdNameList[sourceID]
+        info[CallbackFlush] = True
+        try:
+            for callback_fn in self.callback_functions:
+                if (callback_fn(self.m_base.m_geoPath, sourceID, info) == False):
+                    return False
+        finally:
+            del info[CallbackFlush]
+        return True
 
+    def getLastObjectID(self, gdb, md):
+        """Returns the max OBJECTID of the mosaic dataset (md) catalog or 0 if empty. Memoized until (invalidateLastObjectID)"""
         path = os.path.join(gdb, md)
-        rows = arcpy.SearchCursor(path, "objectid = (SELECT MAX(\"objectid\") FROM %sAMD_%s_CAT)" % (self.m_base.m_SDE_database_user, md), None, 'objectid')
-        if (rows is None):
-            return 0  # new table
-
+        if (path in self.m_lastObjectIDs):
+            return self.m_lastObjectIDs[path]
         objID = 0
-        for row in rows:
-            objID = row.objectid
-            break
+        try:
+            # reads only the first row of the descending index scan instead of the whole catalog.
+            with arcpy.da.SearchCursor(path, ['OID@'], sql_clause=(None, 'ORDER BY {} DESC'.format(CatalogOIDField))) as rows:
+                for row in rows:
+                    objID = row[0]
+                    break
+        except RuntimeError:     # ORDER BY not supported by the workspace.
+            with arcpy.da.SearchCursor(path, ['OID@']) as rows:
+                for row in rows:
+                    objID = max(objID, row[0])
+        self.m_lastObjectIDs[path] = objID
         return objID
 
+    def invalidateLastObjectID(self, gdb, md):
+        self.m_lastObjectIDs.pop(os.path.join(gdb, md), None)
+
+    def getSources(self, MDName, hshAddRaster, set_filter, rasterType, chunkSize=0):
+        """Lists the <data_path> files in parallel (discovery), drops the ones already in the manifest (source_manifest) and/or
+        splits the sources into (chunkSize) chunks. Returns ([(data_path, [sources] or None if not chunked)], raster type,
+        SourceManifest or None, number of sources) or None if none is enabled."""
+        manifestMode = SourceManifest.getMode(self.GetValue(hshAddRaster, 'source_manifest'))
+        discovery = self.m_base.getBooleanValue(self.GetValue(hshAddRaster, SourceDiscovery.KeyDiscovery))
+        options = SourceDiscovery.getOptions(hshAddRaster)
+        if ((manifestMode or discovery) and
+                not set_filter and
+                options.regex is None):
+            self.log('\tDiscovery: a <filter> i.e. *.tif or <{}> is required to list the source files. Sources passed as is.'.format(SourceDiscovery.KeyRegex), self.const_warning_text)
+            (manifestMode, discovery) = (None, False)
+        if (not manifestMode and
+                not discovery):
+            if not chunkSize:
+                return None
+            paths = [p.strip() for p in self.GetValue(hshAddRaster, 'data_path').split(';') if p.strip()]
+            return ([(';'.join(c), c) for c in ChunkProgress.getChunks(paths, chunkSize)], rasterType, None, len(paths))
+        start = time.time()
+        recursive = self.GetValue(hshAddRaster, 'sub_folder').strip().upper() != 'NO_SUBFOLDERS'
+        errors = []
+        (files, others) = SourceDiscovery.discover(self.GetValue(hshAddRaster, 'data_path'), set_filter, recursive, options, errors)
+        found = []
+
+        def count(files):
+            for file in files:
+                found.append(file[0])
+                yield file
+        files = count(files)
+        manifest = None
+        if (manifestMode):
+            manifest = SourceManifest.SourceManifest(SourceManifest.getPath(self.m_base.m_geoPath, MDName), manifestMode)
+            paths = manifest.filter(files, hshAddRaster.get('dataset_id'))
+        else:
+            paths = (file[0] for file in files)
+        asTable = (rasterType.strip().lower() == 'raster dataset' and
+                   not others)
+        prefix = '{}_sources_'.format(MDName)
+        if (chunkSize):
+            paths = sorted(paths) + others  # the walk order varies, the chunks must not for -resume.
+            total = len(paths)
+            chunks = [(SourceDiscovery.writeTable(c, prefix=prefix)[0] if asTable else ';'.join(c), c) for c in ChunkProgress.getChunks(paths, chunkSize)]
+        elif (asTable):
+            (dataPath, total) = SourceDiscovery.writeTable(paths, prefix=prefix)
+            chunks = [(dataPath, None)]
+        else:
+            paths = list(paths) + others
+            (chunks, total) = ([(';'.join(paths), None)], len(paths))
+        if (asTable):
+            rasterType = 'Table'    # reads the paths of the (Raster) field.
+        for (folder, error) in errors:
+            self.log('\tDiscovery: unable to list ({}) {}'.format(folder, error), self.const_warning_text)
+        self.log('\tDiscovery: ({}) files found in ({:.1f}s) using ({}) threads, ({}) to add.{}'.format(
+            len(found), time.time() - start, options.workers, total,
+            ' ({}) sources passed as is.'.format(len(others)) if others else ''), self.const_general_text)
+        return (chunks, rasterType, manifest, total)
+
+    def removeSourceTables(self, chunks):
+        for (dataPath, sources) in chunks:
+            if os.path.exists(dataPath):
+                os.remove(dataPath)
+
+    def logChunk(self, index, chunks, items, elapsed, added, remaining, runTime):
+        """Logs the items/s of the chunk (index) and the ETA of the (remaining) sources at the rate of the (added) ones."""
+        eta = ''
+        if (added and
+                remaining):
+            eta = ', ETA ({})'.format(timedelta(seconds=int(remaining * runTime / added)))
+        self.log('\tChunk ({}/{}): ({}) items added in ({:.1f}s), ({:.1f}) items/s{}'.format(
+            index + 1, chunks, items, elapsed, items / elapsed if elapsed else 0, eta), self.const_general_text)
+
     def GetValue(self, dic_values, key):
         try:
             if (key in dic_values.keys()):
@@ -78,6 +181,7 @@ class AddRasters(Base.Base):
                 self.log("Path doesn't exist: %s" % (fullPath), self.const_critical_text)
                 return False
             self.m_base.m_last_AT_ObjectID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
+            upToDate = 0
             for hshAddRaster in self.sMdNameList[sourceID]['addraster']:
                 sucess_add_raster = 0
                 try:
@@ -89,13 +193,12 @@ class AddRasters(Base.Base):
                         rasterType = hshAddRaster['art']
                         self.log("\tUsing ART for " + name_toupper + ': ' + rasterType, self.const_general_text)
                         if (self.m_base.m_art_apply_changes == True and
-                                enabledARTEdit):
-                            art_doc = minidom.parse(rasterType)
-                            if (self.m_base.updateART(art_doc, self.m_base.m_art_ws, self.m_base.m_art_ds) == True):
+                                enabledARTEdit and
+                                not Planner.isActive()):
+                            artPath = ARTCache.getVariant(rasterType, self.m_base.m_art_ws, self.m_base.m_art_ds, self.m_base.updateART)
+                            if (artPath):    # a per process copy, the shared template is left as is for the concurrent jobs.
                                 self.log("\tUpdating ART (Workspace, RasterDataset) values with (%s, %s) respectively." % (self.m_base.m_art_ws, self.m_base.m_art_ds), self.const_general_text)
-                                c = open(rasterType, "w")
-                                c.write(art_doc.toxml())
-                                c.close()
+                                rasterType = artPath
                     set_filter = ''
                     if ('filter' in hshAddRaster.keys()):
                         set_filter = hshAddRaster['filter']
@@ -104,14 +207,36 @@ class AddRasters(Base.Base):
                     set_spatial_reference = ''
                     if ('spatial_reference' in hshAddRaster.keys()):
                         set_spatial_reference = hshAddRaster['spatial_reference']
-                    objID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
-                    self.sMdNameList[sourceID]['pre_AddRasters_record_count'] = objID
+                    dataPath = self.GetValue(hshAddRaster, 'data_path')
+                    chunkSize = ChunkProgress.getChunkSize(self.GetValue(hshAddRaster, ChunkProgress.KeyChunkSize))
+                    chunks = [(dataPath, None)]     # [(data_path, [sources] of the chunk)]
+                    sourceTables = False
+                    manifest = None
+                    self.sMdNameList[sourceID]['manifest'] = None
+                    sources = self.getSources(MDName, hshAddRaster, set_filter, rasterType, chunkSize)
+                    if (sources is not None):
+                        (chunks, sourceType, manifest, total) = sources
+                        if (sourceType != rasterType):
+                            (sourceTables, rasterType, set_filter) = (True, sourceType, '')
+                        if (total == 0):
+                            if (sourceTables):
+                                self.removeSourceTables(chunks)
+                            if (manifest is None):
+                                self.log('\tNo sources found for Dataset ID (%s)' % (hshAddRaster['dataset_id']), self.const_warning_text)
+                                continue
+                            self.log('\tAll sources of Dataset ID (%s) are in the manifest, nothing to add.' % (hshAddRaster['dataset_id']), self.const_general_text)
+                            if (not Planner.isActive()):
+                                manifest.commit()   # size/mtime of the (content_hash) matched files.
+                            upToDate += 1
+                            continue
+                        if (Planner.isActive()):
+                            manifest = None
                     self.sMdNameList[sourceID]['Dataset_ID'] = hshAddRaster['dataset_id']
                     self.log('Adding items..')
                     args = []
                     args.append(fullPath)
                     args.append(rasterType)
-                    args.append(self.GetValue(hshAddRaster, 'data_path'))
+                    args.append(dataPath)   # set to the data_path of each chunk.
                     args.append(self.GetValue(hshAddRaster, 'update_cellsize_ranges'))
                     args.append(self.GetValue(hshAddRaster, 'update_boundary'))
                     args.append(self.GetValue(hshAddRaster, 'update_overviews'))
@@ -134,117 +259,147 @@ class AddRasters(Base.Base):
                     if (self.m_base.m_art_apply_changes and
                             not enabledARTEdit):
                         args[len(args) - 1] += ';DEM {}'.format(os.path.join(self.m_base.m_art_ws, self.m_base.m_art_ds))
-                    AddRaster = Base.DynaInvoke('arcpy.AddRastersToMosaicDataset_management', args, None, self.m_base.m_log.Message)
-                    if (AddRaster.init() == False):
-                        return False
-                    add_raster_result = AddRaster.invoke()
-                    newObjID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
-                    if (newObjID <= objID):
-                        if (self.m_base.m_IsSDE):
-                            if (add_raster_result):
-                                sucess_add_raster = sucess_add_raster + 1
-                                self.log('Add raster to sde completed',self.const_general_text)
-                            else:
-                                self.log('No new mosaic dataset item was added to sde',self.const_general_text)
-                                continue
-                        else:
-                            self.log('No new mosaic dataset item was added for Dataset ID (%s)' % (hshAddRaster['dataset_id']))
-                            continue
-                    for callback_fn in self.callback_functions:
-                        if (callback_fn(self.m_base.m_geoPath, sourceID, self.sMdNameList[sourceID]) == False):
+                    try:
+                        AddRaster = Base.DynaInvoke('arcpy.AddRastersToMosaicDataset_management', args, None, self.m_base.m_log.Message)
+                        if (AddRaster.init() == False):
+                            self.flushCallbacks(sourceID)
                             return False
+                        progress = None
+                        done = {}
+                        if (chunkSize and
+                                not Planner.isActive()):
+                            progress = ChunkProgress.ChunkProgress(self.m_base.m_geoPath, MDName,
+                                                                   ChunkProgress.getKey(fullPath, hshAddRaster['dataset_id'], hshAddRaster.get('art', rasterType), [c[1] for c in chunks]))
+                            done = progress.open(len(chunks), self.m_base.m_resume)
+                        remaining = sum([len(chunks[i][1]) for i in range(0, len(chunks)) if i not in done]) if chunkSize else 0
+                        added = 0   # sources added by this run, for the ETA.
+                        runStart = time.time()
+                        for index, (chunkPath, chunkSources) in enumerate(chunks):
+                            if (index in done):     # added by a previous run, its items are only stamped with the Dataset_ID again.
+                                record = done[index]
+                                self.log('\tChunk ({}/{}): added in a previous run, skipped.'.format(index + 1, len(chunks)), self.const_general_text)
+                                self.m_base.m_last_AT_ObjectID = min(self.m_base.m_last_AT_ObjectID, record['start_oid'])
+                                if (record['end_oid'] <= record['start_oid']):
+                                    continue
+                                self.sMdNameList[sourceID]['pre_AddRasters_record_count'] = record['start_oid']
+                                self.sMdNameList[sourceID]['post_AddRasters_record_count'] = record['end_oid']
+                                self.sMdNameList[sourceID]['manifest'] = None
+                                self.sMdNameList[sourceID]['sources'] = None
+                                for callback_fn in self.callback_functions:
+                                    if (callback_fn(self.m_base.m_geoPath, sourceID, self.sMdNameList[sourceID]) == False):
+                                        self.flushCallbacks(sourceID)
+                                        return False
+                                continue
+                            chunkStart = time.time()
+                            objID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
+                            self.sMdNameList[sourceID]['pre_AddRasters_record_count'] = objID
+                            if (chunkSize):
+                                self.log('\tChunk ({}/{}): adding ({}) sources..'.format(index + 1, len(chunks), len(chunkSources)), self.const_general_text)
+                            AddRaster.m_args[2] = chunkPath
+                            self.invalidateLastObjectID(self.m_base.m_geoPath, MDName)    # the tool adds to the catalog even if it fails midway.
+                            try:
+                                add_raster_result = AddRaster.invoke()
+                            finally:
+                                if (sourceTables):
+                                    os.remove(chunkPath)
+                            newObjID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
+                            if (progress):
+                                progress.chunk(index, len(chunkSources), objID, newObjID, add_raster_result, time.time() - chunkStart)
+                                if (not add_raster_result):
+                                    self.log('\tChunk ({}/{}) failed. Items of the previous chunks are kept, use -resume to continue from this chunk.'.format(
+                                        index + 1, len(chunks)), self.const_critical_text)
+                                    if (newObjID > objID):  # rolls back the partially added chunk so that -resume can add it again.
+                                        self.log('\tRemoving the ({}) items of the failed chunk.'.format(newObjID - objID), self.const_warning_text)
+                                        RemoveRasters = Base.DynaInvoke('arcpy.RemoveRastersFromMosaicDataset_management',
+                                                                        [fullPath, '{} > {}'.format(CatalogOIDField, objID)], None, self.m_base.m_log.Message)
+                                        if (RemoveRasters.init()):
+                                            RemoveRasters.invoke()
+                                    self.flushCallbacks(sourceID)
+                                    return False
+                            if (chunkSize):
+                                added += len(chunkSources)
+                                remaining -= len(chunkSources)
+                                self.logChunk(index, len(chunks), newObjID - objID, time.time() - chunkStart, added, remaining, time.time() - runStart)
+                            if (newObjID <= objID and
+                                    not Planner.isActive()):    # no items get added while planning.
+                                if (self.m_base.m_IsSDE):
+                                    if (add_raster_result):
+                                        sucess_add_raster = sucess_add_raster + 1
+                                        self.log('Add raster to sde completed',self.const_general_text)
+                                    else:
+                                        self.log('No new mosaic dataset item was added to sde',self.const_general_text)
+                                        continue
+                                else:
+                                    self.log('No new mosaic dataset item was added for Dataset ID (%s)' % (hshAddRaster['dataset_id']))
+                                    continue
+                            self.sMdNameList[sourceID]['post_AddRasters_record_count'] = newObjID
+                            # recorded by the (AR) callback once the Dataset_IDs are set, files the tool failed on are left to the next run.
+                            self.sMdNameList[sourceID]['manifest'] = manifest if add_raster_result else None
+                            self.sMdNameList[sourceID]['sources'] = chunkSources
+                            for callback_fn in self.callback_functions:
+                                if (callback_fn(self.m_base.m_geoPath, sourceID, self.sMdNameList[sourceID]) == False):
+                                    self.flushCallbacks(sourceID)
+                                    return False
+                    finally:
+                        if (sourceTables):
+                            self.removeSourceTables(chunks)    # of the skipped/remaining chunks.
 
                 except Exception as e:
                     self.log(str(e), self.const_warning_text)
                     self.log(arcpy.GetMessages(), self.const_warning_text)
                     Warning = True
+            if (not self.flushCallbacks(sourceID)):
+                return False
             newObjID = self.getLastObjectID(self.m_base.m_geoPath, MDName)
-            if (newObjID <= self.m_base.m_last_AT_ObjectID):
-                if (sucess_add_raster > 0):
+            if (newObjID <= self.m_base.m_last_AT_ObjectID and
+                    not Planner.isActive()):
+                if (sucess_add_raster > 0 or
+                        upToDate > 0):
                     continue
                 self.log('No new mosaic dataset items added to dataset (%s). Verify the input data path/raster type is correct' % (MDName), self.const_critical_text)
                 self.log(arcpy.GetMessages(), self.const_critical_text)
                 return False
         return True
 
+    def getDataPaths(self, dataPaths, isDerived):
+        if (self.m_base.m_sources != ''):
+            return self.m_base.m_sources
+        paths = ''
+        for _file in dataPaths:
+            if (isDerived):
+                _p, _f = os.path.split(_file)
+                if (_p == ''):
+                    _file = ';'.join([os.path.join(self.m_base.m_geoPath, _fl) for _fl in _f.split(';')])
+            paths = paths + _file + ';'
+        return paths
+
     def init(self, config):
-        mdType = self.getXMLNodeValue(self.m_base.m_doc, 'MosaicDatasetType').lower()
-        isDerived = mdType == 'derived'
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("Error: <MosaicDataset> node is not found! Invalid schema.", self.const_critical_text)
             return False
+        if ('Name' not in model.md.values):
+            self.log("Error: <Name> is not found in <MosaicDataset>", self.const_critical_text)
+            return False
+        isDerived = model.md.type.lower() == 'derived'
         try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                    if (node.nodeName == 'Name'):
-                        mosasicDataset = self.m_base.m_mdName
-                        if (mosasicDataset == ''):
-                            mosasicDataset = node.firstChild.nodeValue
-                        mosasicDataset = mosasicDataset.strip()
-                        self.sMdNameList[mosasicDataset] = {'md': mosasicDataset}
-                        self.sMdNameList[mosasicDataset]['addraster'] = []
-                        self.sMdNameList[mosasicDataset]['type'] = self.getXMLNodeValue(self.m_base.m_doc, "MosaicDatasetType")
-                    elif(node.nodeName == 'dataset_id'):
-                        if (mosasicDataset in self.sMdNameList.keys()):
-                            idValue = node.firstChild.nodeValue
-                            self.sMdNameList[mosasicDataset]['Dataset_ID'] = idValue.strip()
-                    elif(node.nodeName == 'AddRasters'):
-                        rasterType = False
-                        if (len(mosasicDataset) == 0):
-                            self.log("Error: <Name> should be the first child-element in <MosaicDataset>", self.const_critical_text)
-                            return False
-                        for node in node.childNodes:
-                            if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                nodeName = node.nodeName.lower()
-                                if (nodeName == 'addraster'):
-                                    hshAddRasters = {}
-                                    for node in node.childNodes:
-                                        if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                            nodeName = node.nodeName.lower()
-                                            nodeValue = ''
-                                            if (node.childNodes.length > 0):
-                                                nodeValue = node.firstChild.nodeValue
-                                            if (nodeName == 'sources'):
-                                                dataPaths = ''
-                                                keyFound = False
-                                                nodeName = 'data_path'  # only <DataPath> nodes can exist under <Sources>
-                                                if (self.m_base.m_sources == ''):
-                                                    for cNode in node.childNodes:
-                                                        if (cNode is not None and cNode.nodeType == minidom.Node.ELEMENT_NODE):
-                                                            name_ = cNode.nodeName
-                                                            name_ = name_.lower()
-                                                            if (name_ == nodeName):
-                                                                if (cNode.childNodes.length > 0):
-                                                                    _file = cNode.firstChild.nodeValue.strip()
-                                                                    if (isDerived):
-                                                                        _p, _f = os.path.split(_file)
-                                                                        if (_p == ''):
-                                                                            _flist = _f.split(';')
-                                                                            indata = ''
-                                                                            for _fl in range(len(_flist)):
-                                                                                indata = indata + ";" + (os.path.join(self.m_base.m_geoPath, _flist[_fl]))
-                                                                            if indata[0] == ';':
-                                                                                _file = indata[1:len(indata)]
-                                                                            else:
-                                                                                _file = indata
-                                                                    dataPaths = dataPaths + _file + ';'
-                                                                    keyFound = True
-                                                else:
-                                                    dataPaths = self.m_base.m_sources
-                                                nodeValue = dataPaths
-                                            elif (nodeName == 'raster_type'):
-                                                nodeName = 'art'
-                                                if (nodeValue.lower().find('.art') >= 0):
-                                                    nodeValue = self.prefixFolderPath(nodeValue, self.m_base.const_raster_type_path_)
-                                            hshAddRasters[nodeName] = nodeValue
-                                    if (mosasicDataset in self.sMdNameList.keys()):
-                                        try:
-                                            self.sMdNameList[mosasicDataset]['addraster'].append(hshAddRasters)
-                                        except:
-                                            Warning_ = True
-                                            # print "Warning: empty value for: MosaicDataset/" + nodeName
+            mosasicDataset = (self.m_base.m_mdName or model.md.values['Name']).strip()
+            mdInfo = self.sMdNameList[mosasicDataset] = {'md': mosasicDataset}
+            mdInfo['addraster'] = []
+            mdInfo['type'] = model.md.type
+            if (model.md.values.get('dataset_id') is not None):
+                mdInfo['Dataset_ID'] = model.md.values['dataset_id'].strip()
+            for addRaster in model.md.add_rasters:
+                hshAddRasters = {}
+                for nodeName, nodeValue in addRaster.values.items():
+                    if (nodeName == 'raster_type'):
+                        nodeName = 'art'
+                        if (nodeValue.lower().find('.art') >= 0):
+                            nodeValue = self.prefixFolderPath(nodeValue, self.m_base.const_raster_type_path_)
+                    hshAddRasters[nodeName] = nodeValue
+                if (addRaster.data_paths is not None):      # only <DataPath> nodes can exist under <Sources>
+                    hshAddRasters['data_path'] = self.getDataPaths(addRaster.data_paths, isDerived)
+                mdInfo['addraster'].append(hshAddRasters)
         except Exception as inst:
             self.log("Err. Reading MosaicDataset nodes.", self.const_critical_text)
             self.log(str(inst), self.const_critical_text)
@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: ChunkProgress.py
+# Description: Per mosaic dataset progress file of the (AR) source chunks, to resume at the first incomplete chunk.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import hashlib
+
+from journal import Journal, const_rec_start, const_rec_resume
+
+KeyChunkSize = 'chunk_size'     # <AddRaster> node key, number of sources per AddRastersToMosaicDataset call.
+const_rec_chunk = 'chunk'
+CEXT = '.ar_progress'
+
+
+def getChunkSize(value):
+    """Returns the <chunk_size> (value) as an int, 0 if chunking is disabled. Raises ValueError on invalid values."""
+    value = (value or '').strip()
+    return max(0, int(value)) if value else 0
+
+
+def getChunks(paths, chunkSize):
+    return [paths[i:i + chunkSize] for i in range(0, len(paths), chunkSize)]
+
+
+def getKey(mdPath, datasetID, rasterType, chunks):
+    """Returns the hash identifying the chunked sources of an <AddRaster> node. Progress of other nodes/source lists is ignored."""
+    hsh = hashlib.sha256()
+    for value in (mdPath, datasetID, rasterType, str(len(chunks))):
+        hsh.update('{}\n'.format(value).encode('utf-8'))
+    for chunk in chunks:
+        hsh.update('{}\n'.format(len(chunk)).encode('utf-8'))
+        for path in chunk:
+            hsh.update('{}\n'.format(path).encode('utf-8'))
+    return hsh.hexdigest()
+
+
+class ChunkProgress(Journal):
+
+    def __init__(self, geoPath, mdName, key):
+        """The progress file is next to the geodatabase/(.sde) connection file, i.e. c:/data/Amberg.Amberg1.ar_progress.journal"""
+        geoPath = os.path.normpath(geoPath)
+        name = os.path.splitext(os.path.basename(geoPath))[0]
+        Journal.__init__(self, os.path.dirname(geoPath), '{}.{}{}'.format(name, mdName, CEXT))
+        self.config_hash = key
+
+    def getDone(self):
+        """Returns the {index: record} of the chunks added since the last (start) of the same (key)"""
+        done = {}
+        for record in self._read():
+            if record.get('config_hash') != self.config_hash:
+                continue
+            rec_type = record.get('type')
+            if rec_type == const_rec_start:
+                done = {}
+            elif (rec_type == const_rec_chunk and
+                    record.get('status') is True):
+                done[record['index']] = record
+        return done
+
+    def open(self, chunks, resume):
+        """Returns the {index: record} of the chunks to skip if (resume) is set, starts a new run of the chunks otherwise."""
+        done = self.getDone() if resume else {}
+        self._write({'type': const_rec_resume if done else const_rec_start, 'chunks': chunks})
+        return done
+
+    def chunk(self, index, count, start, end, status, elapsed):
+        """Records the chunk (index) of (count) sources that added the items of OBJECTID > (start) and <= (end)"""
+        return self._write(
+            {
+                'type': const_rec_chunk,
+                'index': index,
+                'count': count,
+                'start_oid': start,
+                'end_oid': end,
+                'status': status,
+                'elapsed': round(elapsed, 3)
+            })
+    # ends
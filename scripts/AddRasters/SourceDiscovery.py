@@ -0,0 +1,165 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: SourceDiscovery.py
+# Description: Parallel (os.scandir) listing of the (AR) source files, streamed into a file list table.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import re
+import csv
+import tempfile
+from fnmatch import fnmatch
+from datetime import datetime, timedelta
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# <AddRaster> node keys
+KeyDiscovery = 'discovery'                  # true to list the sources before calling the tool.
+KeyWorkers = 'discovery_workers'
+KeyRegex = 'discovery_regex'                # matched against the file names, in addition to <filter>
+KeyNewerThan = 'discovery_newer_than'       # days, i.e. 1.5, or a date/time, i.e. 2026-10-01
+KeyOlderThan = 'discovery_older_than'
+KeyMinSize = 'discovery_min_size'           # bytes
+KeyMaxSize = 'discovery_max_size'
+TableField = 'Raster'       # path field of the (Table) raster type.
+DefWorkers = min(32, (os.cpu_count() or 1) * 4)     # the walk waits on I/O, not the CPU.
+
+Options = namedtuple('Options', ['workers', 'regex', 'newer_than', 'older_than', 'min_size', 'max_size'])
+
+
+def getTime(value, now=None):
+    """Returns the timestamp of (value) given in days before (now) or as an ISO date/time, None if empty."""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return ((now or datetime.now()) - timedelta(days=float(value))).timestamp()
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def getSize(value):
+    value = (value or '').strip()
+    return int(value) if value else None
+
+
+def getOptions(values):
+    """Returns the discovery Options of the <AddRaster> (values) {key: value}. Raises ValueError on invalid values."""
+    workers = (values.get(KeyWorkers) or '').strip()
+    regex = (values.get(KeyRegex) or '').strip()
+    return Options(
+        workers=max(1, int(workers)) if workers else DefWorkers,
+        regex=re.compile(regex, re.IGNORECASE) if regex else None,
+        newer_than=getTime(values.get(KeyNewerThan)),
+        older_than=getTime(values.get(KeyOlderThan)),
+        min_size=getSize(values.get(KeyMinSize)),
+        max_size=getSize(values.get(KeyMaxSize)))
+
+
+def isMatch(name, stat, patterns, options):
+    if (patterns and
+            not [p for p in patterns if fnmatch(name.lower(), p)]):
+        return False
+    if (options.regex and
+            not options.regex.search(name)):
+        return False
+    if ((options.min_size is not None and stat.st_size < options.min_size) or
+            (options.max_size is not None and stat.st_size > options.max_size) or
+            (options.newer_than is not None and stat.st_mtime < options.newer_than) or
+            (options.older_than is not None and stat.st_mtime > options.older_than)):
+        return False
+    return True
+
+
+def _scan(folder, patterns, options):
+    """Returns ([(path, size, mtime)] of the matching files, [sub folders], error) of a single (folder)"""
+    files = []
+    folders = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                    continue
+                stat = entry.stat()
+                if isMatch(entry.name, stat, patterns, options):
+                    files.append((entry.path, stat.st_size, stat.st_mtime))
+    except OSError as e:
+        return (files, folders, e)
+    return (files, folders, None)
+
+
+def walk(roots, patterns=None, recursive=True, options=None, errors=None):
+    """Yields the (path, size, mtime) of the matching files under the (roots) folders as they are found.
+    Each folder is listed by a pool thread. The folders that can't be listed are appended to (errors) as (folder, error)"""
+    options = options or getOptions({})
+    with ThreadPoolExecutor(max_workers=options.workers) as pool:
+        pending = {pool.submit(_scan, root, patterns, options): root for root in roots}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder = pending.pop(future)
+                (files, folders, error) = future.result()
+                if (error is not None and
+                        errors is not None):
+                    errors.append((folder, error))
+                if recursive:
+                    for subFolder in folders:
+                        pending[pool.submit(_scan, subFolder, patterns, options)] = subFolder
+                for file in files:
+                    yield file
+
+
+def discover(dataPaths, fileFilter, recursive=True, options=None, errors=None):
+    """Returns (generator of the (path, size, mtime) of the files of (dataPaths), [entries that can't be listed])
+    (dataPaths) is the (;) separated (data_path) value of an <AddRaster> node, (fileFilter) the wildcard(s) of its <filter>"""
+    options = options or getOptions({})
+    patterns = [p.strip().lower() for p in (fileFilter or '').split(';') if p.strip()]
+    folders = []
+    files = []
+    others = []
+    for path in [p.strip() for p in dataPaths.split(';') if p.strip()]:
+        if os.path.isdir(path):
+            folders.append(path)
+        elif os.path.isfile(path):
+            stat = os.stat(path)
+            files.append((path, stat.st_size, stat.st_mtime))
+        else:
+            others.append(path)     # i.e. cloud/(.acs), URLs, tables
+
+    def generate():
+        for file in files:
+            yield file
+        if folders:
+            for file in walk(folders, patterns, recursive, options, errors):
+                yield file
+    return (generate(), others)
+
+
+def writeTable(paths, folder=None, prefix='mdcs_sources_'):
+    """Streams (paths) into a new (.csv) file list table for the (Table) raster type. Returns (table path, row count)"""
+    (handle, path) = tempfile.mkstemp(suffix='.csv', prefix=prefix, dir=folder)
+    count = 0
+    with os.fdopen(handle, 'w', newline='', encoding='utf-8') as writer:
+        table = csv.writer(writer)
+        table.writerow([TableField])
+        for value in paths:
+            table.writerow([value])
+            count += 1
+    return (path, count)
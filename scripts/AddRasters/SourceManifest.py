@@ -0,0 +1,130 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: SourceManifest.py
+# Description: Per mosaic dataset (SQLite) record of the source files already added, to pass only new/changed files to (AR).
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import sqlite3
+import hashlib
+from datetime import datetime
+
+# <source_manifest> values of an <AddRaster> node.
+ModeSizeMTime = 'size_mtime'        # a file is changed if its size or modification time differs.
+ModeContentHash = 'content_hash'    # files with a different size/mtime are hashed, only changed content is re-added.
+CEXT = '.manifest.sqlite'
+CHASH_BLOCK = 1024 * 1024
+
+
+def getMode(value):
+    """Returns the manifest mode of the <source_manifest> (value) or None if disabled."""
+    value = (value or '').strip().lower()
+    if value in (ModeSizeMTime, ModeContentHash):
+        return value
+    return None
+
+
+def getPath(geoPath, mdName):
+    """Returns the manifest path, next to the geodatabase/(.sde) connection file, i.e. c:/data/Amberg.Amberg1.manifest.sqlite"""
+    geoPath = os.path.normpath(geoPath)
+    name = os.path.splitext(os.path.basename(geoPath))[0]
+    return os.path.join(os.path.dirname(geoPath), '{}.{}{}'.format(name, mdName, CEXT))
+
+
+def getPathKey(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def getFileHash(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as reader:
+        for block in iter(lambda: reader.read(CHASH_BLOCK), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+class SourceManifest(object):
+
+    def __init__(self, path, mode=ModeSizeMTime):
+        self.path = path
+        self.mode = mode
+        self.m_pending = []     # rows of the files passed to the last (AR) call, written by (commit)
+        self.m_touched = []     # rows of the (content_hash) matched files, size/mtime only changed.
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=60)
+        conn.execute('CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, size INTEGER NOT NULL, '
+                     'mtime REAL NOT NULL, hash TEXT, dataset_id TEXT, added TEXT)')
+        return conn
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        conn = self._connect()
+        try:
+            return {r[0]: r[1:] for r in conn.execute('SELECT path, size, mtime, hash FROM sources')}
+        finally:
+            conn.close()
+
+    def filter(self, files, datasetID=None):
+        """Yields the paths of (files) [(path, size, mtime)] not in the manifest or changed since they were added."""
+        known = self._read()
+        self.m_pending = []
+        self.m_touched = []
+        for path, size, mtime in files:
+            key = getPathKey(path)
+            record = known.get(key)
+            if (record is not None and
+                    record[0] == size and
+                    record[1] == mtime):
+                continue
+            digest = None
+            if self.mode == ModeContentHash:
+                digest = getFileHash(path)
+                if (record is not None and
+                        record[2] == digest):
+                    self.m_touched.append((key, size, mtime, digest, datasetID))
+                    continue
+            self.m_pending.append((key, size, mtime, digest, datasetID))
+            yield path
+
+    def commit(self, paths=None):
+        """Records the files passed to the last (AR) call as added, only those of (paths) if given, i.e. the sources of an (AR) chunk.
+        Returns the number of files recorded."""
+        rows = self.m_pending
+        if paths is not None:
+            keys = set([getPathKey(p) for p in paths])
+            rows = [r for r in self.m_pending if r[0] in keys]
+            self.m_pending = [r for r in self.m_pending if r[0] not in keys]
+        else:
+            self.m_pending = []
+        rows += self.m_touched
+        self.m_touched = []
+        if not rows:
+            return 0
+        added = datetime.now().isoformat()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany('INSERT OR REPLACE INTO sources (path, size, mtime, hash, dataset_id, added) VALUES (?, ?, ?, ?, ?, ?)',
+                                 [r + (added,) for r in rows])
+        finally:
+            conn.close()
+        return len(rows)
+    # ends
@@ -21,8 +21,10 @@
 #!/usr/bin/env python
 
 import os
+import re
 import sys
-import arcpy
+import functools
+import importlib
 try:
     if (sys.version_info[0] < 3):           # _winreg has been renamed as (winreg) in python3+
         from _winreg import *
@@ -33,19 +35,48 @@ except ImportError as e:
 from datetime import datetime
 from defusedxml import minidom
 from inspect import signature
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SolutionsLog'))
+import tracer
+import ConfigModel
+import DOMTracker
+import Planner
+import LazyImport
+arcpy = LazyImport.lazyImport('arcpy')     # imported on the first use, runs using only user functions don't pay for it.
 mdcs_uc_error = None
-try:
-    import MDCS_UC
-    from importlib import reload
-    MDCS_UC = reload(MDCS_UC)  # ArcGIS Pro PYT EVN requires a reload to clear previous instances.
-except Exception as e:
-    mdcs_uc_error = e
-    print(f'User-Code functions disabled.\n{e}')
-try:
-    from arcpy.ia import *
-    arcpy.CheckOutExtension("ImageAnalyst")
-except BaseException:
-    print('arcpy.ia is not available.')
+g_userCode = None
+
+
+def getUserCode():
+    """Returns the user code module (MDCS_UC), imported on the first call. Reloaded on every call under the dev flag."""
+    global g_userCode, mdcs_uc_error
+    if (g_userCode is not None and
+            not LazyImport.isDevReload()):
+        return g_userCode
+    try:
+        import MDCS_UC
+        g_userCode = LazyImport.reloadModule(MDCS_UC)  # ArcGIS Pro PYT EVN requires a reload to clear previous instances.
+        mdcs_uc_error = None
+    except Exception as e:
+        mdcs_uc_error = e
+        print(f'User-Code functions disabled.\n{e}')
+        return None
+    return g_userCode
+
+
+@functools.lru_cache(maxsize=1)
+def loadImageAnalyst():
+    """Imports (arcpy.ia) and checks out the ImageAnalyst extension, once per process on the first GP run."""
+    try:
+        importlib.import_module('arcpy.ia')
+        arcpy.CheckOutExtension("ImageAnalyst")
+        return True
+    except BaseException:
+        print('arcpy.ia is not available.')
+    return False
+
+# (\$) is a literal $ unless a variable follows it, i.e. C:\data\$xyz$ is C:\data\ followed by $xyz$
+DynamicVarToken = re.compile(r'\\\$(?![^$\\\s]+\$)|\$([^$\\\s]+)\$')
+DynamicDefaultSeparator = re.compile(r'(?<!\\);')
 
 def log_gptool_result(logger_method, log_level, result):
     """
@@ -65,6 +96,24 @@ def log_gptool_result(logger_method, log_level, result):
         logger_method(f"GPTool resultID: {result.resultID}", log_level)
     else:
         logger_method("GPTool did not return a result object.", log_level)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolveTool(name):
+    nspce = name.split(".")
+    cls = nspce.pop()
+    fnc_ptr = getattr(importlib.import_module(".".join(nspce)), cls)
+    return (fnc_ptr, tuple(signature(fnc_ptr).parameters))
+
+
+def resolveTool(name):
+    """Returns the (function, parameter names) of a dotted tool name e.g. arcpy.ia.GenerateTrendRaster. Cached per process."""
+    return _resolveTool(name.strip())
+
+
+def getToolCacheInfo():
+    return _resolveTool.cache_info()
+
 class DynaInvoke:
     # log status types enums
     const_general_text = 0
@@ -95,10 +144,8 @@ class DynaInvoke:
                         self._sArgs = self._sArgs[0]        # handles only 1 sub method on the parent object for now.
                         # sub args to use in a method of the main function object. e.g. X = a->fn1(args) X->fn2(sargs)
         try:
-            nspce = self.m_name.split(".")
-            cls = nspce.pop()
-            self.fnc_ptr = getattr(sys.modules[".".join(nspce)], cls)
-            arg_count = len(signature(self.fnc_ptr).parameters)
+            self.fnc_ptr, params = resolveTool(self.m_name)
+            arg_count = len(params)
         except Exception as exp:
             self._message(str(exp), self.const_critical_text)
             return False
@@ -117,6 +164,12 @@ class DynaInvoke:
         try:
             if self.fnc_ptr is None:
                 raise Exception(f'{self.__class__.__name__}/Not initialized.')
+            if Planner.isActive():
+                Planner.record(self.m_name, list(self.m_args), params=resolveTool(self.m_name)[1])
+                if (self._sArgs):
+                    Planner.record('{}.{}'.format(self.m_name, self._sArgs[0]), list(self._sArgs[1:]))
+                result = 'Planned'
+                return True
             if (self.m_evnt_update_args is not None):
                 usr_args = self.m_evnt_update_args(self.m_args, self.m_name)
                 if (usr_args is None):      # set to (None) to skip fnc invocation, it's treated as a non-error.
@@ -126,12 +179,13 @@ class DynaInvoke:
                     ##                    self._message('Original args may have been updated through custom code.', self.const_warning_text)
                     self.m_args = usr_args
             self._message('Calling (%s)' % (self.m_name), self.const_general_text)
-            ret = self.fnc_ptr(*self.m_args)    # gp-tools return NULL?
-            if (self._sArgs):
-                fn = self._sArgs.pop(0)
-                if (hasattr(ret, fn)):
-                    self.fnc_ptr = getattr(ret, fn)
-                    ret = self.fnc_ptr(*self._sArgs)
+            with tracer.span(self.m_name, 'gptool', {'args': self.m_args}):
+                ret = self.fnc_ptr(*self.m_args)    # gp-tools return NULL?
+                if (self._sArgs):
+                    fn = self._sArgs.pop(0)
+                    if (hasattr(ret, fn)):
+                        self.fnc_ptr = getattr(ret, fn)
+                        ret = self.fnc_ptr(*self._sArgs)
             log_gptool_result(self._message, self.const_general_text, ret)
             return True
         except Exception as exp:
@@ -158,6 +212,7 @@ class Base(object):
     const_init_ret_version = 'version'
     const_init_ret_sde = 'sde'
     const_init_ret_patch = 'patch'
+    const_init_ret_md_index = 'md_index'
     # ends
 
     # version specific
@@ -182,6 +237,7 @@ class Base(object):
     # ends
 
     NODE_TYPE_TEXT = 3
+    NODE_TYPE_CDATA = 4
     NODE_TYPE_ELEMENT = 1
 
     EVT_ON_START = "_OnStart"
@@ -217,6 +273,8 @@ class Base(object):
 
         # To keep track of the last objectID before any new data items could be added.
         self.m_last_AT_ObjectID = 0  # by default, take in all the previous records for any operation.
+        self.m_resume = False   # skip commands that completed in the previous (journaled) run.
+        self.m_mdIndex = None   # the <MosaicDataset> to use of a config defining many.
 
         # SDE specific variables
         self.m_IsSDE = False
@@ -243,8 +301,7 @@ class Base(object):
             'base': self    # pass in the base object to allow access to common functions.
         }
         try:
-            frame = sys._getframe(0).f_globals
-            module = frame[self.CMODULE_NAME]
+            module = getUserCode()
             self.m_userClassInstance = getattr(module, self.CCLASS_NAME)(self.m_data)
         except BaseException:
             error_msg = '{}/{} not found. Users commands disabled!'.format(self.CMODULE_NAME, self.CCLASS_NAME)
@@ -252,6 +309,11 @@ class Base(object):
             self.log(error_msg, self.const_warning_text)
         if (self.m_doc is None):
             return (True, 'UserCode only')
+        loadImageAnalyst()
+        if (self.m_mdIndex is not None and
+                not self.selectMosaicDataset(self.m_mdIndex)):
+            self.log('<MosaicDataset> at index ({}) is not found.'.format(self.m_mdIndex), self.const_critical_text)
+            return (False, self.const_init_ret_md_index)
         # version check.
         try:
             # Update in memory parameter DOM to reflect {-m} user values
@@ -280,12 +342,13 @@ class Base(object):
             return (False, self.const_init_ret_patch)
         # ends
         self.setUserDefinedValues()  # replace user defined dynamic variables in config file with values provided at the command-line.
+        model = self.getConfigModel()
         if (self.m_workspace == ''):
-            self.m_workspace = self.prefixFolderPath(self.getAbsPath(self.getXMLNodeValue(self.m_doc, "WorkspacePath")), self.const_workspace_path_)
+            self.m_workspace = self.prefixFolderPath(self.getAbsPath(model.workspace_path or ''), self.const_workspace_path_)
         if (self.m_geodatabase == ''):
-            self.m_geodatabase = self.getXMLNodeValue(self.m_doc, "Geodatabase")
+            self.m_geodatabase = model.geodatabase or ''
         if (self.m_mdName == ''):
-            self.m_mdName = self.getXMLXPathValue("Application/Workspace/MosaicDataset/Name", "Name")
+            self.m_mdName = model.md.name if model.md else ''
         const_len_ext = len(self.const_geodatabase_ext)
         ext = self.m_geodatabase[-const_len_ext:].upper()
         if (ext != self.const_geodatabase_ext and
@@ -293,7 +356,7 @@ class Base(object):
             self.m_geodatabase += self.const_geodatabase_ext.lower()  # if no extension specified, defaults to '.gdb'
         self.m_gdbName = self.m_geodatabase[:len(self.m_geodatabase) - const_len_ext]  # .gdb
         self.m_geoPath = os.path.join(self.m_workspace, self.m_geodatabase)
-        self.m_commands = self.getXMLNodeValue(self.m_doc, "Command")
+        self.m_commands = model.command or ''
         if (ext == self.const_geodatabase_SDE_ext):
             self.m_IsSDE = True
             try:
@@ -342,44 +405,100 @@ class Base(object):
 
         return self.m_code_base
 
+    def getDOMTracker(self):
+        """Returns the DOMTracker.Tracker recording the mutations of (m_doc) or None if there's no config."""
+        return DOMTracker.track(self.m_doc)
+
+    def getXPathIndex(self):
+        """Returns {path: [element nodes in document order]} of (m_doc). Rebuilt only after elements are added/removed/moved."""
+        index = getattr(self, '_xpath_index', None)
+        tracker = self.getDOMTracker()
+        version = tracker.structure_version if tracker else 0
+        if (index is not None and
+                getattr(self, '_xpath_doc', None) is self.m_doc and
+                self._xpath_version == version):
+            return index
+        index = {}
+        root = self.m_doc.documentElement if self.m_doc is not None else None
+        if root is not None:
+            stack = [(root, root.nodeName)]
+            while stack:
+                node, path = stack.pop()
+                index.setdefault(path, []).append(node)
+                stack.extend([(c, '{}/{}'.format(path, c.nodeName)) for c in reversed(node.childNodes)
+                              if c.nodeType == self.NODE_TYPE_ELEMENT])
+        self._xpath_doc = self.m_doc
+        self._xpath_version = version
+        self._xpath_index = index
+        return index
+
+    def invalidateXPathIndex(self):
+        """To be called if elements of (m_doc) are added/removed without the DOM methods, i.e. by editing (childNodes)."""
+        self._xpath_index = None
+        self._config_model = None
+        tracker = self.getDOMTracker()
+        if tracker:
+            tracker.mark((), True)      # the root path marks the whole document as changed.
+
+    def getConfigModel(self):
+        """Returns the ConfigModel of (m_doc), parsed again only after the DOM is mutated."""
+        model = getattr(self, '_config_model', None)
+        tracker = self.getDOMTracker()
+        version = tracker.version if tracker else 0
+        if (model is not None and
+                getattr(self, '_config_model_doc', None) is self.m_doc and
+                self._config_model_version == version):
+            return model
+        model = ConfigModel.ConfigModel.fromDoc(self.m_doc)
+        self._config_model_doc = self.m_doc
+        self._config_model_version = version
+        self._config_model = model
+        return model
+
+    def invalidateConfigModel(self):
+        """To be called if node values of (m_doc) are edited without the DOM methods."""
+        self._config_model = None
+        tracker = self.getDOMTracker()
+        if tracker:
+            tracker.mark(())
+
+    def selectMosaicDataset(self, index):
+        """Removes all but the (index) <MosaicDataset> from (m_doc) of a config defining many. Returns [True|False]"""
+        nodes = ConfigModel.getMosaicDatasetNodes(self.m_doc)
+        if (index < 0 or
+                index >= len(nodes)):
+            return False
+        for i, node in enumerate(nodes):
+            if i != index:
+                node.parentNode.removeChild(node)
+        return True
+
+    def getXPathNodes(self, xPath, key):
+        if xPath.split('/')[-1] != key:
+            return []
+        return self.getXPathIndex().get(xPath, [])
+
     def setXMLNodeValue(self, xPath, key, value, subKey, subValue):
-        nodes = self.m_doc.getElementsByTagName(key)
-        for node in nodes:
-            parents = []
-            c = node
-            while(c.parentNode is not None):
-                parents.insert(0, c.nodeName)
-                c = c.parentNode
-            p = '/'.join(parents)
-            if (p == xPath):
-                if (subKey != ''):
-                    try:
-                        if (node.firstChild.nodeValue == value):  # taking a short-cut to edit/this could change in future to support any child-node lookup
-                            if (node.nextSibling.nextSibling.nodeName == subKey):
-                                node.nextSibling.nextSibling.firstChild.data = subValue
-                            break
-                    except BaseException:
+        for node in self.getXPathNodes(xPath, key):
+            if (subKey != ''):
+                try:
+                    if (node.firstChild.nodeValue == value):  # taking a short-cut to edit/this could change in future to support any child-node lookup
+                        if (node.nextSibling.nextSibling.nodeName == subKey):
+                            node.nextSibling.nextSibling.firstChild.data = subValue
                         break
-                    continue
-                node.firstChild.data = value
-                break
+                except BaseException:
+                    break
+                continue
+            node.firstChild.data = value
+            break
 
     def getXMLXPathValue(self, xPath, key):
-
-        nodes = self.m_doc.getElementsByTagName(key)
-        for node in nodes:
-            parents = []
-            c = node
-            while(c.parentNode is not None):
-                parents.insert(0, c.nodeName)
-                c = c.parentNode
-            p = '/'.join(parents)
-            if (p == xPath):
-                if (node.hasChildNodes() == False):
-                    return ''
-                return str(node.firstChild.data).strip()
-
-        return ''
+        nodes = self.getXPathNodes(xPath, key)
+        if not nodes:
+            return ''
+        if (nodes[0].hasChildNodes() == False):
+            return ''
+        return str(nodes[0].firstChild.data).strip()
 
     def setLog(self, log):
         self.m_log = log
@@ -433,33 +552,6 @@ class Base(object):
         return ret
     # ends
 
-    def processEnv(self, node, pos, json):  # support fnc for 'SE' command.
-
-        while(node.nextSibling is not None):
-            if(node.nodeType != Base.NODE_TYPE_TEXT):
-
-                k = str(pos)
-                if ((k in json.keys()) == False):
-                    json[k] = {'key': [], 'val': [], 'type': []}
-
-                json[k]['key'].append(node.nodeName)
-                v = ''
-                if (node.firstChild is not None):
-                    v = node.firstChild.nodeValue.strip()
-                json[k]['val'].append(v)
-                json[k]['parent'] = node.parentNode.nodeName
-                json[k]['type'].append('c')
-
-                if (node.firstChild is not None):
-                    if (node.firstChild.nextSibling is not None):
-                        pos = len(json)
-                        json[k]['type'][len(json[k]['type']) - 1] = 'p'
-                        self.processEnv(node.firstChild.nextSibling, pos, json)
-                        pos = 0     # defaults to root always, assuming only 1 level deep xml.
-            node = node.nextSibling
-
-        return True
-
     def getAbsPath(self, input):
         absPath = input
         if (os.path.exists(absPath)):
@@ -738,49 +830,52 @@ class Base(object):
         else:
             return ''
 
-    def setUserDefinedValues(self):
+    def resolveDynamicValue(self, value, unresolved=None):
+        """Returns (value) with its $var$ tokens replaced by (m_dynamic_params). i.e. $var$, default;$var$, a$var$b, \\$ for a literal $
+        Variables not set are added to (unresolved) {name: default}. Unset variables resolve to the default if they're the whole value,
+        to their name otherwise."""
+        value = value.strip()
+        default = ''
+        parts = DynamicDefaultSeparator.split(value, 1)
+        if len(parts) > 1:
+            default = parts[0].strip().replace('\\;', ';')
+            value = parts[1].strip().replace('\\;', ';')
+        isWhole = DynamicVarToken.fullmatch(value) is not None
+
+        def substitute(token):
+            name = token.group(1)
+            if name is None:
+                return '$'  # escaped \$
+            resolved = self.m_dynamic_params.get(name.upper())
+            if resolved is not None:
+                return resolved
+            if unresolved is not None:
+                unresolved.setdefault(name, default)
+            return default if (isWhole and default) else name
+        return DynamicVarToken.sub(substitute, value)
 
-        nodes = self.m_doc.getElementsByTagName('*')
-        for node in nodes:
-            if node.firstChild is not None:
-                v = node.firstChild.data.strip()
-                if v.find('$') == -1:
-                    continue
-                usr_key = v
-                default = ''
-                d = self.get_split_values(v, ';')
-                if len(d) > 1:
-                    default = d[0].strip()
-                    usr_key = d[1].strip()
-                revalue = []
-                first = usr_key.find('$')
-                first += 1
-                second = first + usr_key[first + 1:].find('$') + 1
-                if first > 1:
-                    revalue.append(usr_key[0:first - 1])
-                while second >= 0:
-                    uValue = usr_key[first:second]
-                    if uValue.upper() in self.m_dynamic_params.keys():
-                        revalue.append(self.m_dynamic_params[uValue.upper()])
-                    else:
-                        if uValue.find(r'\$') >= 0:
-                            uValue = uValue.replace(r'\$', '$')
-                        else:
-                            if default == '':
-                                default = uValue
-                            if (first == 1
-                                    and second == (len(usr_key) - 1)):
-                                uValue = default
-                        revalue.append(uValue)
-                    first = second + 1
-                    indx = usr_key[first + 1:].find('$')
-                    if indx == -1:
-                        if first != len(usr_key):
-                            revalue.append(usr_key[first:len(usr_key)])
-                        break
-                    second = first + indx + 1
-                updateVal = ''.join(revalue)
-                node.firstChild.data = updateVal
+    def setUserDefinedValues(self):
+        """Replaces the $var$ tokens of all text nodes in (m_doc) in a single pass. Returns {unresolved name: default}"""
+        unresolved = {}
+        if (self.m_doc is None or
+                self.m_doc.documentElement is None):
+            return unresolved
+        stack = [self.m_doc.documentElement]
+        while stack:
+            node = stack.pop()
+            for child in node.childNodes:
+                if child.nodeType == self.NODE_TYPE_ELEMENT:
+                    stack.append(child)
+                elif (child.nodeType in (self.NODE_TYPE_TEXT, self.NODE_TYPE_CDATA) and
+                        '$' in child.data):
+                    child.data = self.resolveDynamicValue(child.data, unresolved)
+        defaults = ['{}={}'.format(k, v) for k, v in unresolved.items() if v]
+        if defaults:
+            self.log('Dynamic variable(s) not set, using defaults ({})'.format(', '.join(defaults)), self.const_general_text)
+        missing = [k for k, v in unresolved.items() if not v]
+        if missing:
+            self.log('Dynamic variable(s) not set and without defaults ({})'.format(', '.join(missing)), self.const_warning_text)
+        return unresolved
 
     def getXMLNode(self, doc, nodeName, index=0):
         if (doc is None):
@@ -0,0 +1,239 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: ConfigModel.py
+# Description: Read-only model of an MDCS config built in a single pass over the DOM, shared by all components.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+from types import MappingProxyType
+
+ELEMENT_NODE = 1
+# process nodes holding a list of child entries, i.e. <CalculateValues><CalculateValue>..
+ProcessGroups = {
+    'addindex': 'index',
+    'calculatevalues': 'calculatevalue'
+}
+
+
+def getElements(node):
+    return [c for c in node.childNodes if c.nodeType == ELEMENT_NODE]
+
+
+def getValue(node, default=None):
+    """Returns the (firstChild) value of an element or (default) if it's empty."""
+    if node.firstChild is None:
+        return default
+    return node.firstChild.nodeValue
+
+
+class Frozen(object):
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for key in self.__slots__:
+            object.__setattr__(self, key, kwargs.get(key))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{} is read-only.'.format(self.__class__.__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError('{} is read-only.'.format(self.__class__.__name__))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, ', '.join(['{}={!r}'.format(k, getattr(self, k)) for k in self.__slots__]))
+
+
+class Field(Frozen):
+    __slots__ = ('name', 'type', 'length')
+
+
+class AddRaster(Frozen):
+    # values: {lower-case node name: value}, data_paths: the <Sources/data_path> values or None if there's no <Sources>
+    __slots__ = ('values', 'data_paths')
+
+
+class EnvironmentSetting(Frozen):
+    # children: ((name, value),) of a grouped setting e.g. <pyramid>
+    __slots__ = ('name', 'value', 'children')
+
+
+class MosaicDatasetModel(Frozen):
+    # values: {node name: value} of the leaf nodes e.g. Name, SRS, MosaicDatasetType
+    # processes: {lower-case process name: ({lower-case key: value},)}, entries of (ProcessGroups) are tuples of dicts.
+    __slots__ = ('values', 'add_rasters', 'processes', 'default_properties', 'fields', 'reference', 'function_paths',
+                 'environment')
+
+    @property
+    def name(self):
+        return (self.values.get('Name') or '').strip()
+
+    @property
+    def type(self):
+        return self.values.get('MosaicDatasetType') or ''
+
+    @classmethod
+    def fromNode(cls, node):
+        values = {}
+        addRasters = []
+        processes = {}
+        defaultProperties = []
+        fields = None
+        reference = {}
+        functionPaths = []
+        environment = []
+        for child in getElements(node):
+            name = child.nodeName
+            if name == 'AddRasters':
+                addRasters.extend([cls._getAddRaster(c) for c in getElements(child) if c.nodeName.lower() == 'addraster'])
+            elif name == 'Processes':
+                for process in getElements(child):
+                    processName = process.nodeName.lower()
+                    processes.setdefault(processName, []).append(cls.getProcess(processName, process))
+                    if processName == 'environment':
+                        environment.append(cls._getEnvironment(process))
+            elif name == 'DefaultProperties':
+                defaultProperties.extend([(c.nodeName, getValue(c) or '') for c in getElements(child)])
+            elif name in ('Fields', 'Table'):
+                fieldsNode = child if name == 'Fields' else next(iter([c for c in getElements(child) if c.nodeName == 'Fields']), None)
+                if (fieldsNode is not None and
+                        fields is None):
+                    fields = cls._getFields(fieldsNode)
+            elif name == 'CreateReferencedMosaicDataset':
+                for c in getElements(child):
+                    if c.childNodes.length > 0:
+                        reference.setdefault(c.nodeName.lower(), getValue(c))
+            elif name == 'Functions':
+                functionPaths.extend([getValue(c).strip() for c in getElements(child)
+                                      if c.nodeName == 'function_path' and c.childNodes.length > 0])
+            else:
+                values.setdefault(name, getValue(child))
+        return cls(
+            values=MappingProxyType(values),
+            add_rasters=tuple(addRasters),
+            processes=MappingProxyType({k: tuple(v) for k, v in processes.items()}),
+            default_properties=tuple(defaultProperties),
+            fields=fields,
+            reference=MappingProxyType(reference),
+            function_paths=tuple(functionPaths),
+            environment=tuple(environment)
+        )
+
+    @staticmethod
+    def _getAddRaster(node):
+        values = {}
+        dataPaths = None
+        for c in getElements(node):
+            name = c.nodeName.lower()
+            if name == 'sources':
+                dataPaths = tuple([getValue(d).strip() for d in getElements(c)
+                                   if d.nodeName.lower() == 'data_path' and d.childNodes.length > 0])
+                continue
+            values[name] = getValue(c) or ''
+        return AddRaster(values=MappingProxyType(values), data_paths=dataPaths)
+
+    @classmethod
+    def getProcesses(cls, node, keys):
+        """Returns {lower-case process name: [entries]} of the (keys) processes of the <MosaicDataset> (node)."""
+        processes = {}
+        for child in getElements(node):
+            if child.nodeName != 'Processes':
+                continue
+            for process in getElements(child):
+                processName = process.nodeName.lower()
+                if processName in keys:
+                    processes.setdefault(processName, []).append(cls.getProcess(processName, process))
+        return processes
+
+    @staticmethod
+    def getProcess(processName, node):
+        if processName in ProcessGroups:
+            entries = []
+            for c in getElements(node):
+                if c.nodeName.lower() != ProcessGroups[processName]:
+                    continue
+                entries.append(MappingProxyType({k.nodeName.lower(): getValue(k, '#') for k in getElements(c)}))
+            return tuple(entries)
+        return MappingProxyType({c.nodeName.lower(): getValue(c, '#') for c in getElements(node)})
+
+    @staticmethod
+    def _getEnvironment(node):
+        settings = []
+        for c in getElements(node):
+            children = tuple([(k.nodeName, (getValue(k) or '').strip()) for k in getElements(c)])
+            settings.append(EnvironmentSetting(name=c.nodeName, value=(getValue(c) or '').strip(), children=children))
+        return tuple(settings)
+
+    @staticmethod
+    def _getFields(node):
+        fields = []
+        for f in getElements(node):
+            info = {}
+            for n in getElements(f):
+                key = n.nodeName.upper()
+                if key in ('NAME', 'TYPE'):
+                    info[key.lower()] = getValue(n)
+                elif key == 'LENGTH':
+                    info['length'] = getValue(n) or ''
+            fields.append(Field(**info))
+        return tuple(fields)
+
+
+def getMosaicDatasetNodes(doc):
+    """Returns the <Application/Workspace/MosaicDataset> elements of (doc), a config may define more than one target."""
+    root = doc.documentElement if doc is not None else None
+    if root is None:
+        return []
+    nodes = []
+    for child in getElements(root):
+        if child.nodeName != 'Workspace':
+            continue
+        nodes.extend([node for node in getElements(child) if node.nodeName == 'MosaicDataset'])
+    return nodes
+
+
+def getMosaicDatasetNode(doc):
+    """Returns the first <Application/Workspace/MosaicDataset> element of (doc) or None."""
+    nodes = getMosaicDatasetNodes(doc)
+    return nodes[0] if nodes else None
+
+
+class ConfigModel(Frozen):
+    __slots__ = ('name', 'command', 'workspace_path', 'geodatabase', 'md')
+
+    @classmethod
+    def fromDoc(cls, doc):
+        """Returns the model of the (<Application>) DOM, (md) is None if there's no <Workspace/MosaicDataset> node."""
+        info = {}
+        root = doc.documentElement if doc is not None else None
+        if root is None:
+            return cls()
+        for child in getElements(root):
+            if child.nodeName == 'Name':
+                info.setdefault('name', getValue(child, ''))
+            elif child.nodeName == 'Command':
+                info.setdefault('command', getValue(child, ''))
+            elif child.nodeName == 'Workspace':
+                for node in getElements(child):
+                    if node.nodeName == 'WorkspacePath':
+                        info.setdefault('workspace_path', getValue(node, ''))
+                    elif node.nodeName == 'Geodatabase':
+                        info.setdefault('geodatabase', getValue(node, ''))
+                    elif (node.nodeName == 'MosaicDataset' and
+                            'md' not in info):
+                        info['md'] = MosaicDatasetModel.fromNode(node)
+        return cls(**info)
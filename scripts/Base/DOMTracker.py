@@ -0,0 +1,202 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: DOMTracker.py
+# Description: Records which element paths of a tracked (minidom) document were mutated.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import weakref
+from xml.dom import minidom as _minidom
+
+ELEMENT_NODE = 1
+DOCUMENT_NODE = 9
+_trackers = weakref.WeakKeyDictionary()    # document -> Tracker
+
+
+class Tracker(object):
+
+    def __init__(self):
+        self.version = 0                # bumped on every mutation.
+        self.structure_version = 0      # bumped only when elements are added/removed/moved.
+        self.m_changes = {}             # (element path) -> version of the last mutation.
+
+    def mark(self, path, structure=False):
+        self.version += 1
+        if structure:
+            self.structure_version += 1
+        self.m_changes[path] = self.version
+
+    def changedSince(self, version):
+        """Returns the element paths, i.e. ('Application', 'Workspace', ..) mutated after (version)."""
+        if version >= self.version:
+            return []
+        return [p for p, v in self.m_changes.items() if v > version]
+    # ends
+
+
+def track(doc):
+    """Returns the Tracker of (doc), starts tracking it on the first call. Only the nodes of (doc), including the ones
+    it creates later, get the tracked node types. Other minidom documents are left as is."""
+    if doc is None:
+        return None
+    tracker = _trackers.get(doc)
+    if tracker is None:
+        tracker = _trackers[doc] = Tracker()
+        _setTracked(doc)
+    return tracker
+
+
+def isAffected(paths, prefix):
+    """Returns True if any of (paths) is within (prefix) or is an ancestor of it."""
+    for path in paths:
+        n = min(len(path), len(prefix))
+        if path[:n] == prefix[:n]:
+            return True
+    return False
+
+
+def _getPath(node):
+    path = []
+    while node is not None:
+        if node.nodeType == DOCUMENT_NODE:
+            return tuple(reversed(path))
+        if node.nodeType == ELEMENT_NODE:
+            path.append(node.nodeName)
+        node = node.parentNode
+    return None     # detached, i.e. a subtree being built before it's appended.
+
+
+def _mark(node, child=None, structure=False):
+    doc = node if node.nodeType == DOCUMENT_NODE else node.ownerDocument
+    if doc is None:
+        return
+    tracker = _trackers.get(doc)
+    if tracker is None:
+        return
+    path = _getPath(node)
+    if path is None:
+        return
+    if (child is not None and
+            child.nodeType == ELEMENT_NODE):
+        path += (child.nodeName,)
+    tracker.mark(path, structure)
+
+
+class _ChildMutations(object):
+    """Child list mutators of the tracked document/element types."""
+    __slots__ = ()
+
+    def appendChild(self, node):
+        ret = super().appendChild(node)
+        _mark(self, node, True)
+        return ret
+
+    def insertBefore(self, newChild, refChild):
+        ret = super().insertBefore(newChild, refChild)
+        _mark(self, newChild, True)
+        return ret
+
+    def removeChild(self, oldChild):
+        ret = super().removeChild(oldChild)
+        _mark(self, oldChild, True)
+        return ret
+
+    def replaceChild(self, newChild, oldChild):
+        ret = super().replaceChild(newChild, oldChild)
+        _mark(self, oldChild, True)
+        return ret
+
+
+class TrackedDocument(_ChildMutations, _minidom.Document):
+    __slots__ = ()
+
+    def _create(self, node):
+        _setTracked(node)
+        return node
+
+    def createElement(self, tagName):
+        return self._create(super().createElement(tagName))
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        return self._create(super().createElementNS(namespaceURI, qualifiedName))
+
+    def createTextNode(self, data):
+        return self._create(super().createTextNode(data))
+
+    def createCDATASection(self, data):
+        return self._create(super().createCDATASection(data))
+
+    def createComment(self, data):
+        return self._create(super().createComment(data))
+
+
+class TrackedElement(_ChildMutations, _minidom.Element):
+    __slots__ = ()
+
+    def normalize(self):
+        super().normalize()
+        _mark(self)
+
+    def setAttribute(self, attname, value):
+        super().setAttribute(attname, value)
+        _mark(self)
+
+    def removeAttribute(self, name):
+        super().removeAttribute(name)
+        _mark(self)
+
+
+def _setData(self, data):
+    _minidom.CharacterData._set_data(self, data)
+    if self.parentNode is not None:
+        _mark(self.parentNode)
+
+
+class TrackedText(_minidom.Text):
+    __slots__ = ()
+    data = nodeValue = property(_minidom.CharacterData._get_data, _setData)
+
+
+class TrackedCDATASection(_minidom.CDATASection):
+    __slots__ = ()
+    data = nodeValue = property(_minidom.CharacterData._get_data, _setData)
+
+
+class TrackedComment(_minidom.Comment):
+    __slots__ = ()
+    data = nodeValue = property(_minidom.CharacterData._get_data, _setData)
+
+
+_trackedTypes = {
+    _minidom.Document: TrackedDocument,
+    _minidom.Element: TrackedElement,
+    _minidom.Text: TrackedText,
+    _minidom.CDATASection: TrackedCDATASection,
+    _minidom.Comment: TrackedComment
+}
+
+
+def _setTracked(node):
+    """Switches (node) and its subtree to the tracked node types."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        tracked = _trackedTypes.get(type(node))
+        if tracked is not None:
+            node.__class__ = tracked
+        stack.extend(node.childNodes)
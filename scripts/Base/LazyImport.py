@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: LazyImport.py
+# Description: On-demand module imports (arcpy) and the dev-only module reloads.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import os
+import sys
+import types
+import threading
+import importlib
+import importlib.util
+
+DevReloadEnv = 'MDCS_DEV_RELOAD'    # reload the MDCS modules on every run, i.e. to pick up code edits within the ArcGIS Pro PYT env.
+NoLoadAttrs = ('__spec__', '__class__')     # read by the (import) statement of a module already in (sys.modules)
+_lock = threading.RLock()
+_loading = set()    # id of the modules being imported, attribute reads by the import itself get the partial module.
+
+
+class LazyModule(types.ModuleType):
+    """Module not yet imported. The first attribute access runs the import, other threads wait until it completes."""
+
+    def __getattribute__(self, attr):
+        if attr in NoLoadAttrs:
+            return types.ModuleType.__getattribute__(self, attr)
+        with _lock:
+            if (type(self) is LazyModule and
+                    id(self) not in _loading):
+                _loading.add(id(self))
+                try:
+                    spec = types.ModuleType.__getattribute__(self, '__spec__')
+                    spec.loader.exec_module(self)
+                    self.__class__ = types.ModuleType   # only once the import is complete.
+                finally:
+                    _loading.discard(id(self))
+        return types.ModuleType.__getattribute__(self, attr)
+
+
+def lazyImport(name):
+    """Returns the module (name) without running it. Later (import name) statements get the same module."""
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError('No module named {}'.format(repr(name)), name=name)
+        module = importlib.util.module_from_spec(spec)
+        module.__class__ = LazyModule
+        sys.modules[name] = module
+    return module
+
+
+def isLoaded(module):
+    return type(module) is not LazyModule
+
+
+def load(module):
+    """Runs the deferred import of (module) now, i.e. in pool initializers to pay for it once per process."""
+    if not isLoaded(module):
+        module.__dict__
+    return module
+
+
+def isDevReload():
+    return os.environ.get(DevReloadEnv, '').lower() in ('1', 'true', 'yes')
+
+
+def setDevReload(enabled=True):
+    """Enables the dev reloads for this process and the pool workers it starts."""
+    if enabled:
+        os.environ[DevReloadEnv] = '1'
+    else:
+        os.environ.pop(DevReloadEnv, None)
+
+
+def reloadModule(module):
+    """Returns (module) reloaded if the dev flag is set, otherwise (module) as is."""
+    if not isDevReload():
+        return module
+    return importlib.reload(module)
@@ -0,0 +1,321 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: Planner.py
+# Description: Dry-run (-plan) support. Records the GP tool calls of a command chain instead of invoking arcpy.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import os
+import re
+import sys
+import types
+import functools
+import threading
+from contextlib import contextmanager
+from inspect import signature
+
+ArcpyModule = 'arcpy'
+# arcpy functions safe to call while planning, they don't write any data.
+PassThrough = {
+    'SpatialReference', 'Extent', 'Point', 'Array',
+    'GetMessages', 'GetMessage', 'GetMessageCount', 'AddMessage', 'AddWarning', 'AddError',
+    'CheckExtension', 'CheckOutExtension', 'CheckInExtension', 'ProductInfo', 'GetInstallInfo',
+    'ValidateTableName', 'ValidateFieldName', 'ParseFieldName'
+}
+# i.e. arcpy.AddRastersToMosaicDataset_management or arcpy.management.AddRastersToMosaicDataset
+GPToolPattern = re.compile(r'^arcpy\.(?:[A-Za-z0-9]+_[a-z0-9]+|(?!da\.|mp\.|env\.)[a-z]+\.[A-Z]\w*)$')
+# input files expected to exist before the build starts.
+InputFileExts = ('.art.xml', '.rft.xml', '.art', '.acs', '.dlpk', '.emd', '.lyrx', '.json')
+QueryArgs = ('where_clause', 'query', 'expression', 'where_clause_filter')
+
+g_plan = None
+g_lock = threading.Lock()
+
+
+class Result(object):
+    """Placeholder returned by the recorded calls. Iterates as empty, works as a context manager e.g. arcpy.da cursors."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return Result('{}.{}'.format(self._name, name))
+
+    def __call__(self, *args, **kwargs):
+        return Result(self._name)
+
+    def __getitem__(self, key):
+        return Result(self._name)
+
+    def __iter__(self):
+        return iter(())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def __bool__(self):
+        return True
+
+    def __len__(self):
+        return 0
+
+    def __index__(self):
+        return 0
+
+    def __str__(self):
+        return '<{}>'.format(self._name)
+    __repr__ = __str__
+
+
+class Call(object):
+
+    def __init__(self, name, fnc):
+        self._name = name
+        self._fnc = fnc
+
+    def __call__(self, *args, **kwargs):
+        record(self._name, list(args), kwargs, getParamNames(self._fnc))
+        return Result(self._name)
+
+
+class ModuleProxy(object):
+    """Stands in for the (arcpy) module global of the MDCS modules while planning."""
+
+    def __init__(self, module, path):
+        object.__setattr__(self, '_module', module)
+        object.__setattr__(self, '_path', path)
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if name == 'Exists':
+            return functools.partial(exists, value)
+        if isinstance(value, types.ModuleType):
+            return ModuleProxy(value, '{}.{}'.format(self._path, name))
+        if (name in PassThrough or
+                name.startswith('_') or
+                not callable(value) or
+                (isinstance(value, type) and issubclass(value, BaseException))):   # i.e. except arcpy.ExecuteError
+            return value
+        return Call('{}.{}'.format(self._path, name), value)
+
+    def __setattr__(self, name, value):
+        setattr(self._module, name, value)
+
+
+class Plan(object):
+
+    def __init__(self, estimates=None):
+        self.estimates = estimates or {}    # {(cat, name): mean seconds}, see tracer.readDurations
+        self.commands = []
+        self.step = None
+        self.m_command = None
+        self.m_patched = {}     # module -> original (arcpy)
+        self.m_outputs = set()  # paths passed to the planned GP tools, taken as existing by later commands.
+
+    def patch(self):
+        """Swaps the (arcpy) global of the loaded MDCS modules, modules (re)loaded since the last call included."""
+        arcpy = sys.modules.get(ArcpyModule)
+        if arcpy is None:
+            return
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for module in list(sys.modules.values()):
+            if (getattr(module, ArcpyModule, None) is not arcpy or
+                    not os.path.abspath(getattr(module, '__file__', None) or '').startswith(root)):
+                continue
+            self.m_patched[module] = arcpy
+            setattr(module, ArcpyModule, ModuleProxy(arcpy, ArcpyModule))
+
+    def restore(self):
+        for module, arcpy in self.m_patched.items():
+            setattr(module, ArcpyModule, arcpy)
+        self.m_patched = {}
+
+    def getEstimate(self, cat, name):
+        return self.estimates.get((cat, name))
+
+    def record(self, name, args, kwargs=None, params=None):
+        if self.m_command is None:
+            return
+        call = {'tool': name, 'gptool': GPToolPattern.match(name) is not None}
+        if params:
+            call['args'] = dict(zip(params, args))
+            call['args'].update(kwargs or {})
+            if len(args) > len(params):
+                call['extra_args'] = args[len(params):]
+        else:
+            call['args'] = args
+            if kwargs:
+                call['kwargs'] = kwargs
+        estimate = self.getEstimate('gptool', name)
+        if estimate is not None:
+            call['estimate_s'] = estimate
+        warnings = getWarnings(call['args'] if isinstance(call['args'], dict) else dict(enumerate(call['args'])))
+        if warnings:
+            call['warnings'] = warnings
+        self.m_command['calls'].append(call)
+        if call['gptool']:
+            values = [v for v in (call['args'].values() if params else args) if isinstance(v, str) and v]
+            self.m_outputs.update([getPathKey(v) for v in values])
+            if (len(values) > 1 and
+                    '.Create' in name):     # i.e. CreateMosaicDataset(in_workspace, in_mosaicdataset_name)
+                self.m_outputs.add(getPathKey(os.path.join(values[0], values[1])))
+
+    def isPlanned(self, path):
+        return getPathKey(path) in self.m_outputs
+
+    def report(self):
+        total = 0
+        warnings = 0
+        for command in self.commands:
+            if command.get('estimate_s') is None:
+                tools = [c['estimate_s'] for c in command['calls'] if 'estimate_s' in c]
+                if tools:
+                    command['estimate_s'] = sum(tools)
+            total += command.get('estimate_s') or 0
+            warnings += len([w for c in command['calls'] for w in c.get('warnings', [])])
+        return {
+            'commands': self.commands,
+            'estimate_s': total if self.estimates else None,
+            'gptools': len([c for command in self.commands for c in command['calls'] if c['gptool']]),
+            'warnings': warnings,
+            'status': False not in [c['status'] for c in self.commands]
+        }
+    # ends
+
+
+def getPathKey(path):
+    return os.path.normcase(os.path.normpath(str(path)))
+
+
+def exists(fnc, path, *args):
+    """arcpy.Exists while planning, outputs of the commands planned so far exist."""
+    if (g_plan and
+            g_plan.isPlanned(path)):
+        return True
+    return fnc(path, *args)
+
+
+def getParamNames(fnc):
+    try:
+        return list(signature(fnc).parameters)
+    except (TypeError, ValueError):
+        return None
+
+
+def getWarnings(args):
+    """Returns the issues found in the resolved (args) {name: value} that would otherwise fail the build later."""
+    warnings = []
+    for name, value in args.items():
+        if not isinstance(value, str):
+            continue
+        if re.search(r'\$[^$\\\s]+\$', value):
+            warnings.append('({}) has an unresolved dynamic variable ({})'.format(name, value))
+        if (isinstance(name, str) and
+                name.lower() in QueryArgs):
+            if (value.count("'") % 2 or
+                    value.count('"') % 2 or
+                    value.count('(') != value.count(')')):
+                warnings.append('({}) has unbalanced quotes/parentheses ({})'.format(name, value))
+        for path in value.split(';'):
+            path = path.strip()
+            if (path.lower().endswith(InputFileExts) and
+                    not path.lower().startswith(('http:', 'https:')) and
+                    not os.path.exists(path)):
+                warnings.append('({}) file not found ({})'.format(name, path))
+    return warnings
+
+
+def start(estimates=None):
+    global g_plan
+    g_plan = Plan(estimates)
+    g_plan.patch()
+    return g_plan
+
+
+def stop():
+    global g_plan
+    plan = g_plan
+    g_plan = None
+    if plan:
+        plan.restore()
+    return plan
+
+
+def patch():
+    """Swaps the (arcpy) global of the MDCS modules imported since the plan started."""
+    if g_plan:
+        g_plan.patch()
+
+
+def isActive():
+    return g_plan is not None
+
+
+def setStep(step):
+    if g_plan:
+        g_plan.step = step
+
+
+def record(name, args, kwargs=None, params=None):
+    if g_plan:
+        with g_lock:
+            g_plan.record(name, args, kwargs, params)
+
+
+def skip(reason):
+    """Marks the current command as not planned, e.g. user functions that may run any code."""
+    if (g_plan and
+            g_plan.m_command is not None):
+        g_plan.m_command['skipped'] = reason
+
+
+def done(name, status, output=None):
+    """Sets the outcome of the last planned command (name)."""
+    if (not g_plan or
+            not g_plan.commands or
+            g_plan.commands[-1]['command'] != name):
+        return
+    entry = g_plan.commands[-1]
+    entry['status'] = status
+    if output is not None:
+        entry['output'] = output
+
+
+@contextmanager
+def command(name, desc, md=None):
+    """Collects the calls made within the block under the command (name). A no-op unless planning."""
+    plan = g_plan
+    if plan is None:
+        yield None
+        return
+    plan.patch()
+    entry = {'step': plan.step, 'command': name, 'desc': desc, 'md': md, 'calls': [], 'status': False}
+    estimate = plan.getEstimate('command', name)
+    if estimate is not None:
+        entry['estimate_s'] = estimate
+    plan.commands.append(entry)
+    plan.m_command = entry
+    try:
+        yield entry
+    finally:
+        plan.m_command = None
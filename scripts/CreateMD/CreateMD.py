@@ -23,9 +23,9 @@
 import arcpy
 import os
 import sys
-from defusedxml import minidom
 
 import Base
+import Planner
 
 class CreateMD(Base.Base):
 
@@ -45,7 +45,8 @@ class CreateMD(Base.Base):
         if (self.m_base.m_IsSDE):       # MDCS doesn't create new SDE connections and assumes .SDE connection passed on exists @ the server
             return self.m_base._updateResponse(resp, status=True)
         # create output workspace if missing.
-        if (os.path.exists(self.m_base.m_workspace) == False):
+        if (os.path.exists(self.m_base.m_workspace) == False and
+                not Planner.isActive()):
             try:
                 os.makedirs(self.m_base.m_workspace)
             except BaseException:
@@ -97,29 +98,16 @@ class CreateMD(Base.Base):
         return False
 
     def init(self, config):
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("\nErr. MosaicDatasets node not found! Invalid schema.", self.const_critical_text)
             return False
-        try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == self.m_base.NODE_TYPE_ELEMENT):
-                    if(node.nodeName == 'SRS'):   # required arg
-                        self.srs = node.firstChild.nodeValue
-                    elif(node.nodeName == 'pixel_type'):  # optional arg
-                        if (node.hasChildNodes()):
-                            self.pixel_type = node.firstChild.nodeValue
-                    elif(node.nodeName == 'num_bands'):   # optional arg
-                        if (node.hasChildNodes()):
-                            self.num_bands = node.firstChild.nodeValue
-                    elif(node.nodeName == 'product_definition'):  # optional arg
-                        if (node.hasChildNodes()):
-                            self.product_definition = node.firstChild.nodeValue
-                    elif(node.nodeName == 'product_band_definitions'):    # optional arg
-                        if (node.hasChildNodes()):
-                            self.product_band_definitions = node.firstChild.nodeValue
-        except BaseException:
+        values = model.md.values
+        if (values.get('SRS') is None):     # required arg
             self.log("\nErr. Reading MosaicDataset nodes.", self.const_critical_text)
             return False
+        self.srs = values['SRS']
+        for key in ['pixel_type', 'num_bands', 'product_definition', 'product_band_definitions']:    # optional args
+            if (values.get(key) is not None):
+                setattr(self, key, values[key])
         return True
@@ -28,8 +28,6 @@ sys.path.append('../SetMDProperties/')
 import SetMDProperties
 import Base
 
-from xml.dom import minidom
-
 
 class CreateReferencedMD(Base.Base):
 
@@ -123,119 +121,90 @@ class CreateReferencedMD(Base.Base):
         return True
 
     def init(self, config):
-
-        self.srs = self.getXMLNodeValue(self.m_base.m_doc, "SRS")  # workspace/location on filesystem where the .gdb is created.
-        self.pixel_type = self.getXMLNodeValue(self.m_base.m_doc, "pixel_type")
-
-        self.m_numBands = self.getXMLNodeValue(self.m_base.m_doc, "num_bands")
-
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("Error: MosaicDatasets node not found! Invalid schema.", self.const_critical_text)
             return False
 
+        self.srs = model.md.values.get('SRS') or ''  # workspace/location on filesystem where the .gdb is created.
+        self.pixel_type = model.md.values.get('pixel_type') or ''
+
+        self.m_numBands = model.md.values.get('num_bands') or ''
+
         dListEmpty = len(self.dic_derive_lst) == 0
         refMD = self.m_base.m_mdName
         dName = ''
 
         try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-
-                    if (node.nodeName == 'CreateReferencedMosaicDataset'):
-
-                        for node in node.childNodes:
-                            if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                nodeName = node.nodeName.lower()
-                                if (node.childNodes.length > 0):
-                                    if ((nodeName in self.dic_ref_info.keys()) == False):
-                                        if (nodeName.lower() == 'in_dataset'):
-                                            if (self.m_base.m_sources == ''):
-                                                in_dataset = node.firstChild.nodeValue
-                                            else:
-                                                in_dataset = self.m_base.m_sources
-                                            self.dic_derive_lst[in_dataset] = {'ref': {}}
-                                            functions = []
-                                            self.dic_derive_lst[in_dataset]['ref'][refMD] = functions
-                                            self.dic_derive_lst[in_dataset]['key'] = in_dataset
-                                            self.dic_ref_info[nodeName] = in_dataset
-                                            continue
-
-                                        self.dic_ref_info[nodeName] = node.firstChild.nodeValue
-
-                    elif(node.nodeName == 'AddRasters'):
-
-                        if (len(self.dic_derive_lst) > 0):  # if CreateReferencedMosaicDataset is found, addRaster info gets ignored.
-                            continue
-
-                        if (len(refMD) == 0):
-                            self.log("Error: <MosaicDataset/Name> should be defined first.", self.const_critical_text)
-                            return False
-
-                        for node in node.childNodes:
-                            if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                nodeName = node.nodeName.lower()
-
-                                if (nodeName == 'addraster'):
-                                    for node in node.childNodes:
-                                        if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                            nodeName = node.nodeName.lower()
-
-                                            if (nodeName == 'sources'):
-
-                                                # if (self.m_base.m_sources != ''):
-                                                for node in node.childNodes:
-                                                    if (node.nodeName.lower() == 'data_path'):
-                                                        try:
-                                                            dNameVal = self.m_base.m_sources
-                                                            if (dNameVal == ''):
-                                                                dNameVal = node.firstChild.nodeValue
-                                                            dName = dNameVal.upper()
-
-                                                            arydNameVal = dNameVal.split(';')
-                                                            arydName = dName.split(';')
-
-                                                            maxRange = len(arydName)
-                                                            for indx in range(0, maxRange):
-                                                                _file = arydName[indx].strip()
-                                                                if (_file == ''):
-                                                                    continue
-
-                                                                _p, _f = os.path.split(_file)
-                                                                if (_p == ''):
-                                                                    arydNameVal[indx] = os.path.join(self.m_base.m_geoPath, _f)
-                                                                    _file = arydNameVal[indx].upper()
-
-                                                                if (dListEmpty or (_file in self.dic_derive_lst.keys()) == False):
-                                                                    self.dic_derive_lst[_file] = {'ref': {}}
-                                                                    dListEmpty = False
-
-                                                                prev_indx = refMD in self.dic_derive_lst[_file]['ref'].keys()
-
-                                                                if (prev_indx == False):
-                                                                    functions = []
-                                                                    self.dic_derive_lst[_file]['ref'][refMD] = functions
-
-                                                                self.dic_derive_lst[_file]['key'] = arydNameVal[indx]
-                                                        except:
-                                                            Error = True
-
-                    elif(node.nodeName == 'Functions'):
-                        if (refMD == '' and dName == ''):
-                            self.log("Warning/Internal: refMD/dName empty!", self.const_warning_text)
-                            break
-
-                        for node in node.childNodes:
-                            if (node.nodeName == 'function_path'):
-                                if (node.childNodes.length > 0):
-                                    rftNode = self.m_base.getAbsPath(node.firstChild.nodeValue.strip())
-                                    if (len(rftNode) != 0):
-                                        rft = self.prefixFolderPath(rftNode, self.m_base.const_raster_function_templates_path_)
-                                        if (os.path.exists(rft) == False):
-                                            rft = rftNode
-                                        for md in self.dic_derive_lst.keys():
-                                            self.dic_derive_lst[md]['ref'][refMD].append(rft)
+            for nodeName, value in model.md.reference.items():
+                if (nodeName in self.dic_ref_info.keys()):
+                    continue
+                if (nodeName == 'in_dataset'):
+                    in_dataset = value
+                    if (self.m_base.m_sources != ''):
+                        in_dataset = self.m_base.m_sources
+                    self.dic_derive_lst[in_dataset] = {'ref': {}}
+                    functions = []
+                    self.dic_derive_lst[in_dataset]['ref'][refMD] = functions
+                    self.dic_derive_lst[in_dataset]['key'] = in_dataset
+                    self.dic_ref_info[nodeName] = in_dataset
+                    continue
+                self.dic_ref_info[nodeName] = value
+
+            if (len(self.dic_derive_lst) == 0):  # if CreateReferencedMosaicDataset is found, addRaster info gets ignored.
+                if (model.md.add_rasters and
+                        len(refMD) == 0):
+                    self.log("Error: <MosaicDataset/Name> should be defined first.", self.const_critical_text)
+                    return False
+
+                for addRaster in model.md.add_rasters:
+                    for dNameVal in (addRaster.data_paths or ()):
+                        try:
+                            if (self.m_base.m_sources != ''):
+                                dNameVal = self.m_base.m_sources
+                            dName = dNameVal.upper()
+
+                            arydNameVal = dNameVal.split(';')
+                            arydName = dName.split(';')
+
+                            maxRange = len(arydName)
+                            for indx in range(0, maxRange):
+                                _file = arydName[indx].strip()
+                                if (_file == ''):
+                                    continue
+
+                                _p, _f = os.path.split(_file)
+                                if (_p == ''):
+                                    arydNameVal[indx] = os.path.join(self.m_base.m_geoPath, _f)
+                                    _file = arydNameVal[indx].upper()
+
+                                if (dListEmpty or (_file in self.dic_derive_lst.keys()) == False):
+                                    self.dic_derive_lst[_file] = {'ref': {}}
+                                    dListEmpty = False
+
+                                prev_indx = refMD in self.dic_derive_lst[_file]['ref'].keys()
+
+                                if (prev_indx == False):
+                                    functions = []
+                                    self.dic_derive_lst[_file]['ref'][refMD] = functions
+
+                                self.dic_derive_lst[_file]['key'] = arydNameVal[indx]
+                        except:
+                            Error = True
+
+            if (model.md.function_paths):
+                if (refMD == '' and dName == ''):
+                    self.log("Warning/Internal: refMD/dName empty!", self.const_warning_text)
+                    return True
+
+                for function_path in model.md.function_paths:
+                    rftNode = self.m_base.getAbsPath(function_path)
+                    if (len(rftNode) != 0):
+                        rft = self.prefixFolderPath(rftNode, self.m_base.const_raster_function_templates_path_)
+                        if (os.path.exists(rft) == False):
+                            rft = rftNode
+                        for md in self.dic_derive_lst.keys():
+                            self.dic_derive_lst[md]['ref'][refMD].append(rft)
 
         except:
             self.log("Error: reading MosaicDataset nodes.", self.const_critical_text)
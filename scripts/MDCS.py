@@ -23,24 +23,36 @@
 # ------------------------------------------------------------------------------
 #!/usr/bin/env python
 
-import arcpy
 import sys
 import os
-from importlib import reload
 
 solutionLib_path = os.path.dirname(os.path.abspath(__file__))  # set the location to the solutionsLib path
-[sys.path.append(x) for x in [solutionLib_path, os.path.join(solutionLib_path, 'SolutionsLog'), os.path.join(solutionLib_path, 'Base')]]
+[sys.path.append(x) for x in [solutionLib_path, os.path.join(solutionLib_path, 'SolutionsLog'), os.path.join(solutionLib_path, 'Base'), os.path.join(solutionLib_path, 'StepCache')]]
+import LazyImport
+arcpy = LazyImport.lazyImport('arcpy')     # imported on the first use, the usage screen and user function runs don't pay for it.
 import logger
+import tracer
 import solutionsLib # import Raster Solutions library
 import Base
-logger = reload(logger)  # ArcGIS Pro PYT EVN requires a reload to clear previous instances.
-solutionsLib = reload(solutionsLib)
-Base = reload(Base)
-from ProgramCheckAndUpdate import ProgramCheckAndUpdate
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import ConfigModel
+import Planner
+logger = LazyImport.reloadModule(logger)  # ArcGIS Pro PYT EVN requires a reload to clear previous instances. (MDCS_DEV_RELOAD=1)
+solutionsLib = LazyImport.reloadModule(solutionsLib)
+Base = LazyImport.reloadModule(Base)
+from StepCache import StepCache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import json
+import ast
+import copy
+from defusedxml import minidom
+import functools
 import shutil
 import uuid
+import re
+import atexit
+import multiprocessing
+import threading
+import time
 redacting_patterns = ["token", "validatingToken", "accessKey", "secretKey"]
 # cli callback ptrs
 g_cli_callback = None
@@ -48,9 +60,26 @@ g_cli_msg_callback = None
 # ends
 Enabled = "enabled"
 StatusKey = "__status"
+Workers = "workers"
+Depends = "depends"
+Pool = "pool"
+Cache = "cache"
+Shards = "shards"
+ShardStep = "shard"
+ShardStaging = "__shards__"
+DatasetIDField = 'Dataset_ID'
+DatasetIDOIDField = 'OBJECTID'
+DatasetIDRanges = '__dataset_id_ranges'     # (info) key of the AddRaster ranges pending the Dataset_ID calculation.
+ManifestCommits = '__manifest_commits'      # (info) key of the [(SourceManifest, sources)] recorded once the Dataset_IDs are set.
+DatasetIDFieldKey = '__dataset_id_field'     # (info) key set once the Dataset_ID field is known to exist.
+log = None
 # agolapis
 stepInfo = {}
 # ends
+# warm worker pools shared by all (threads) steps/jobs of this process, one per pool settings.
+g_warm_pools = {}
+g_warm_pools_lock = threading.Lock()
+# ends
 
 # cli arcpy callback
 def register_for_callbacks(fn_ptr):
@@ -66,30 +95,208 @@ def register_for_msg_callbacks(fn_ptr):
 
 
 def postAddData(gdbPath, mdName, info):
+    """AddRasters callback, called after each AddRaster node that added items and once more with info['flush'] set.
+    The Dataset_ID ranges of the nodes are stamped together on (flush), the source manifests are recorded only once that succeeds."""
+    if info.get('flush'):
+        commits = info.pop(ManifestCommits, [])
+        if not stampDatasetIDs(gdbPath, info):
+            return False    # the sources stay out of the manifest, the next run adds them again.
+        for manifest, sources in commits:
+            log.Message('Source manifest: recorded ({}) files for the mosaic dataset ({})'.format(
+                manifest.commit(sources), info['md']), log.const_general_text)    # (sources) of the AddRasters chunk if set.
+        return True
+    if info['type'].lower() == 'source':
+        start = info['pre_AddRasters_record_count']
+        end = info.get('post_AddRasters_record_count')
+        info.setdefault(DatasetIDRanges, []).append((start, end if end and end > start else None, info['Dataset_ID']))
+    manifest = info.pop('manifest', None)   # set only if the AddRasters call succeeded, see AddRasters/SourceManifest.py
+    sources = info.pop('sources', None)
+    if manifest:
+        info.setdefault(ManifestCommits, []).append((manifest, sources))
+    return True
+
+
+def getDatasetIDExpression(ranges):
+    """Returns (expression, code block) of CalculateField to set the Dataset_ID of the [(start OID, end OID or None, value)] ranges."""
+    values = set([r[2] for r in ranges])
+    if (len(values) == 1 and
+            not [i for i in range(1, len(ranges)) if ranges[i][0] != ranges[i - 1][1]]):    # a single contiguous range.
+        return (repr(values.pop()), '')
+    codeBlock = 'def getDatasetID(oid):\n'
+    for start, end, value in reversed(ranges):     # the last node wins if the ranges overlap.
+        codeBlock += '    if oid > {}{}:\n        return {}\n'.format(start, '' if end is None else ' and oid <= {}'.format(end), repr(value))
+    codeBlock += '    return None\n'
+    return ('getDatasetID(!{}!)'.format(DatasetIDOIDField), codeBlock)
+
+
+def stampDatasetIDs(gdbPath, info):
+    """Sets the Dataset_ID of the items added by the AddRaster nodes in a single field calculation over their OBJECTID range."""
+    ranges = info.pop(DatasetIDRanges, None)
+    if not ranges:
+        return True
     mdName = info['md']
-    obvalue = info['pre_AddRasters_record_count']
     fullPath = os.path.join(gdbPath, mdName)
-
-    mosaicMDType = info['type'].lower()
-    if mosaicMDType == 'source':
-        expression = 'OBJECTID >{}'.format(obvalue)
+    ends = [r[1] for r in ranges]
+    expression = '{} >{}'.format(DatasetIDOIDField, min([r[0] for r in ranges]))
+    if None not in ends:
+        expression += ' AND {} <={}'.format(DatasetIDOIDField, max(ends))
+    lyrName = 'lyr_dsid_{}'.format(uuid.uuid4().hex)
+    try:
+        if not info.get(DatasetIDFieldKey):     # the field check is done once per mosaic dataset and (AR) run.
+            if not arcpy.ListFields(fullPath, DatasetIDField):
+                arcpy.AddField_management(fullPath, DatasetIDField, "TEXT", "", "", "50")
+            info[DatasetIDFieldKey] = True
+        log.Message('Calculating \'Dataset ID\' for the mosaic dataset ({}) with value(s) ({})'.format(
+            mdName, ', '.join(sorted(set([str(r[2]) for r in ranges])))), log.const_general_text)
+        start = time.time()
+        arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
+        (calcExpression, codeBlock) = getDatasetIDExpression(ranges)
+        arcpy.CalculateField_management(lyrName, DatasetIDField, calcExpression, 'PYTHON3', codeBlock)
+        elapsed = time.time() - start
+        count = int(arcpy.GetCount_management(lyrName)[0])
+        log.Message('Dataset ID: ({}) items in ({:.1f}s), ({:.0f}) rows/s'.format(count, elapsed, count / elapsed if elapsed else 0), log.const_general_text)
+    except BaseException:
+        log.Message('Err. Failed to calculate \'Dataset_ID\'', log.const_critical_text)
+        log.Message(arcpy.GetMessages(), log.const_critical_text)
+        return False
+    finally:
         try:
-            fieldName = 'Dataset_ID'
-            fieldExist = arcpy.ListFields(fullPath, fieldName)
-            if not fieldExist:
-                arcpy.AddField_management(fullPath, fieldName, "TEXT", "", "", "50")
-            log.Message('Calculating \'Dataset ID\' for the mosaic dataset ({}) with value ({})'.format(mdName, info[fieldName]), log.const_general_text)
-            with arcpy.da.UpdateCursor(fullPath, [fieldName], expression) as rows:
-                for row in rows:
-                    row[0] = info[fieldName]
-                    rows.updateRow(row)
+            arcpy.Delete_management(lyrName)
         except BaseException:
-            log.Message('Err. Failed to calculate \'Dataset_ID\'', log.const_critical_text)
-            log.Message(arcpy.GetMessages(), log.const_critical_text)
-            return False
+            pass
     return True
 
 
+class StepSpec(object):
+    """Typed arguments of a single MDCS run, the in-process equivalent of the MDCS.py command-line flags.
+    (job) is a job file path, a job JSON string or a parsed job payload."""
+
+    def __init__(self, config='', com='', md_path='', sources=None, log_folder='', code_base='', artdem='',
+                 params=None, user_args=None, job=None, resume=False, gprun=False, trace='', argv=None,
+                 targets=None, md_index=None, workers=0, target='', plan=None, estimates='', dev=False):
+        self.config = config
+        self.com = com
+        self.md_path = md_path
+        self.sources = list(sources or [])
+        self.log_folder = log_folder
+        self.code_base = code_base
+        self.artdem = artdem
+        self.params = list(params or [])    # -p values, e.g. 7$pixelvalue
+        self.user_args = dict(user_args or {})      # custom userCode args, e.g. {'__hello1': 0}
+        self.job = job
+        self.resume = resume
+        self.gprun = gprun
+        self.trace = trace      # path to write the (.json/.csv) performance trace to.
+        self.argv = argv
+        self.targets = list(targets or [])  # [{'m': md_path, 's': [sources]}] of a multi mosaic run, (sources) are shared.
+        self.md_index = md_index    # the <MosaicDataset> to use of a config defining many.
+        self.workers = workers      # parallel targets, defaults to the number of CPUs.
+        self.target = target        # label of a single target of a multi mosaic run.
+        self.plan = plan            # dry-run, path to write the JSON plan to or '' to print it.
+        self.estimates = estimates  # an earlier (-trace) to estimate the planned command durations from.
+        self.dev = dev              # reload the MDCS modules/user code on every run.
+
+    @classmethod
+    def fromArgv(cls, argv):
+        spec = cls(argv=list(argv))
+        shared = []     # -s values given before the first -m apply to all targets.
+        for arg in argv:
+            (values) = arg.split(':')
+            if (len(values[0]) < 2 or
+                values[0][:1] != '-' and
+                    values[0][:1] != '#'):
+                continue
+            exSubCode = values[0][1:len(values[0])].lower()
+            subCode = values.pop(0)[1].lower()
+            value = ':'.join(values).strip()
+            if subCode == 'c':
+                spec.com = value.replace(' ', '')  # remove spaces in between.
+            elif subCode == 'i':
+                spec.config = value
+            elif subCode == 'm':
+                spec.md_path = value
+                spec.targets.append({'m': value, 's': []})
+            elif subCode == 's':
+                spec.sources.append(value)
+                (spec.targets[-1]['s'] if spec.targets else shared).append(value)
+            elif subCode == 'l':
+                spec.log_folder = value
+            elif subCode == 'b':
+                spec.code_base = value
+            elif exSubCode == 'artdem':
+                spec.artdem = value
+            elif exSubCode == 'resume':
+                spec.resume = True                # skip commands already completed in the last run of this chain.
+            elif exSubCode == 'gprun':
+                spec.gprun = True                  # direct log messages also to (arcpy.AddMessage)
+            elif exSubCode == 'dev':
+                spec.dev = True
+            elif exSubCode == 'trace':
+                spec.trace = value
+            elif exSubCode == 'plan':
+                spec.plan = value
+            elif exSubCode == 'estimates':
+                spec.estimates = value
+            elif subCode == 'p':
+                spec.params.append(value)
+            elif exSubCode.startswith('__'):  # prefix to pass custom userCode args.
+                spec.user_args[exSubCode] = value
+            elif subCode == 'j':
+                spec.job = value
+            elif subCode == 'w':
+                try:
+                    spec.workers = max(0, int(value))
+                except ValueError:
+                    pass
+        if len(spec.targets) > 1:   # -m repeated, each with its own -s values.
+            spec.md_path = ''
+            spec.sources = shared
+        else:
+            spec.targets = []
+        return spec
+
+    @classmethod
+    def fromStepArgs(cls, args):
+        """Returns the spec of a job step (args), e.g. {"c": "CM+AR", "i": "..", "s": [..], "p": ["7$pixelvalue"]}"""
+        spec = cls()
+        for flag, value in args.items():
+            values = value if isinstance(value, list) else [value]
+            key = flag.lower()
+            if key == 'c':
+                spec.com = str(value).replace(' ', '')
+            elif key == 'i':
+                spec.config = value
+            elif key == 'm':
+                spec.md_path = value
+            elif key == 's':
+                spec.sources += [str(v) for v in values]
+            elif key == 'l':
+                spec.log_folder = value
+            elif key == 'b':
+                spec.code_base = value
+            elif key == 'p':
+                spec.params += [str(v) for v in values]
+            elif key.startswith('__'):
+                spec.user_args[key] = values[-1]
+        return spec
+
+    def toArgv(self):
+        if self.argv is not None:
+            return self.argv
+        argv = [f'-c:{self.com}'] if self.com else []
+        argv += [f'-i:{self.config}'] if self.config else []
+        argv += [f'-m:{self.md_path}'] if self.md_path else []
+        argv += [f'-s:{v}' for v in self.sources]
+        for target in self.targets:
+            argv += [f"-m:{target['m']}"] + [f'-s:{v}' for v in target['s']]
+        argv += [f'-w:{self.workers}'] if self.workers else []
+        argv += [f'-p:{v}' for v in self.params]
+        argv += [f'-{k}:{v}' for k, v in self.user_args.items()]
+        argv += [f'-b:{self.code_base}'] if self.code_base else []
+        argv += [f'-l:{self.log_folder}'] if self.log_folder else []
+        return argv
+
+
 def main(argc, argv):
     if argc < 2:
         # command-line argument codes.
@@ -103,8 +310,15 @@ def main(argc, argv):
             [
                 r"-m: Mosaic dataset path including GDB and MD name [e.g. c:\WorldElevation.gdb\Portland]",
                 "-s: Source data paths. (As inputs to command (AR). -s: can be repeated to add multiple paths",
+                "    -m: can be repeated to run the commands for many mosaic datasets in parallel, -s: values after each -m: apply to it",
+                "-w: Number of mosaic datasets to process in parallel for repeated -m: or many <MosaicDataset> nodes in the config",
                 "-l: Log file output path [path+file name]",
-                "-artdem: Update DEM path in ART file"
+                "-artdem: Update DEM path in ART file",
+                "-resume: Skip commands that completed in the last run of the same command chain/config",
+                "-trace: Write a job/step/command/gptool performance trace to [path].json (Chrome trace) and [path].csv",
+                "-plan: Dry-run, resolve the args of all commands and report the GP tool calls as JSON [Optional:path] without running them",
+                "-estimates: Estimate the -plan command durations from an earlier -trace [path]",
+                "-dev: Reload the MDCS modules and MDCS_UC on every run to pick up code edits (or set MDCS_DEV_RELOAD=1)"
             ]
         print("\nMDCS.py v6.0.1 [20241120]\nUsage: MDCS.py -c:<Optional:command> -i:<config_file>"
               "\n\nFlags to override configuration values,")
@@ -113,71 +327,75 @@ def main(argc, argv):
         print(
             "\nNote: Commands can be combined with '+' to do multiple operations."
             "\nAvailable commands:")
-        user_cmds = solutionsLib.Solutions().getAvailableCommands()
+        user_cmds = solutionsLib.Solutions.getAvailableCommands()
         for key in user_cmds:
             print("\t" + key + ' = ' + user_cmds[key]['desc'])
         sys.exit(1)
+    return run_step(StepSpec.fromArgv(argv))
+
+
+def run_step(spec):
+    """Runs the MDCS commands/job described by the StepSpec (spec) in-process and returns the command results.
+    Specs with many mosaic targets return the report of runTargets instead."""
+    if spec.dev:
+        LazyImport.setDevReload()
+    if (spec.plan is not None and
+            not Planner.isActive()):
+        return runPlan(spec)
+    targets = getTargetSpecs(spec)
+    if targets:
+        if Planner.isActive():     # planned in-process, one target after another.
+            return {label: run_step(target) for label, target in targets}
+        return runTargets(spec, targets)
+    Planner.setStep(spec.user_args.get('__step__') or spec.target or None)
     base = Base.Base()
     comInfo = {
         'AR': {'cb': postAddData},  # assign a callback function to run custom user code when adding rasters.
-        '__user': {}       # key to pass any custom userCode args to other userCode functions that are defined in MDCS_UC.
+        '__user': dict(spec.user_args)       # key to pass any custom userCode args to other userCode functions that are defined in MDCS_UC.
     }
     if g_cli_callback is not None:
         base.m_cli_callback_ptr = g_cli_callback
     if g_cli_msg_callback is not None:
         base.m_cli_msg_callback_ptr = g_cli_msg_callback
     global log
+    outerLog = log      # a job's steps run in-process, restore the job's log once the step is done.
     log = logger.Logger(base)
+    session = tracer.enable(spec.trace) if spec.trace else None
+    try:
+        return _run_step(spec, base, comInfo, log)
+    finally:
+        log = outerLog
+        if session:
+            session.finish()
+            tracer.disable()
+
+
+def _run_step(spec, base, comInfo, log):
     base.setLog(log)
-    argIndx = 0
-    md_path_ = artdem = config = com = log_folder = code_base = ''
+    md_path_ = spec.md_path
+    artdem = spec.artdem
+    config = spec.config
+    com = spec.com
+    log_folder = spec.log_folder
+    code_base = spec.code_base
+    jobFile = spec.job
     PathSeparator = ';'
-    jobFile = None
-    while argIndx < argc:
-        (values) = argv[argIndx].split(':')
-        if (len(values[0]) < 2 or
-            values[0][:1] != '-' and
-                values[0][:1] != '#'):
-            argIndx += 1
+    base.m_sources = PathSeparator.join(spec.sources)
+    base.m_resume = spec.resume
+    base.m_mdIndex = spec.md_index
+    if spec.gprun:
+        log.isGPRun = True
+    for value in spec.params:
+        pMax = value.rfind('$')
+        if pMax == -1:
+            pMax = value.rfind('@')
+        if pMax == -1:
             continue
-        exSubCode = values[0][1:len(values[0])].lower()
-        subCode = values.pop(0)[1].lower()
-        value = ':'.join(values).strip()
-        if subCode == 'c':
-            com = value.replace(' ', '')  # remove spaces in between.
-        elif subCode == 'i':
-            config = value
-        elif subCode == 'm':
-            md_path_ = value
-        elif subCode == 's':
-            base.m_sources += value + PathSeparator
-        elif subCode == 'l':
-            log_folder = value
-        elif subCode == 'b':
-            code_base = value
-        elif exSubCode == 'artdem':
-            artdem = value
-        elif exSubCode == 'gprun':
-            log.isGPRun = True                  # direct log messages also to (arcpy.AddMessage)
-        elif subCode == 'p':
-            pMax = value.rfind('$')
-            if pMax == -1:
-                pMax = value.rfind('@')
-            if pMax == -1:
-                argIndx += 1
-                continue
-            dynamic_var = value[pMax + 1:].upper()
-            v = value[0: pMax]
-            if dynamic_var.strip() != '':
-                if (dynamic_var in base.m_dynamic_params.keys()) is False:
-                    base.m_dynamic_params[dynamic_var] = v
-        elif exSubCode.startswith('__'):  # prefix to pass custom userCode args.
-            comInfo['__user'][exSubCode] = value
-        elif subCode == 'j':
-            jobFile = value
-        argIndx += 1
-    if base.m_sources.endswith(PathSeparator):
-        base.m_sources = base.m_sources[:len(base.m_sources) - 1]
+        dynamic_var = value[pMax + 1:].upper()
+        v = value[0: pMax]
+        if dynamic_var.strip() != '':
+            if (dynamic_var in base.m_dynamic_params.keys()) is False:
+                base.m_dynamic_params[dynamic_var] = v
     if code_base != '':
         base.setCodeBase(code_base)
     if md_path_ != '':
@@ -201,7 +419,7 @@ def main(argc, argv):
     configName = os.path.basename(configName)
     # setup log
     log.Project('MDCS')
-    log.LogNamePrefix(configName)
+    log.LogNamePrefix('_'.join([v for v in [configName, spec.target] if v]))
     log.StartLog()
     log_output_folder = os.path.join(os.path.dirname(solutionLib_path), 'logs')
     if log_folder != '':
@@ -213,6 +431,7 @@ def main(argc, argv):
     log.SetLogFolder(log_output_folder)
     # ends
     # Source version check.
+    from ProgramCheckAndUpdate import ProgramCheckAndUpdate     # (requests) is only needed for the update check.
     versionCheck = ProgramCheckAndUpdate()
     log.Message('Checking for updates..', logger.Logger.const_general_text)
     verMessage = versionCheck.run(solutionLib_path)
@@ -236,7 +455,7 @@ def main(argc, argv):
         com = base.const_cmd_default_text
     try:
         logging_items = []
-        for item in argv:
+        for item in spec.toArgv():
             if '$' not in item:
                 logging_items.append(item)
                 continue
@@ -252,7 +471,9 @@ def main(argc, argv):
     if jobFile:
         params = {}
         try:
-            if os.path.exists(jobFile):
+            if isinstance(jobFile, dict):
+                payload = jobFile
+            elif os.path.exists(jobFile):
                 with open (jobFile) as reader:
                     try:
                         payload = json.load(reader)
@@ -266,25 +487,137 @@ def main(argc, argv):
             return False
         params["payload"] = payload
         params['__mdcs__'] = {'resp' : []}
-        worker(**params)
+        jobId = payload.get('job', {}).get('id', 'job') if isinstance(payload, dict) else 'job'
+        with tracer.span(jobId, 'job'):
+            worker(**params)
         results = params['__mdcs__']['resp']
     else:
-        results = runWorkflow (base, config, com, comInfo)
+        with tracer.span(spec.user_args.get('__step__', spec.target or com), 'step', {'c': com, 'i': config, 'm': md_path_}):
+            results = runWorkflow (base, config, com, comInfo)
     log.Message("Done...", log.const_general_text)
     log.WriteLog('#all')  # persist information/errors collected.
     return results
 
-def runMDCS(argv):
-    print("** loading arcpy ***")
+
+def getTargetLabel(value):
+    return re.sub(r'[^\w.-]', '_', value.strip()) or 'md'
+
+
+def getTargetSpecs(spec):
+    """Returns [(label, StepSpec)] for each mosaic target of a multi mosaic (spec) or [] if it has a single target.
+    Targets are the repeated (-m) values or, without (-m), the <MosaicDataset> nodes of the config."""
+    specs = []
+    if (spec.job or
+            spec.md_index is not None):
+        return specs
+    if len(spec.targets) > 1:
+        for target in spec.targets:
+            child = copy.deepcopy(spec)
+            child.md_path = target['m']
+            child.sources = spec.sources + target['s']
+            specs.append(child)
+    elif (not spec.md_path and
+            spec.config and
+            os.path.isfile(spec.config)):
+        try:
+            nodes = ConfigModel.getMosaicDatasetNodes(minidom.parse(spec.config))
+        except Exception:
+            return specs    # reported by the run itself.
+        if len(nodes) < 2:
+            return specs
+        for i, node in enumerate(nodes):
+            child = copy.deepcopy(spec)
+            child.md_index = i
+            specs.append(child)
+    labels = []
+    for i, child in enumerate(specs):
+        if child.md_path:
+            label = os.path.basename(child.md_path.replace('\\', '/').rstrip('/'))
+        else:
+            names = [c for c in nodes[i].childNodes if c.nodeName == 'Name' and c.firstChild is not None]
+            label = names[0].firstChild.data if names else f'md{i}'
+        label = getTargetLabel(label)
+        if label in labels:
+            label = f'{label}_{i}'
+        labels.append(label)
+        child.targets = []
+        child.argv = None
+        child.trace = ''    # targets join the trace session of the parent.
+        child.target = label
+    return list(zip(labels, specs))
+
+
+def runTarget(spec):
+    """Pool task, runs a single mosaic target of a multi mosaic step and returns its (status, response)."""
     import MDCS
-    ret = MDCS.main(len(argv), argv)
-    return ret
+    response = MDCS.run_step(spec)
+    status = (isinstance(response, list) and
+              False not in [cmd.get('value') for cmd in response])
+    return {'status': status, 'response': response}
+
+
+def runTargets(spec, targets):
+    """Runs the command chain of (spec) for each of the (targets) in a separate worker process, each with its own Base/Logger.
+    Targets on the same file geodatabase run one after another. Returns the aggregated report {'summary', 'jobs'}"""
+    import MDCS
+    import MDCS_Batch
+    tasks = []
+    for label, target in targets:
+        if target.md_path:
+            source = target.md_path
+            gdb = MDCS_Batch.getGeodatabasePath(target.md_path)
+        else:
+            source = f'{target.config}[{target.md_index}]'
+            gdb = MDCS_Batch.getConfigGeodatabase(target.config)
+        gdbs = set()
+        if (gdb and
+                not gdb.lower().endswith('.sde')):
+            gdbs.add(MDCS_Batch.getGeodatabaseKey(gdb))
+        tasks.append({'id': label, 'source': source, 'payload': target, 'gdbs': gdbs})
+    workers = spec.workers or min(len(tasks), os.cpu_count() or 1)
+    print(f'Processing ({len(tasks)}) mosaic datasets, ({workers}) at a time.')
+    session = tracer.enable(spec.trace) if spec.trace else None     # pool tasks carry the session, workers join the same trace.
+    try:
+        return MDCS_Batch.schedule(tasks, workers, MDCS.runTarget, 'Target')
+    finally:
+        if session:
+            session.finish()
+            tracer.disable()
+
+
+def runPlan(spec):
+    """Runs (spec) as a dry-run. The GP tool calls are recorded with their resolved args instead of being invoked,
+    the plan is printed or written to (spec.plan) as JSON and returned."""
+    estimates = None
+    if spec.estimates:
+        try:
+            estimates = tracer.readDurations(spec.estimates)
+        except OSError as e:
+            print(f'Err. Unable to read the trace ({spec.estimates})/{e}')
+    planned = copy.deepcopy(spec)
+    planned.plan = None
+    plan = Planner.start(estimates)
+    try:
+        results = run_step(planned)
+    finally:
+        Planner.stop()
+    report = plan.report()
+    report['status'] = report['status'] and bool(results)
+    output = json.dumps(report, indent=4, default=str)
+    if not spec.plan:
+        print(output)
+        return report
+    try:
+        with open(spec.plan, 'w') as writer:
+            writer.write(output)
+        print(f'Plan ({len(report["commands"])} commands, {report["gptools"]} GP tool calls, {report["warnings"]} warnings) written to ({spec.plan})')
+    except OSError as e:
+        print(f'Err. {e}')
+    return report
+
 
 def runWorkflow(base, config, com, comInfo):
-    from importlib import reload
-    sys.path.append(solutionLib_path)
-    import solutionsLib
-    solutionsLib = reload(solutionsLib)
+    LazyImport.reloadModule(solutionsLib)     # dev flag only, picks up code edits between runs in the same process.
     solutions = solutionsLib.Solutions(base)
     results = solutions.run(config, com, comInfo)
     return results
@@ -340,86 +673,107 @@ def worker(**params):
         )
         lclMdPath = os.path.join(hstRootMd, "undefined.gdb")
         stepStatus = False
-        for step in steps:  # will always have the def 'root' step.
-            sId = step["id"]
-            if not getBooleanValue(step[Enabled]):
-                captureMsg.addMessage(f"Skipping step ({sId})")
-                continue
-            sType = step["type"].lower()
-            if sType == "mdcs":
-                mdcs = step["args"]
-                # To facilitate AID MDCS custom user function writers to access the def MDCSPOD work Path.
-                mdcs["__wp__"] = hstCleanUpRoot
-                mdcs["__step__"] = sId  # step Id
-                mdcs["__job__"] = payload["job"]["id"]  # AID job Id
-                updInput = stepInfo.addInput(sId, mdcs)
-                UseThreads = 'threads'
-                retVals, stepStatus = doWork(
-                        usrOutput,
-                        hstCleanUpRoot,
-                        updInput[sId],
-                        captureMsg,
-                        use_threads = False if UseThreads not in step else getBooleanValue(step[UseThreads]),
-                        **params
-                        )     # chs
-                stepInfo.addResults(sId, retVals)
-                if not stepStatus:
-                    break
-                for cmd in retVals:
-                    if "output" in cmd:
-                        lclMdPath = cmd["output"]
-                stepInfo.addResults(sId, retVals)
-            else:
-                stepStatus = False
-                prod = None
-                for key, value in step.items():
-                    if isinstance(value, dict):
-                        prod = key
+        sId = None
+        # steps that don't reference each other (@stepId/..) or share a geodatabase can overlap if (build/workers) > 1.
+        maxWorkers = getStepWorkers(mdcs)
+        planning = Planner.isActive()
+        if planning:
+            maxWorkers = 1      # the plan is recorded in-process, one step after another.
+        stepGraph = StepGraph(steps, os.path.join(hstRootMd, usrOutput["path"]))
+        UseThreads = 'threads'
+        pending = list(steps)   # will always have the def 'root' step.
+        running = {}
+        done = set()
+        failed = False
+        useCache = args["build"].get(Cache, False)     # job wide default, steps can override it.
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            while pending or running:
+                for step in list(pending):
+                    if (failed or
+                            len(running) >= maxWorkers):
                         break
-                if not prod:
-                    captureMsg.addMessage(f"Invalid step struct/{sId}..")
-                    break
-                p = sId.split('.')
-                key = p[-1]
-                print (f'*{key}')
-                if key.startswith('@'):
-                    key = key[1:]
-                if sType not in gisBases:
-                    exec(f'from {sType} import *')
-                    base = gisBases[sType] = eval(f'{sType}')
-                if len(p) > 1:
-                    p.pop()
-                    mk_id = '.'.join(p)
-                    base = stepInfo.getResults(f'@{mk_id}/o/{mk_id}')
-                fnProd = base.__getattribute__(prod)
-                args = step[prod]
-                items = args.items()
-                for k, v in items:
-                    print (f' {k} = {v}')
-                    value = parse_syntax(v)
-                    args[k] = value
-                print (f'pre calling gis/{prod}')
-                print (args)
-                stepInfo.addInput(sId, args)
-                retVals = [{'cmd': sId, 'output': '', 'value': False}]
-                try:
-                    ln = len(items)
-                    output = ''
-                    if ln == 0:
-                        output = fnProd
-                    elif (ln == 1 and
-                        k == 'value'):
-                        output = value
+                    if not stepGraph.isReady(step["id"], done):
+                        continue
+                    pending.remove(step)
+                    sId = step["id"]
+                    if not getBooleanValue(step[Enabled]):
+                        captureMsg.addMessage(f"Skipping step ({sId})")
+                        done.add(sId)
+                        continue
+                    sType = step["type"].lower()
+                    if (planning and
+                            sType not in ["mdcs", ShardStep]):
+                        captureMsg.addMessage(f"Plan: skipping step ({sId}) of type ({sType})")
+                        done.add(sId)
+                        continue
+                    if sType not in ["mdcs", ShardStep]:    # generic steps run inline, see StepGraph.
+                        retVals, stepStatus = runGisStep(step, sId, sType, gisBases, captureMsg)
+                        if retVals is None:
+                            failed = True
+                            break
+                        stepInfo.addResults(sId, retVals)
+                        done.add(sId)
+                        if not stepStatus:
+                            failed = True
+                        continue
+                    mdcs = step["args"]
+                    # To facilitate AID MDCS custom user function writers to access the def MDCSPOD work Path.
+                    mdcs["__wp__"] = hstCleanUpRoot
+                    mdcs["__step__"] = sId  # step Id
+                    mdcs["__job__"] = payload["job"]["id"]  # AID job Id
+                    updInput = stepInfo.addInput(sId, mdcs)
+                    # MDCS.main keeps module level state (log, arcpy), concurrent steps must run in their own process.
+                    useThreads = maxWorkers > 1 or (UseThreads in step and getBooleanValue(step[UseThreads]))
+                    useStepCache = getBooleanValue(step.get(Cache, useCache))
+                    if planning:
+                        useThreads = useStepCache = False
+                    if (sType == ShardStep and
+                            not planning):     # planned as a single (AR) into the target.
+                        task = executor.submit(
+                            runShardStep,
+                            usrOutput,
+                            hstCleanUpRoot,
+                            updInput[sId],
+                            getShardCount(step),
+                            captureMsg,
+                            use_threads=useThreads,
+                            use_cache=useStepCache,
+                            **params
+                        )
                     else:
-                        output = fnProd(**args)
-                    retVals[0]['output'] = output #  fnProd if 0 == len(items) or (1 == len(items) and k == 'value') else fnProd(**args)
-                    retVals[0]['value'] = stepStatus = True
-                except Exception as e:
-                    print (f'Err. Invoking/{sId}/{e}')
-                stepInfo.addResults(sId, retVals)
-                print (f'post calling gis/{prod}')
-                if not stepStatus:
-                    break;
+                        task = executor.submit(
+                            doWork,
+                            usrOutput,
+                            hstCleanUpRoot,
+                            updInput[sId],
+                            captureMsg,
+                            use_threads=useThreads,
+                            use_cache=useStepCache,
+                            **params
+                        )     # chs
+                    running[task] = sId
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for task in finished:
+                    tId = running.pop(task)
+                    try:
+                        retVals, status = task.result()
+                    except Exception as e:
+                        captureMsg.addMessage(f"Err. step({tId})/{e}")
+                        retVals, status = [], False
+                    stepInfo.addResults(tId, retVals)
+                    done.add(tId)
+                    if failed:
+                        continue
+                    stepStatus = status
+                    if not status:
+                        failed = True
+                        sId = tId
+                        continue
+                    for cmd in retVals:
+                        if "output" in cmd:
+                            lclMdPath = cmd["output"]
         params[StatusKey] = {"mdcs": {}}
         params[StatusKey]["mdcs"] = {"retVals": stepInfo.getStepResults(), "status": stepStatus}
         if not stepStatus:
@@ -440,6 +794,56 @@ def worker(**params):
         captureMsg.addMessage(f"Err. {e}")
     return captureMsg
 
+def runGisStep(step, sId, sType, gisBases, captureMsg):
+    """Invokes a generic (non MDCS) step, returns (retVals, status). retVals is None if the step is invalid."""
+    prod = None
+    for key, value in step.items():
+        if isinstance(value, dict):
+            prod = key
+            break
+    if not prod:
+        captureMsg.addMessage(f"Invalid step struct/{sId}..")
+        return None, False
+    p = sId.split('.')
+    if sType not in gisBases:
+        exec(f'from {sType} import *')
+        gisBases[sType] = eval(f'{sType}')
+    base = gisBases[sType]
+    if len(p) > 1:
+        p.pop()
+        mk_id = '.'.join(p)
+        base = stepInfo.getResults(f'@{mk_id}/o/{mk_id}')
+    fnProd = base.__getattribute__(prod)
+    args = step[prod]
+    items = args.items()
+    retVals = [{'cmd': sId, 'output': '', 'value': False}]
+    stepStatus = False
+    try:
+        for k, v in items:
+            value = parse_syntax(v)
+            args[k] = value
+    except StepExpressionError as e:
+        captureMsg.addMessage(f'Err. Invoking/{sId}/{e}')
+        return retVals, stepStatus
+    stepInfo.addInput(sId, args)
+    try:
+        ln = len(items)
+        output = ''
+        if ln == 0:
+            output = fnProd
+        elif (ln == 1 and
+            k == 'value'):
+            output = value
+        else:
+            with tracer.span(sId, 'step', {'type': sType, 'fnc': prod}):
+                output = fnProd(**args)
+        retVals[0]['output'] = output #  fnProd if 0 == len(items) or (1 == len(items) and k == 'value') else fnProd(**args)
+        retVals[0]['value'] = stepStatus = True
+    except Exception as e:
+        captureMsg.addMessage(f'Err. Invoking/{sId}/{e}')
+    return retVals, stepStatus
+
+
 class CaptureMessages(object):
     def __init__(self):
         self.response = {"logs": [], "status": False}
@@ -492,7 +896,13 @@ class CaptureMessages(object):
         self._zip = obj._zip
         return self
 
-def doWork(usrOutput, hstCleanUpRoot, mdcs, captureMsg, use_threads=False, **kwargs):  # returns an array
+def getHostPaths(writeToPath, value):
+    """Returns the (;) separated host paths of (value), a path, (;) separated paths or a list of paths."""
+    paths = value if isinstance(value, (list, tuple)) else str(value).split(';')
+    return ';'.join([os.path.join(writeToPath, p.strip()) for p in paths if str(p).strip()])
+
+
+def doWork(usrOutput, hstCleanUpRoot, mdcs, captureMsg, use_threads=False, use_cache=False, **kwargs):  # returns an array
     try:
         rootLogs = hstCleanUpRoot
         writeToPath = hstCleanUpRoot
@@ -507,7 +917,7 @@ def doWork(usrOutput, hstCleanUpRoot, mdcs, captureMsg, use_threads=False, **kwa
         # invoke MDCS {
         for flag in mapToHost:
             if flag in mdcs:
-                mdcs[flag] = os.path.join(writeToPath, mdcs[flag])
+                mdcs[flag] = getHostPaths(writeToPath, mdcs[flag])
         mdcs["b"] = os.path.join(os.path.dirname(__file__), 'Base')      # -b is positioned at the /Base root as MDCS modules get
         mdcs["l"] = os.path.join(rootLogs, "logs/")             # addressed using ../../ relative to Base module path.
         if "m" in mdcs:
@@ -516,54 +926,391 @@ def doWork(usrOutput, hstCleanUpRoot, mdcs, captureMsg, use_threads=False, **kwa
             hstRootMd = os.path.join(hstCleanUpRoot, "output")
             hstMd = os.path.join(os.path.join(hstRootMd, usrOutput["path"]), mdcs["m"])
             mdcs["m"] = hstMd
+        stepCache = cacheKey = None
+        if use_cache:
+            stepCache = StepCache(os.path.join(hstCleanUpRoot, "cache/steps"))
+            cacheKey = stepCache.getKey(mdcs)
+            cached = stepCache.get(cacheKey, arcpy.Exists)
+            if cached is not None:
+                captureMsg.addMessage(f"Using cached results for step ({mdcs['__step__']}) [{cacheKey}]")
+                kwargs['__mdcs__']['resp'].append({mdcs['__step__'] : cached})
+                return cached, True
         # invoke MDCS
-        argv = []
-        content = mdcs
-        for flag, value in content.items():
-            if not isinstance(value, list):
-                value = [value]
-            for i, v in enumerate(value):
-                argv.append(f"-{flag}:{v}")
         captureMsg.addMessage("Invoking MDCS..")
-        Log_Workers = 1
         results = []
         if not use_threads:
-            results = runMDCS(argv)
+            results = run_step(StepSpec.fromStepArgs(mdcs))
         else:
-            with ProcessPoolExecutor(max_workers=Log_Workers) as executor:
-                tasks = {executor.submit(
-                    runMDCS, argv)} # chs
-                for task in as_completed(tasks):
-                    try:
-                        results = task.result()
-                        print(
-                            f'Response> {results}')
-                    except Exception as e:
-                        raise Exception(f'Err. {e}') from e
+            import MDCS     # reference the pool task/spec by module, not by (__main__) when run as a script.
+            pool = getWarmPool(getPoolSettings(kwargs.get("payload")))
+            try:
+                results = pool.run(MDCS.run_step, MDCS.StepSpec.fromStepArgs(mdcs))   # chs
+                print(
+                    f'Response> {results}')
+            except Exception as e:
+                raise Exception(f'Err. {e}') from e
         kwargs['__mdcs__']['resp'].append({mdcs['__step__'] : results})
-        response = json.dumps(results)
-        served = bytes(response, "utf8")
-        respVals = json.loads(served)
+        respVals = results
         if not respVals:
             return respVals, False
         status = True
-        if (
+        if not (
             "value" in respVals[-1]
             and getBooleanValue(  # hotfix (to revisit later to remove code) # GH https://github.com/ArcGIS/AID/issues/4758
                 respVals[-1]["value"]
             )
             and "output" in respVals[-1]
         ):
-            return respVals, status
-        if False in [s["value"] for s in respVals]:
-            status = False
+            if False in [s["value"] for s in respVals]:
+                status = False
+        if stepCache and status:
+            stepCache.put(cacheKey, mdcs['__step__'], respVals)
         return respVals, status
     except Exception as e:
         captureMsg.addMessage(f"Err. doWork/{e}")
     return [], False
 
 
+def getShardCount(step):
+    try:
+        return max(1, int(step.get(Shards, os.cpu_count() or 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
+def getShards(sources, count):
+    """Splits the (sources) into (count) contiguous shards of about the same size."""
+    count = max(1, min(count, len(sources)))
+    size, extra = divmod(len(sources), count)
+    shards = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(sources[start:end])
+        start = end
+    return shards
+
+
+def runShardStep(usrOutput, hstCleanUpRoot, mdcs, shards, captureMsg, use_threads=False, use_cache=False, **kwargs):
+    """Runs the (AR) of an MDCS step as (shards) parallel steps, each adding its part of the (-s) sources into a
+    staging mosaic dataset. The staging mosaic datasets are then added to the target (-m) in a single add using the
+    (Table) raster type. Commands before/after (AR) run on the target as usual. Returns (retVals, status)"""
+    sId = mdcs["__step__"]
+    try:
+        commands = [c.strip() for c in str(mdcs.get("c", "")).split("+") if c.strip()]
+        cmdCodes = [c.upper() for c in commands]
+        if "AR" not in cmdCodes:
+            raise Exception(f"Err. MDCS/steps/({sId}) of type ({ShardStep}) must include the (AR) command.")
+        if not mdcs.get("m"):
+            raise Exception("Err. MDCS/steps/args/m is not set.")
+        arIndx = cmdCodes.index("AR")
+        preCmds, postCmds = commands[:arIndx], commands[arIndx + 1:]
+        sources = mdcs.get("s", [])
+        if not isinstance(sources, list):
+            sources = [sources]
+        sources = [p.strip() for v in sources for p in str(v).split(";") if p.strip()]
+        if not sources:
+            raise Exception(f"Err. MDCS/steps/({sId})/s has no sources to shard.")
+        mdName = os.path.basename(mdcs["m"].replace("\\", "/").rstrip("/"))
+        shardCmds = preCmds + ["AR"]
+        if "CM" not in cmdCodes[:arIndx]:
+            shardCmds.insert(0, "CM")   # each staging mosaic dataset gets the target's schema.
+        shardSteps = []
+        for i, shard in enumerate(getShards(sources, shards)):
+            shardArgs = {k: v for k, v in mdcs.items() if k not in ["c", "m", "s"]}
+            shardArgs["c"] = "+".join(shardCmds)
+            shardArgs["s"] = ";".join(shard)
+            shardArgs["m"] = f"{ShardStaging}/{sId}_{i}.gdb/{mdName}"
+            shardArgs["__step__"] = f"{sId}#{i}"
+            shardSteps.append(shardArgs)
+        captureMsg.addMessage(f"Adding ({len(sources)}) sources as ({len(shardSteps)}) shards for step ({sId})")
+        retVals = []
+        status = True
+        with ThreadPoolExecutor(max_workers=len(shardSteps)) as executor:
+            tasks = [executor.submit(doWork, usrOutput, hstCleanUpRoot, shardArgs, captureMsg,
+                                     use_threads=True, use_cache=use_cache, **kwargs) for shardArgs in shardSteps]
+            if preCmds:
+                targetArgs = dict(mdcs, c="+".join(preCmds))
+                retVals, status = doWork(usrOutput, hstCleanUpRoot, targetArgs, captureMsg,
+                                         use_threads=use_threads, use_cache=use_cache, **kwargs)
+            for task in tasks:
+                if not task.result()[1]:
+                    status = False
+        if not status:
+            raise Exception(f"Err. MDCS/steps/({sId}) shard(s) failed, staging data is kept for review.")
+        target = os.path.join(os.path.join(hstCleanUpRoot, "output", usrOutput["path"]), mdcs["m"])
+        staging = [shardArgs["m"] for shardArgs in shardSteps]     # host paths, set by doWork.
+        merge = Base.DynaInvoke("arcpy.AddRastersToMosaicDataset_management", [target, "Table", ";".join(staging)],
+                                None, lambda msg, msgType=0: captureMsg.addMessage(msg))
+        if (not merge.init() or
+                not merge.invoke()):
+            raise Exception(f"Err. MDCS/steps/({sId}) failed to add the shards to ({target})")
+        retVals.append({"cmd": "AR", "output": target, "value": True})
+        for gdb in sorted(set([os.path.dirname(p) for p in staging])):
+            try:
+                arcpy.Delete_management(gdb)
+            except Exception as e:
+                captureMsg.addMessage(f"Err. Unable to remove the staging geodatabase ({gdb})/{e}")
+        if postCmds:
+            targetArgs = dict(mdcs, c="+".join(postCmds))
+            postVals, status = doWork(usrOutput, hstCleanUpRoot, targetArgs, captureMsg,
+                                      use_threads=use_threads, use_cache=use_cache, **kwargs)
+            retVals += postVals
+        return retVals, status
+    except Exception as e:
+        captureMsg.addMessage(f"Err. runShardStep/{e}")
+    return [], False
+
+
+StepRefPattern = re.compile(r'@([^/\s\[\]\(\)=$@\'"]+)')
+
+
+def getStepReferences(value):
+    """Returns all (@id) references found in the step values, e.g. @root/o/CM or @md.raster[0]"""
+    refs = []
+    if isinstance(value, str):
+        refs += StepRefPattern.findall(value)
+    elif isinstance(value, dict):
+        for v in value.values():
+            refs += getStepReferences(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            refs += getStepReferences(v)
+    return refs
+
+
+def getStepWorkers(build):
+    try:
+        return max(1, int(build.get(Workers, 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
+class StepGraph(object):
+    """Dependency graph of the job steps. A step depends on the earlier steps it references and on the earlier
+    MDCS/shard step writing to the same geodatabase, steps on different geodatabases can overlap.
+    Generic (gis) steps run on the scheduler thread and hold back the scheduling of other steps until they return."""
+
+    def __init__(self, steps, output=''):
+        import MDCS_Batch
+        self._deps = {}
+        gdbs = {}    # step id -> geodatabase key
+        lastOnGdb = {}  # geodatabase key -> id of the last step writing to it.
+        known = set()
+        for step in steps:
+            sId = step["id"]
+            deps = set()
+            refs = getStepReferences({k: v for k, v in step.items() if k not in ["id", "type", Enabled]})
+            p = sId.split('.')
+            if len(p) > 1:
+                refs.append('.'.join(p[:-1]))     # gis step invoked on the output of a parent step.
+            for ref in refs:
+                candidate = self._resolve(ref, known)
+                if candidate:
+                    deps.add(candidate)
+            explicit = step.get(Depends, [])
+            if isinstance(explicit, str):
+                explicit = [explicit]
+            deps.update(d for d in explicit if d in known)
+            args = step.get("args")
+            if (isinstance(args, dict) and
+                    str(step.get("type", "")).lower() in MDCS_Batch.MDCSStepTypes):
+                gdb = MDCS_Batch.getStepGeodatabase(args, output)
+                gdb = MDCS_Batch.getGeodatabaseKey(gdb) if gdb else self._getReferencedGeodatabase(args, known, gdbs)
+                if gdb:
+                    gdbs[sId] = gdb
+                    if gdb in lastOnGdb:
+                        deps.add(lastOnGdb[gdb])    # geodatabase schema locks, one step at a time.
+                    lastOnGdb[gdb] = sId
+            self._deps[sId] = deps
+            known.add(sId)
+
+    @staticmethod
+    def _resolve(ref, known):
+        """Returns the earlier step id (ref) refers to, i.e. (md) of @md.raster[0], or None."""
+        parts = ref.split('.')
+        while parts:
+            candidate = '.'.join(parts)
+            if candidate in known:
+                return candidate
+            parts.pop()
+        return None
+
+    def _getReferencedGeodatabase(self, args, known, gdbs):
+        """Returns the geodatabase of the step the (-m) or else the (-i) arg refers to, i.e. @root/o/CM"""
+        for flag in ["m", "i"]:
+            value = args.get(flag)
+            if (not isinstance(value, str) or
+                    not value.startswith('@')):
+                continue
+            refs = StepRefPattern.findall(value)
+            sId = self._resolve(refs[0], known) if refs else None
+            if sId in gdbs:
+                return gdbs[sId]
+        return None
+
+    def dependencies(self, sId):
+        return self._deps.get(sId, set())
+
+    def isReady(self, sId, done):
+        return self.dependencies(sId).issubset(done)
+
+
+def getProcessRSS():
+    """Returns the current resident set size of this process in MB or None if it can't be determined.
+    The peak RSS (getrusage) isn't used, it never drops once reached and would recycle the workers after every task."""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as reader:
+            pages = int(reader.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def initWarmWorker():
+    """Pool process initializer, pays for the arcpy/MDCS imports once per worker instead of once per step."""
+    import arcpy
+    import Base
+    import solutionsLib
+    import MDCS
+    LazyImport.load(arcpy)
+
+
+def runPooledTask(tracePath, fnc, *args):
+    """Runs (fnc) in a pool worker, tracing into the session (tracePath) of the submitting process if set."""
+    tracer.join(tracePath)
+    try:
+        return {"result": fnc(*args), "rss": getProcessRSS()}
+    finally:
+        tracer.join(None)
+
+
+def getPoolSettings(payload):
+    """Reads the optional pool settings from the job, e.g. "build": {"pool": {"size": 4, "max_tasks": 20, "max_rss_mb": 4096}}"""
+    settings = {}
+    try:
+        build = payload["job"]["params"]["build"]
+        settings = dict(build.get(Pool, {}))
+        size = getStepWorkers(build)
+        for step in build.get("steps", []):
+            if str(step.get("type", "")).lower() == ShardStep:
+                size = max(size, getShardCount(step))     # shards of a step run side by side.
+        settings.setdefault("size", size)
+    except (KeyError, TypeError, AttributeError):
+        pass
+    return settings
+
+
+class WarmPool(object):
+    """Long lived process pool of pre-initialized MDCS workers.
+    Workers are recycled after (max_tasks) tasks or once a worker grows beyond (max_rss_mb)."""
+
+    def __init__(self, size=1, max_tasks=0, max_rss_mb=0):
+        self.size = max(1, int(size))
+        self.max_tasks = max(0, int(max_tasks))
+        self.max_rss_mb = max(0, float(max_rss_mb))
+        self._executor = None
+        self._tasks = 0
+        self._native_recycle = False
+        self._lock = threading.Lock()   # steps scheduled concurrently share the pool.
+
+    def _getExecutor(self):
+        if self._executor is None:
+            import MDCS     # reference the pool functions by module, not by (__main__) when run as a script.
+            ctx = multiprocessing.get_context("spawn")   # arcpy isn't fork safe.
+            kwargs = {"max_workers": self.size, "mp_context": ctx, "initializer": MDCS.initWarmWorker}
+            self._native_recycle = False
+            if self.max_tasks:
+                try:
+                    self._executor = ProcessPoolExecutor(max_tasks_per_child=self.max_tasks, **kwargs)
+                    self._native_recycle = True
+                except TypeError:   # python < 3.11
+                    pass
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(**kwargs)
+            self._tasks = 0
+        return self._executor
+
+    def recycle(self):
+        """Retires the current workers once their running tasks complete, new tasks get fresh workers.
+        Must be called with the pool lock held."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _submit(self, fnc, *args):
+        with self._lock:
+            executor = self._getExecutor()
+            import MDCS
+            task = executor.submit(MDCS.runPooledTask, tracer.getPath(), fnc, *args)
+            self._tasks += 1
+        task.add_done_callback(functools.partial(self._onTaskDone, executor))     # outside the lock, it may run right away.
+        return executor, task
+
+    def _onTaskDone(self, executor, task):
+        """Recycles the workers once a task of (executor) reports an RSS beyond (max_rss_mb) or after (max_tasks) tasks per worker."""
+        if (task.cancelled() or
+                task.exception() is not None):
+            return
+        rss = task.result()["rss"]
+        with self._lock:
+            if executor is not self._executor:
+                return  # already recycled.
+            if (self.max_rss_mb and
+                    rss is not None and
+                    rss > self.max_rss_mb):
+                print(f'Recycling MDCS workers, RSS ({rss:.0f} MB) exceeds ({self.max_rss_mb:.0f} MB)')
+                self.recycle()
+            elif (self.max_tasks and
+                    not self._native_recycle and
+                    self._tasks >= self.max_tasks * self.size):
+                self.recycle()
+
+    def submit(self, fnc, *args):
+        """Returns the Future of (fnc)(*args), its result is {'result', 'rss'}"""
+        return self._submit(fnc, *args)[1]
+
+    def run(self, fnc, *args):
+        return self.submit(fnc, *args).result()["result"]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def getWarmPool(settings=None):
+    """Returns the pool of the (settings). Pools of other settings keep running, steps/jobs may still be submitting to them."""
+    settings = settings or {}
+    key = (max(1, int(settings.get("size", 1))),
+           max(0, int(settings.get("max_tasks", 0))),
+           max(0, float(settings.get("max_rss_mb", 0))))
+    with g_warm_pools_lock:
+        pool = g_warm_pools.get(key)
+        if pool is None:
+            pool = g_warm_pools[key] = WarmPool(*key)
+    return pool
+
+
+@atexit.register
+def shutdownWarmPool():
+    with g_warm_pools_lock:
+        pools = list(g_warm_pools.values())
+        g_warm_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
 class StepInfoMDCS():
+    """Step inputs/results store. Lookups use the (stepId, dir, cmd/param) index and the step-id prefix trie
+    kept up to date by addInput/addResults."""
+    CTRIE_END = None    # trie node key marking a complete step id.
+
     def __init__(self):
         pass
 
@@ -572,12 +1319,46 @@ class StepInfoMDCS():
         self._stepInput = {}
         self._stepId = None
         self._kwargs = kwargs
+        self._index = {}
+        self._indexKeys = {}
+        self._stepTrie = {}
+
+    def _setIndex(self, sId, sDir, entries):
+        """Replaces the (sDir) index entries of step (sId), first entry wins for duplicate commands/params."""
+        for key in self._indexKeys.pop((sId, sDir), []):
+            self._index.pop(key, None)
+        keys = []
+        for key, value in entries:
+            if key in self._index:
+                continue
+            self._index[key] = value
+            keys.append(key)
+        self._indexKeys[(sId, sDir)] = keys
+
+    def _addToTrie(self, sId):
+        node = self._stepTrie
+        for part in sId.split("."):
+            node = node.setdefault(part, {})
+        node[self.CTRIE_END] = sId
+
+    def resolveStepId(self, parts):
+        """Returns (stepId, length) for the longest known step id made up of the leading (parts) or (None, 0)."""
+        node = self._stepTrie
+        found = (None, 0)
+        for i, part in enumerate(parts):
+            node = node.get(part)
+            if node is None:
+                break
+            if self.CTRIE_END in node:
+                found = (node[self.CTRIE_END], i + 1)
+        return found
 
     def addInput(self, sId, sInput, **kwargs):
         if sInput is None or sId is None or not isinstance(sInput, dict):
             return None
         self._stepId = sId
         self._stepInput[self._stepId] = sInput
+        self._addToTrie(sId)
         for k in sInput:
             if isinstance(sInput[k], str) and sInput[k].startswith("@"):
                 self._stepInput[self._stepId][k] = self.getResults(sInput[k])
@@ -587,12 +1368,26 @@ class StepInfoMDCS():
                         sInput[k][i].startswith("@")):
                         value, key = sInput[k][i].split("$")
                         self._stepInput[self._stepId][k][i] = f"{self.getResults(value)}${key}"
+        params = sInput.get("p")
+        entries = []
+        if isinstance(params, list):
+            for it in params:
+                if (isinstance(it, str) and
+                        "$" in it):
+                    entries.append(((sId, "p", it.split("$")[-1]), it.split("$")[0]))
+        self._setIndex(sId, "p", entries)
         return self._stepInput
 
     def addResults(self, sId, stepVals):
         if sId not in self._stepInput:
             return False
         self._stepResult[sId] = stepVals
+        entries = []
+        if isinstance(stepVals, list):
+            for step in stepVals:
+                if "cmd" in step:
+                    entries.append(((sId, "o", step["cmd"]), step["output"] if "output" in step else None))
+        self._setIndex(sId, "o", entries)
         return True
 
     def getResults(self, key):
@@ -615,25 +1410,10 @@ class StepInfoMDCS():
         if sDir == "i":
             if sId in self._stepInput and sKey in self._stepInput[sId]:
                 if sKey == "p":
-                    for it in self._stepInput[sId][sKey]:
-                        if it.endswith(f"${subs[-1]}"):
-                            return it.split("$")[0]
-                    return None
+                    return self._index.get((sId, "p", subs[-1]))
                 return self._stepInput[sId][sKey]
             return None
-        if sId not in self._stepResult:
-            return None
-        steps = self._stepResult[sId]
-        if not isinstance(steps, list):
-            return None
-        value = None
-        for step in steps:
-            if "cmd" not in step:
-                continue
-            if step["cmd"] == sKey:
-                value = step["output"] if "output" in step else None
-                break
-        return value
+        return self._index.get((sId, "o", sKey))
 
     def getStepResults(self):
         return self._stepResult
@@ -652,95 +1432,267 @@ def getBooleanValue(value):
         return True
     return False
 
-def get_syntax_info(syntax, char, end_cnt, start_indx=0):
-    cnt_op = 0
-    cur_idx = cnt_idx = start_indx
-    while cur_idx < len(syntax):
-        if syntax[cur_idx:][0] == char:
-            cnt_op += 1
-            cnt_idx = cur_idx
-            if end_cnt != 0:
-                if cnt_op == end_cnt:
-                    cnt_idx += 1
-                    break
-        cur_idx += 1
-    return [cnt_op, cnt_idx]
+class StepExpressionError(Exception):
+    pass
 
-def parse_syntax(syntax):
-    if (not syntax or
-        not isinstance(syntax, str)):
-            return syntax
-    global stepInfo
-    last_hash = 0
-    while True:
-        indx = syntax.find('@', last_hash)
-        if -1 == indx:
-            break
-        last_hash = indx
-        last_hash += 1
-    cnt_idx = last_hash - 1
-    if cnt_idx == -1:
-        return syntax
-    if -1 != syntax.find('='):
-        blocks = syntax.split('=')
-        if blocks[-1][:1] == '@':
-            while len(blocks) > 1:
-                value = parse_syntax(blocks.pop())
-                if len(blocks) != 1:
-                    syn_upd = blocks.pop() + '=' + str(value)
-                    parse_syntax(syn_upd)
-                if len(blocks) == 1:
-                    syntax = blocks.pop() + '=' + str(value)
-                    break;
-    cnt_op, op_pos = get_syntax_info(syntax, '(', 0, cnt_idx)
-    cnt_cp, cp_pos = get_syntax_info(syntax, ')', cnt_op, cnt_idx)
-    cnt_ob, ob_pos = get_syntax_info(syntax, '[', 0, cnt_idx)
-    cnt_cb, cb_pos = get_syntax_info(syntax, ']', cnt_ob, cnt_idx)
-    max_pos = max(cp_pos, cb_pos)
-    inner_op = syntax[cnt_idx:max_pos]
-    print (inner_op)
-    # process
-    if not inner_op:    # no syntactic construct, i.e fnc()
-        inner_op = syntax
-    objs = inner_op.split('.')
-    if 1 == len(objs):     # handles syntax obj[0]['extent']
-        for k, v in stepInfo._stepInput.items():
-            k = f'@{k}'
-            if syntax.startswith(k):
-                objs[0] = k
-                objs.append(syntax[len(k):])
-                break
-    value = ''
-    try:
-        obj_id = objs.pop(0)
-        while objs:
-            gt_next = objs.pop(0)
-            id_upd = f'{obj_id}.{gt_next}'
-            if id_upd in stepInfo._stepInput:
-                obj_id = id_upd
+
+StepExprRefName = '__mdcs_ref_'
+StepExprIdPattern = re.compile(r'@([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)')
+StepExprPathPattern = re.compile(r'^@[^/\s]+/[io]/')    # @id/i|o/key lookups are resolved by StepInfoMDCS.addInput
+
+
+def splitStepAssignments(syntax):
+    """Splits (syntax) on the (=) signs that aren't within quotes/brackets or part of a comparison."""
+    blocks = []
+    depth = start = 0
+    quote = None
+    i = 0
+    while i < len(syntax):
+        c = syntax[i]
+        if quote:
+            if c == '\\':
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in '\'"':
+            quote = c
+        elif c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif (c == '=' and
+                not depth and
+                syntax[i + 1:i + 2] != '=' and
+                syntax[i - 1:i] not in ('=', '!', '<', '>')):
+            blocks.append(syntax[start:i])
+            start = i + 1
+        i += 1
+    blocks.append(syntax[start:])
+    return blocks
+
+
+def tokenizeStepExpression(expression):
+    """Replaces the (@id.attr) references outside of string literals with names python can parse. Returns (source, refs)."""
+    refs = []
+    out = []
+    quote = None
+    i = 0
+    while i < len(expression):
+        c = expression[i]
+        if quote:
+            if c == '\\':
+                out.append(expression[i:i + 2])
+                i += 2
                 continue
-            objs.insert(0, gt_next)
-            break
-        expression = inner_op[len(obj_id):]
-        obj = stepInfo.getResults(f'{obj_id}/o/{obj_id[1:]}')
-        if (expression and
-            -1 != expression.find('=') and
-            not cnt_op):    # skip fnc calls with params with = signs.
-            prop, value = expression.split('=')
-            setattr(obj, prop[1:], value)
+            if c == quote:
+                quote = None
+        elif c in '\'"':
+            quote = c
+        elif c == '@':
+            m = StepExprIdPattern.match(expression, i)
+            if m:
+                out.append(f'{StepExprRefName}{len(refs)}')
+                refs.append(m.group(1).split('.'))
+                i = m.end()
+                continue
+        out.append(c)
+        i += 1
+    return ''.join(out), refs
+
+
+def resolveStepReference(info, parts):
+    sId, i = info.resolveStepId(parts)     # step ids may contain dots, the longest known step id wins.
+    if sId is None:
+        raise StepExpressionError(f'Unknown step (@{".".join(parts)})')
+    obj = info.getResults(f'@{sId}/o/{sId}')
+    for attr in parts[i:]:
+        obj = getattr(obj, attr)
+    return obj
+
+
+def compileStepNode(node, refs):
+    """Returns a function(stepInfo) that evaluates the (ast) node. Only literals, step references, attributes,
+    subscripts and calls are supported."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda info: value
+    if isinstance(node, ast.Name):
+        if not node.id.startswith(StepExprRefName):
+            raise StepExpressionError(f'Unsupported name ({node.id})')
+        parts = refs[int(node.id[len(StepExprRefName):])]
+        return lambda info: resolveStepReference(info, parts)
+    if isinstance(node, ast.Attribute):
+        obj = compileStepNode(node.value, refs)
+        attr = node.attr
+        return lambda info: getattr(obj(info), attr)
+    if isinstance(node, ast.Subscript):
+        obj = compileStepNode(node.value, refs)
+        key = compileStepNode(node.slice, refs)
+        return lambda info: obj(info)[key(info)]
+    if type(node).__name__ == 'Index':     # python < 3.9
+        return compileStepNode(node.value, refs)
+    if isinstance(node, ast.Slice):
+        bounds = [None if n is None else compileStepNode(n, refs) for n in (node.lower, node.upper, node.step)]
+        return lambda info: slice(*[None if b is None else b(info) for b in bounds])
+    if isinstance(node, ast.Call):
+        fnc = compileStepNode(node.func, refs)
+        if [a for a in node.args if isinstance(a, ast.Starred)] or [k for k in node.keywords if k.arg is None]:
+            raise StepExpressionError('Unsupported (*/**) call arguments')
+        args = [compileStepNode(a, refs) for a in node.args]
+        kwargs = [(k.arg, compileStepNode(k.value, refs)) for k in node.keywords]
+        return lambda info: fnc(info)(*[a(info) for a in args], **{k: v(info) for k, v in kwargs})
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = [compileStepNode(n, refs) for n in node.elts]
+        container = {ast.List: list, ast.Tuple: tuple, ast.Set: set}[type(node)]
+        return lambda info: container([i(info) for i in items])
+    if isinstance(node, ast.Dict):
+        if None in node.keys:
+            raise StepExpressionError('Unsupported (**) dict unpacking')
+        items = [(compileStepNode(k, refs), compileStepNode(v, refs)) for k, v in zip(node.keys, node.values)]
+        return lambda info: {k(info): v(info) for k, v in items}
+    if (isinstance(node, ast.UnaryOp) and
+            isinstance(node.op, (ast.USub, ast.UAdd, ast.Not))):
+        operand = compileStepNode(node.operand, refs)
+        if isinstance(node.op, ast.USub):
+            return lambda info: -operand(info)
+        if isinstance(node.op, ast.UAdd):
+            return lambda info: +operand(info)
+        return lambda info: not operand(info)
+    raise StepExpressionError(f'Unsupported syntax ({type(node).__name__})')
+
+
+class StepExpression(object):
+    """Compiled step argument value, e.g. @gis.content.search('owner:me')[0] or @item.title=@other.title
+    Assignments set the (str) value of the right most block to each target on the left and return it.
+    Text before a reference, e.g. title_@x.title, is kept and the reference from the last (@) on is replaced by its value."""
+
+    def __init__(self, syntax, text=False):
+        self.syntax = syntax
+        self._value = None
+        self._targets = []
+        self._embedded = None   # (text before, step id parts, text after) of a reference within text.
+        self.value = syntax
+        if (text or
+                not syntax.lstrip().startswith('@')):
+            self._compileEmbedded(syntax)
+            return
+        blocks = splitStepAssignments(syntax)
+        self.value = blocks.pop()
+        if self.value.lstrip().startswith('@'):
+            try:
+                self._value = self._compile(self.value)
+            except StepExpressionError:
+                if blocks:
+                    raise
+                self._compileEmbedded(syntax)   # i.e. @x.title: @x.tags[0]
+                if (not self._embedded or
+                        not self._embedded[0].strip()):    # a single unsupported expression, i.e. @x.count + 1
+                    raise
+                return
+        self._targets = [self._compileTarget(b) for b in blocks]
+
+    def _compile(self, expression):
+        source, refs = tokenizeStepExpression(expression.strip())
+        try:
+            tree = ast.parse(source, mode='eval')
+        except SyntaxError as e:
+            raise StepExpressionError(f'{expression}/{e.msg}')
+        return compileStepNode(tree.body, refs)
+
+    def _compileEmbedded(self, syntax):
+        indx = syntax.rfind('@')
+        ref = StepExprIdPattern.match(syntax, indx)
+        if ref is None:
+            return
+        ends = [len(syntax)]
+        close = max(syntax.rfind(')'), syntax.rfind(']')) + 1     # text may follow the last call/subscript, e.g. a_@x.f(1)_b
+        if close > ref.end():
+            ends.append(close)
+        ends.append(ref.end())  # or the (@id.attr) reference, e.g. a_@x.title: b
+        for end in ends:
+            try:
+                self._value = self._compile(syntax[indx:end])
+            except StepExpressionError:
+                continue
+            self._embedded = (syntax[:indx], ref.group(1).split('.'), syntax[end:])
+            return
+
+    def _compileTarget(self, target):
+        if not target.lstrip().startswith('@'):
+            raise StepExpressionError(f'Invalid assignment target ({target})')
+        source, refs = tokenizeStepExpression(target.strip())
+        try:
+            node = ast.parse(source, mode='eval').body
+        except SyntaxError as e:
+            raise StepExpressionError(f'{target}/{e.msg}')
+        if (isinstance(node, ast.Name) and
+                node.id.startswith(StepExprRefName)):
+            parts = refs[int(node.id[len(StepExprRefName):])]
+            if len(parts) > 1:
+                obj = parts[:-1]
+                attr = parts[-1]
+                return lambda info, value: setattr(resolveStepReference(info, obj), attr, value)
+        if isinstance(node, ast.Attribute):
+            obj = compileStepNode(node.value, refs)
+            attr = node.attr
+            return lambda info, value: setattr(obj(info), attr, value)
+        if isinstance(node, ast.Subscript):
+            obj = compileStepNode(node.value, refs)
+            key = compileStepNode(node.slice, refs)
+            return lambda info, value: obj(info).__setitem__(key(info), value)
+        raise StepExpressionError(f'Invalid assignment target ({target})')
+
+    @property
+    def literal(self):
+        return self._value is None and not self._targets
+
+    def evaluate(self, info):
+        if self._embedded:
+            return self._evaluateEmbedded(info)
+        try:
+            value = self.value if self._value is None else self._value(info)
+            if self._targets:
+                value = str(value)
+                for target in reversed(self._targets):
+                    target(info, value)
             return value
-        value = eval(f'obj{expression}')         # setattr(obj, 'filename', 'chs') for =
-    except Exception as e:
-        print (f'Err. Invoking/{syntax}/*expression')
-    # ends
-    if (not isinstance(value, str) or
-        isinstance(value, (dict, list))):
+        except StepExpressionError:
+            raise
+        except Exception as e:
+            raise StepExpressionError(f'{self.syntax}/{e}')
+
+    def _evaluateEmbedded(self, info):
+        prefix, parts, suffix = self._embedded
+        if info.resolveStepId(parts)[0] is None:
+            return self.syntax  # not a step, i.e. user@domain.com
+        try:
+            value = self._value(info)
+        except Exception as e:
+            raise StepExpressionError(f'{self.syntax}/{e}')
+        if not isinstance(value, str):
             return value
-    final_value = syntax[:cnt_idx] + value
-    if cnt_idx != max_pos:
-        final_value += syntax[max_pos:]
-    print (final_value)
-    return parse_syntax(final_value)
+        if '@' in prefix:
+            prefix = str(compileStepExpression(prefix, True).evaluate(info))
+        return prefix + value + suffix
+
+
+@functools.lru_cache(maxsize=1024)
+def compileStepExpression(syntax, text=False):
+    return StepExpression(syntax, text)
+
+
+def parse_syntax(syntax):
+    """Returns the value of a step argument. Values with (@) step expressions are compiled once and evaluated against the
+    current step info, others are returned as is."""
+    if (not syntax or
+        not isinstance(syntax, str) or
+        '@' not in syntax or
+            StepExprPathPattern.match(syntax)):
+        return syntax
+    expression = compileStepExpression(syntax)
+    if expression.literal:
+        return syntax
+    return expression.evaluate(stepInfo)
 
 class NBAccess():
 
@@ -793,10 +1745,7 @@ class NBAccess():
         return False
 
     def run(self):
-        argv = [__file__,
-                f'-j:{json.dumps(self._payload)}'
-                ]
-        self._response = main(len(argv), argv)
+        self._response = run_step(StepSpec(job=self._payload))
         return self._response
 
     def __get_response(self, job_id, command, key):
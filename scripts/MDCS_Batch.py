@@ -0,0 +1,277 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: MDCS_Batch.py
+# Description: Runs many MDCS jobs in parallel. Jobs on the same geodatabase are serialized.
+# Version: 20261017
+# Requirements: ArcGIS 10.1 SP1
+# Required Arguments: -j:<jobs.jsonl|folder of .job files|- for stdin>
+# Usage: python.exe MDCS_Batch.py -j:<jobs> -w:<Optional:workers> -o:<Optional:report.json> -trace:<Optional:path>
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from defusedxml import minidom
+
+solutionLib_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(solutionLib_path)
+hstCleanUpRoot = os.path.dirname(solutionLib_path)
+GeodatabaseExts = ('.gdb', '.sde')
+MDCSStepTypes = ('mdcs', 'shard')    # job step types writing to a geodatabase, (shard) steps add to their (-m) target.
+
+
+def readJobs(source):
+    """Returns [(name, payload)] from a JSONL file/stream (one job per line) or a folder of .job files."""
+    jobs = []
+    if os.path.isdir(source):
+        for f in sorted(os.listdir(source)):
+            if not f.lower().endswith('.job'):
+                continue
+            with open(os.path.join(source, f)) as reader:
+                jobs.append((f, json.load(reader)))
+        return jobs
+    reader = sys.stdin if source == '-' else open(source)
+    try:
+        for i, line in enumerate(reader):
+            line = line.strip()
+            if not line:
+                continue
+            jobs.append(('line {}'.format(i + 1), json.loads(line)))
+    finally:
+        if reader is not sys.stdin:
+            reader.close()
+    return jobs
+
+
+def getGeodatabasePath(path):
+    """Returns the path up to and including the (.gdb/.sde) component or None."""
+    parts = path.replace('\\', '/').split('/')
+    for i, part in enumerate(parts):
+        if part.lower().endswith(GeodatabaseExts):
+            return '/'.join(parts[:i + 1])
+    return None
+
+
+def getConfigGeodatabase(config):
+    try:
+        doc = minidom.parse(config)
+        values = []
+        for key in ['WorkspacePath', 'Geodatabase']:
+            nodes = doc.getElementsByTagName(key)
+            if (nodes.length == 0 or
+                    nodes[0].firstChild is None):
+                return None
+            values.append(nodes[0].firstChild.data.strip())
+        gdb = values[1]
+        if not gdb.lower().endswith(GeodatabaseExts):
+            gdb += '.gdb'
+        return os.path.join(values[0], gdb)
+    except Exception:
+        return None
+
+
+def getStepGeodatabase(args, output):
+    """Returns the geodatabase an MDCS step writes to, using its (-m) arg or the config's WorkspacePath/Geodatabase.
+    None if unknown, i.e. the values are (@) references to an earlier step."""
+    gdb = None
+    md = args.get('m')
+    if (isinstance(md, str) and
+            not md.startswith('@')):
+        gdb = getGeodatabasePath(os.path.join(output, md))
+    if gdb is None:
+        config = args.get('i')
+        if (isinstance(config, str) and
+                not config.startswith('@')):
+            gdb = getConfigGeodatabase(os.path.join(hstCleanUpRoot, config))
+    return gdb
+
+
+def getJobGeodatabases(payload):
+    """Returns the set of geodatabases the job writes to, using the (-m) step args or the config's WorkspacePath/Geodatabase."""
+    keys = set()
+    try:
+        params = payload['job']['params']
+        output = os.path.join(hstCleanUpRoot, 'output', params['output']['path'])
+        steps = params['build']['steps']
+    except (KeyError, TypeError):
+        return keys
+    for step in steps:
+        args = step.get('args')
+        if (not isinstance(args, dict) or
+                str(step.get('type', '')).lower() not in MDCSStepTypes):
+            continue
+        gdb = getStepGeodatabase(args, output)     # references resolve to a gdb of an earlier step of the same job.
+        if gdb:
+            keys.add(getGeodatabaseKey(gdb))
+    return keys
+
+
+def runBatchJob(payload):
+    """Pool task, runs a single job and returns its (status, response)."""
+    import MDCS
+    response = MDCS.run_step(MDCS.StepSpec(job=payload))
+    status = bool(response)
+    if status:
+        for step in response:
+            for retVals in step.values():
+                if (not retVals or
+                        False in [cmd.get('value') for cmd in retVals]):
+                    status = False
+    return {'status': status, 'response': response}
+
+
+def getGeodatabaseKey(gdb):
+    return os.path.normcase(os.path.abspath(gdb))
+
+
+def getPoolSettings(jobs):
+    """Returns the worker recycling settings of the batch pool, the lowest (max_tasks)/(max_rss_mb) set by the "pool" of the (jobs)"""
+    import MDCS
+    settings = {}
+    for name, payload in jobs:
+        for key, value in MDCS.getPoolSettings(payload).items():
+            if key not in ('max_tasks', 'max_rss_mb'):
+                continue    # the batch (workers) set the pool size.
+            try:
+                value = int(value) if key == 'max_tasks' else float(value)
+            except (TypeError, ValueError):
+                continue
+            if (value > 0 and
+                    (key not in settings or value < settings[key])):
+                settings[key] = value
+    return settings
+
+
+def schedule(tasks, workers, fnc, label='Job', settings=None):
+    """Runs (fnc)(task['payload']) for each of the (tasks) [{'id', 'source', 'payload', 'gdbs'}] on the warm pool, (workers) at a time.
+    Tasks on the same geodatabase(s) run one after another. (fnc) must return {'status', 'response'}, returns the report.
+    (settings) are the pool's (max_tasks)/(max_rss_mb) worker recycling settings."""
+    import MDCS
+    pool = MDCS.getWarmPool(dict(settings or {}, size=workers))
+    report = []
+    pending = list(tasks)
+    busy = set()
+    running = {}
+    t0 = time.time()
+    while pending or running:
+        for job in list(pending):
+            if len(running) >= workers:
+                break
+            if job['gdbs'] & busy:
+                continue    # FGDBs don't allow concurrent writers, wait for the job holding it.
+            pending.remove(job)
+            busy |= job['gdbs']
+            job['start'] = time.time()
+            running[pool.submit(fnc, job['payload'])] = job
+            print('Started {} ({}) {}'.format(label.lower(), job['id'], ', '.join(sorted(job['gdbs']))))
+        if not running:
+            break
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for task in finished:
+            job = running.pop(task)
+            busy -= job['gdbs']
+            status = False
+            error = None
+            try:
+                status = task.result()['result']['status']
+            except Exception as e:
+                error = str(e)
+            duration = time.time() - job['start']
+            report.append({'id': job['id'], 'source': job['source'], 'status': status, 'duration': round(duration, 3),
+                           'gdbs': sorted(job['gdbs']), 'error': error})
+            print('{} ({}) {} in {:.1f}s{}'.format(label, job['id'], 'OK' if status else 'Failed!', duration,
+                                                  '' if error is None else ' ({})'.format(error)))
+    elapsed = time.time() - t0
+    succeeded = len([r for r in report if r['status']])
+    summary = {
+        'jobs': len(report),
+        'succeeded': succeeded,
+        'failed': len(report) - succeeded,
+        'elapsed': round(elapsed, 3),
+        'jobs_per_minute': round(len(report) * 60 / elapsed, 3) if elapsed else 0,
+        'workers': workers
+    }
+    print('Done. {jobs} {label}(s), {succeeded} succeeded, {failed} failed in {elapsed}s ({jobs_per_minute} {label}s/min)'.format(
+        label=label.lower(), **summary))
+    return {'summary': summary, 'jobs': report}
+
+
+def run(jobs, workers):
+    import MDCS_Batch   # reference the task by module, not by (__main__) when run as a script.
+    tasks = []
+    for name, payload in jobs:
+        try:
+            jobId = payload['job']['id']
+        except (KeyError, TypeError):
+            jobId = name
+        tasks.append({'id': jobId, 'source': name, 'payload': payload, 'gdbs': getJobGeodatabases(payload)})
+    return schedule(tasks, workers, MDCS_Batch.runBatchJob, settings=getPoolSettings(jobs))
+
+
+def main(argc, argv):
+    if argc < 2:
+        print("\nMDCS_Batch.py\nUsage: MDCS_Batch.py -j:<jobs.jsonl|folder|-> -w:<Optional:workers> -o:<Optional:report.json> -trace:<Optional:path>"
+              "\n\n-j: A JSONL file/stream (- for stdin) with one MDCS job per line or a folder of .job files"
+              "\n-w: Number of jobs to run in parallel, defaults to the number of CPUs"
+              "\n-o: Path to write the JSON report to"
+              "\n-trace: Write a performance trace of all jobs to [path].json (Chrome trace) and [path].csv"
+              "\n\nNote: Jobs writing to the same geodatabase run one after another.")
+        return False
+    source = reportPath = tracePath = None
+    workers = os.cpu_count() or 1
+    for arg in argv[1:]:
+        values = arg.split(':')
+        flag = values.pop(0).lower()
+        value = ':'.join(values).strip()
+        if flag == '-j':
+            source = value
+        elif flag == '-w':
+            try:
+                workers = max(1, int(value))
+            except ValueError:
+                print('Err. Invalid -w value ({})'.format(value))
+                return False
+        elif flag == '-o':
+            reportPath = value
+        elif flag == '-trace':
+            tracePath = value
+    if not source:
+        print('Err. -j is not specified.')
+        return False
+    try:
+        jobs = readJobs(source)
+    except (OSError, ValueError) as e:
+        print('Err. {}'.format(e))
+        return False
+    session = None
+    if tracePath:
+        sys.path.append(os.path.join(solutionLib_path, 'SolutionsLog'))
+        import tracer
+        session = tracer.enable(tracePath)   # pool tasks carry the session, workers join the same trace.
+    report = run(jobs, workers)
+    if session:
+        session.finish()
+    if reportPath:
+        with open(reportPath, 'w') as writer:
+            json.dump(report, writer, indent=4)
+    return report['summary']['failed'] == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main(len(sys.argv), sys.argv) else 1)
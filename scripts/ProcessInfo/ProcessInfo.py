@@ -19,25 +19,17 @@
 # Author: Esri Imagery Workflows team
 #------------------------------------------------------------------------------
 #!/usr/bin/env python
-from xml.dom import minidom
 import os
 import Base
+import ConfigModel
+import DOMTracker
+
+ProcessesPath = ('Application', 'Workspace', 'MosaicDataset', 'Processes')
 
 
 class ProcessInfo(Base.Base):
 
     def __init__(self, base=None):
-        self.m_hsh_parent_child_nodes = \
-            {
-                'addindex':
-                {'parent': 'addindex',
-                    'child': 'index'
-                 },
-                'calculatevalues':
-                {'parent': 'calculatevalues',
-                    'child': 'calculatevalue'
-                 }
-            }
         self.m_base = base
         self.setLog(base.m_log)
 
@@ -52,103 +44,53 @@ class ProcessInfo(Base.Base):
         return self.init(self.config)
 
     def init(self, config):
-        self.hasProcessInfo = False
-        self.userProcessInfoValues = False
-        self.processInfo = {}
-        self.userProcessInfo = {}
+        self.config = config
         self.processInfo = {}
         self.userProcessInfo = {}
         self.hasProcessInfo = False
         self.userProcessInfoValues = False
 
-        self.config = config
-        self.processInfo = {}
-        self.hasProcessInfo = False
-
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        self.m_tracker = self.m_base.getDOMTracker()
+        self.m_version = self.m_tracker.version if self.m_tracker else 0
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("Error: <MosaicDataset> node is not found! Invalid schema.",
                      self.const_critical_text)
             return False
-
-        try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-
-                    if(node.nodeName == 'Processes'):
-
-                        for node in node.childNodes:
-                            if (node is not None and
-                                    node.nodeType == minidom.Node.ELEMENT_NODE):
-
-                                procesName = node.nodeName
-                                procesName = procesName.lower()
-
-                                if (procesName in self.m_hsh_parent_child_nodes.keys()):
-                                    parentNode = self.m_hsh_parent_child_nodes[procesName]['parent']
-                                    childNode = self.m_hsh_parent_child_nodes[procesName]['child']
-
-                                    if ((parentNode in self.processInfo.keys()) == False):
-                                        self.processInfo[parentNode] = []
-
-                                    aryCV = []
-
-                                    for node in node.childNodes:
-                                        if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-
-                                            key = node.nodeName.lower()
-                                            if (key == childNode):
-                                                hashCV = {}
-
-                                                for node in node.childNodes:
-                                                    if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                                                        keyName = node.nodeName.lower()
-                                                        value = '#'  # set GP tool default value for argument.
-                                                        try:
-                                                            value = node.firstChild.nodeValue
-                                                        except:
-                                                            Warning_ = True
-                                                        hashCV[keyName] = value
-                                                aryCV.append(hashCV)
-                                    self.processInfo[parentNode].append(aryCV)
-                                    continue
-
-                                if ((procesName in self.processInfo.keys()) == False):
-                                    self.processInfo[procesName] = []
-
-                                hashCV = {}
-                                for node in node.childNodes:
-                                    if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-
-                                        key = node.nodeName
-                                        key = key.lower()
-
-                                        value = '#'  # set GP tool default value for argument.
-                                        try:
-                                            if (self.userProcessInfoValues):
-                                                value = self.userProcessInfo[procesName][key]
-                                                if (value == '#'):
-                                                    value = ''
-                                                if (node.childNodes.length == 0):
-                                                    node.appendChild(self.m_base.m_doc.createTextNode(value))
-                                                node.firstChild.nodeValue = value
-
-                                            value = node.firstChild.nodeValue
-                                        except:
-                                            Warning_ = True
-
-                                        hashCV[key] = value
-                                self.processInfo[procesName].append(hashCV)
-
-        except Exception as inst:
-            self.log("Error: Reading <MosaicDataset> node.",
-                     self.const_critical_text)
-            return False
-
+        # process name -> [{key: value}] by the command index, [({key: value},)] for (addindex, calculatevalues)
+        self.processInfo = {k: list(entries) for k, entries in model.md.processes.items()}
         if (len(self.processInfo) > 0):
             self.hasProcessInfo = True
+        return True
 
-        self.userProcessInfoValues = False
-
+    def refresh(self):
+        """Re-reads only the processes whose nodes were mutated since the last init/refresh. Returns [True|False]"""
+        tracker = self.m_base.getDOMTracker()
+        if (tracker is None or
+                tracker is not getattr(self, 'm_tracker', None)):
+            return self.init(self.config)   # new document.
+        changed = tracker.changedSince(self.m_version)
+        if not changed:
+            return True
+        keys = set()
+        for path in changed:
+            if not DOMTracker.isAffected([path], ProcessesPath):
+                continue
+            if len(path) <= len(ProcessesPath):
+                return self.init(self.config)   # <Processes> or one of its parents itself changed.
+            keys.add(path[len(ProcessesPath)].lower())
+        self.m_version = tracker.version
+        if not keys:
+            return True
+        mdNode = ConfigModel.getMosaicDatasetNode(self.m_base.m_doc)
+        if mdNode is None:
+            return self.init(self.config)
+        processes = ConfigModel.MosaicDatasetModel.getProcesses(mdNode, keys)
+        for key in keys:
+            if key in processes:
+                self.processInfo[key] = processes[key]
+            else:
+                self.processInfo.pop(key, None)
+        self.hasProcessInfo = len(self.processInfo) > 0
+        self.log('Refreshed process info ({})'.format(', '.join(sorted(keys))), self.const_general_text)
         return True
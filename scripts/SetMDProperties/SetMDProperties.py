@@ -21,7 +21,6 @@
 #!/usr/bin/env python
 
 import os
-from xml.dom import minidom
 import Base
 import arcpy
 import numpy as np
@@ -508,36 +507,26 @@ class SetMDProperties(Base.Base):
 
 
     def init(self, config):
-
-        Nodelist = self.m_base.m_doc.getElementsByTagName("MosaicDataset")
-        if (Nodelist.length == 0):
+        model = self.m_base.getConfigModel()
+        if (model.md is None):
             self.log("Error: MosaicDataset node not found! Invalid schema.", self.const_critical_text)
             return False
 
-        try:
-            for node in Nodelist[0].childNodes:
-                node = node.nextSibling
-                if (node is not None and node.nodeType == minidom.Node.ELEMENT_NODE):
-                    if (node.nodeName == 'DefaultProperties'):
-                        for node in node.childNodes:
-                            ptvalue = node.firstChild.nodeValue if node.firstChild else ''
-                            if (node.nodeType == minidom.Node.ELEMENT_NODE):
-                                if (node.nodeName == 'processing_templates' or
-                                        node.nodeName == 'default_processing_template'):
-                                    if (ptvalue != '#' and
-                                            ptvalue != ''):
-                                        ptvaluesplit = ptvalue.split(';')
-                                        rftpaths = ''
-                                        for each in ptvaluesplit:
-                                            if (each.find('/') == -1):
-                                                if (each.lower() == 'none'):        # 'none' is an acceptable value.
-                                                    rftpaths = rftpaths + each
-                                                else:
-                                                    rftpaths = rftpaths + os.path.abspath(os.path.join((self.m_base.const_raster_function_templates_path_), each))
-                                                rftpaths += ';'
-                                        ptvalue = rftpaths = rftpaths[:-1]
-                                self.dic_properties_lst[node.nodeName] = ptvalue
-        except:
-            Error = True
+        for name, ptvalue in model.md.default_properties:
+            if (name == 'processing_templates' or
+                    name == 'default_processing_template'):
+                if (ptvalue != '#' and
+                        ptvalue != ''):
+                    ptvaluesplit = ptvalue.split(';')
+                    rftpaths = ''
+                    for each in ptvaluesplit:
+                        if (each.find('/') == -1):
+                            if (each.lower() == 'none'):        # 'none' is an acceptable value.
+                                rftpaths = rftpaths + each
+                            else:
+                                rftpaths = rftpaths + os.path.abspath(os.path.join((self.m_base.const_raster_function_templates_path_), each))
+                            rftpaths += ';'
+                    ptvalue = rftpaths = rftpaths[:-1]
+            self.dic_properties_lst[name] = ptvalue
 
         return True
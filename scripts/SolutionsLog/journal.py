@@ -0,0 +1,114 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: journal.py
+# Description: Append-only journal of the MDCS command chain to resume failed runs.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+const_rec_start = 'start'
+const_rec_resume = 'resume'
+const_rec_command = 'command'
+
+
+class Journal(object):
+
+    def __init__(self, folder, name, config=None):
+        self.path = os.path.join(folder, '{}.journal'.format(name))
+        self.config_hash = self.getConfigHash(config)
+
+    @staticmethod
+    def getConfigHash(config):
+        hsh = hashlib.sha256()
+        if (config and
+                os.path.isfile(config)):
+            with open(config, 'rb') as reader:
+                hsh.update(reader.read())
+        return hsh.hexdigest()
+
+    def _write(self, record):
+        record['time'] = datetime.now().isoformat()
+        record['config_hash'] = self.config_hash
+        try:
+            folder = os.path.dirname(self.path)
+            if (folder and
+                    not os.path.exists(folder)):
+                os.makedirs(folder, exist_ok=True)
+            with open(self.path, 'a') as writer:
+                writer.write(json.dumps(record, default=str) + '\n')
+                writer.flush()
+                os.fsync(writer.fileno())     # the record must survive a crash of the next command.
+        except (OSError, TypeError, ValueError) as e:
+            print('Err. Journal/{}'.format(e))
+            return False
+        return True
+
+    def _read(self):
+        records = []
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path) as reader:
+            for line in reader:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break   # a partially written last record.
+        return records
+
+    def start(self, chain):
+        return self._write({'type': const_rec_start, 'chain': chain})
+
+    def resume(self, chain):
+        """Returns the {(position, command): record} of the commands that succeeded in the last run of the same chain/config.
+        Returns None if there's nothing to resume."""
+        session = None
+        for record in self._read():
+            rec_type = record.get('type')
+            if rec_type == const_rec_start:
+                session = None
+                if (record.get('chain') == chain and
+                        record.get('config_hash') == self.config_hash):
+                    session = {}
+                continue
+            if (session is None or
+                    rec_type != const_rec_command):
+                continue
+            if record.get('status') is True:
+                session[(record['index'], record['cmd'])] = record
+        if session is None:
+            return None
+        self._write({'type': const_rec_resume, 'chain': chain})
+        return session
+
+    def command(self, index, cmd, status, output, last_AT_ObjectID):
+        return self._write(
+            {
+                'type': const_rec_command,
+                'index': index,
+                'cmd': cmd,
+                'status': status,
+                'output': output,
+                'last_AT_ObjectID': last_AT_ObjectID
+            })
@@ -244,7 +244,7 @@ class Logger(object):
                     recordUpdated += '.xml'
             # try to create the log-folder if not found!
             if (os.path.exists(self.logFolder) == False):
-                os.mkdir(self.logFolder)
+                os.makedirs(self.logFolder, exist_ok=True)     # concurrent steps may race to create it.
             logPath = os.path.join(self.logFolder, recordUpdated)
             c = open(logPath, "w")
             c.write(doc.toprettyxml())
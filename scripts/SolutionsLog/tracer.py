@@ -0,0 +1,269 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: tracer.py
+# Description: Nested timing spans (job/step/command/gptool) exported as Chrome trace-event JSON and CSV.
+# Version: 20261017
+# Requirements: Python
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import os
+import csv
+import glob
+import json
+import time
+import threading
+from datetime import datetime
+
+const_fragment_ext = '.part'
+const_max_arg_len = 256
+
+g_tracer = None
+
+
+def getPeakRSS():
+    """Returns the peak resident memory of this process in MB or None."""
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024    # KB on linux
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def summarize(value):
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    value = str(value)
+    if len(value) > const_max_arg_len:
+        value = value[:const_max_arg_len] + '..'
+    return value
+
+
+class NullSpan(object):
+
+    def set(self, key, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class Span(object):
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def set(self, key, value):
+        """Adds/updates an arg of the span while it's open."""
+        if self.args is None:
+            self.args = {}
+        self.args[key] = value
+
+    def __enter__(self):
+        stack = self.tracer._getStack()
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        stack.append(self)
+        self.ts = time.time()
+        self.t0 = time.perf_counter()
+        self.cpu0 = time.thread_time()
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        wall = time.perf_counter() - self.t0
+        cpu = time.thread_time() - self.cpu0
+        stack = self.tracer._getStack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        args = {k: summarize(v) for k, v in (self.args or {}).items()}
+        args.update({
+            'cpu_s': round(cpu, 6),
+            'peak_rss_mb': getPeakRSS(),
+            'depth': self.depth,
+            'parent': self.parent
+        })
+        if excType is not None:
+            args['error'] = summarize(exc)
+        self.tracer._add({
+            'name': str(self.name),
+            'cat': self.cat,
+            'ph': 'X',
+            'ts': int(self.ts * 1000000),
+            'dur': int(wall * 1000000),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args
+        }, self.depth == 0)
+        return False
+
+
+class Tracer(object):
+
+    def __init__(self, path):
+        self.path = path
+        self._events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _getStack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def span(self, name, cat, args=None):
+        return Span(self, name, cat, args)
+
+    def _add(self, event, flush):
+        with self._lock:
+            self._events.append(event)
+            if flush:   # pool workers don't run atexit handlers, persist once each outermost span closes.
+                self._flush()
+
+    def _flush(self):
+        if not self._events:
+            return True
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open('{}.{}{}'.format(self.path, os.getpid(), const_fragment_ext), 'a') as writer:
+                for event in self._events:
+                    writer.write(json.dumps(event, default=str) + '\n')
+            self._events = []
+        except (OSError, TypeError, ValueError) as e:
+            print('Err. Tracer/{}'.format(e))
+            return False
+        return True
+
+    def finish(self):
+        """Merges the trace fragments of all processes into (path).json (Chrome trace-event format) and (path).csv"""
+        with self._lock:
+            self._flush()
+        events = []
+        fragments = sorted(glob.glob('{}.*{}'.format(glob.escape(self.path), const_fragment_ext)))
+        for fragment in fragments:
+            with open(fragment) as reader:
+                for line in reader:
+                    line = line.strip()
+                    if line:
+                        try:
+                            events.append(json.loads(line))
+                        except ValueError:
+                            pass    # a worker killed mid write.
+        events.sort(key=lambda e: (e['ts'], -e['dur']))
+        try:
+            with open(self.path + '.json', 'w') as writer:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, writer)
+            with open(self.path + '.csv', 'w', newline='') as writer:
+                fields = ['pid', 'tid', 'depth', 'cat', 'name', 'parent', 'start', 'wall_s', 'cpu_s', 'peak_rss_mb', 'args']
+                rows = csv.writer(writer)
+                rows.writerow(fields)
+                for e in events:
+                    args = dict(e['args'])
+                    rows.writerow([
+                        e['pid'],
+                        e['tid'],
+                        args.pop('depth', ''),
+                        e['cat'],
+                        e['name'],
+                        args.pop('parent', ''),
+                        datetime.fromtimestamp(e['ts'] / 1000000).isoformat(),
+                        e['dur'] / 1000000,
+                        args.pop('cpu_s', ''),
+                        args.pop('peak_rss_mb', ''),
+                        json.dumps(args, default=str)
+                    ])
+        except OSError as e:
+            print('Err. Tracer/{}'.format(e))
+            return False
+        for fragment in fragments:
+            try:
+                os.remove(fragment)
+            except OSError:
+                pass
+        return True
+
+
+def readDurations(path):
+    """Returns {(cat, name): mean wall seconds} of the spans in an earlier trace (path).csv, e.g. ('command', 'AR')"""
+    path = os.path.splitext(path)[0] + '.csv'
+    totals = {}
+    with open(path, newline='') as reader:
+        for row in csv.DictReader(reader):
+            try:
+                wall = float(row['wall_s'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            total = totals.setdefault((row.get('cat'), row.get('name')), [0.0, 0])
+            total[0] += wall
+            total[1] += 1
+    return {k: round(v[0] / v[1], 3) for k, v in totals.items()}
+
+
+def enable(path):
+    """Starts a trace session writing to (path).json/.csv, returns the Tracer."""
+    global g_tracer
+    g_tracer = Tracer(os.path.abspath(os.path.splitext(path)[0]))
+    return g_tracer
+
+
+def disable():
+    global g_tracer
+    g_tracer = None
+
+
+def getPath():
+    """Returns the path of the current trace session or None. Passed with each pool task for the worker to (join)."""
+    return g_tracer.path if g_tracer is not None else None
+
+
+def join(path):
+    """Pool workers trace into the session (path) of the submitting process, (path) None turns tracing off."""
+    global g_tracer
+    if path is None:
+        g_tracer = None
+    elif (g_tracer is None or
+            g_tracer.path != path):
+        g_tracer = Tracer(path)
+    return g_tracer
+
+
+def get():
+    """Returns the Tracer of this process or None if tracing is off."""
+    return g_tracer
+
+
+def span(name, cat, args=None):
+    """Returns a context manager timing the enclosed block, e.g. with tracer.span('AR', 'command'):"""
+    tracer = get()
+    if tracer is None:
+        return g_null_span
+    return tracer.span(name, cat, args)
+
+
+g_null_span = NullSpan()
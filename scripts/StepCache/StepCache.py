@@ -0,0 +1,194 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: StepCache.py
+# Description: Content addressed cache of MDCS job step results.
+# Version: 20261017
+# Requirements: Python
+# Usage: python.exe StepCache.py -clear [-key:<step_key>] [-step:<step_id>] [-r:<cache_folder>]
+#        python.exe StepCache.py -list [-r:<cache_folder>]
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import hashlib
+from datetime import datetime
+
+scriptPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DefCacheFolder = os.path.join(os.path.dirname(scriptPath), 'cache/steps')
+
+
+class StepCache(object):
+    # step args that don't change the step output.
+    CVOLATILE_KEYS = ['__step__', '__job__', 'l']
+    CKEY_CONFIG = 'i'
+    CKEY_SOURCES = 's'
+    CEXT = '.json'
+
+    def __init__(self, root=None):
+        self.m_root = root if root else DefCacheFolder
+
+    def _getPaths(self, value):
+        if not value:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        paths = []
+        for v in value:
+            paths += [p.strip() for p in str(v).split(';') if p.strip()]
+        return paths
+
+    def getKey(self, args):
+        """Returns the hash of the resolved step args, the config bytes, the dynamic params and the state of the sources."""
+        hsh = hashlib.sha256()
+        stepArgs = {k: v for k, v in args.items() if k not in self.CVOLATILE_KEYS}
+        hsh.update(json.dumps(stepArgs, sort_keys=True, default=str).encode('utf-8'))
+        config = args.get(self.CKEY_CONFIG)
+        if config and os.path.isfile(config):
+            with open(config, 'rb') as reader:
+                hsh.update(reader.read())
+        for path in self._getPaths(args.get(self.CKEY_SOURCES)):
+            self._updateSource(hsh, path)
+        return hsh.hexdigest()
+
+    def _updateSource(self, hsh, path):
+        """Adds the state of the source (path) to (hsh). Folders are walked, a folder's own mtime doesn't change when files in its subfolders do."""
+        try:
+            info = os.stat(path)
+            hsh.update(f'{path}|{info.st_mtime_ns}|{info.st_size}'.encode('utf-8'))
+        except OSError:
+            hsh.update(f'{path}|missing'.encode('utf-8'))
+            return
+        if not os.path.isdir(path):
+            return
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for f in sorted(files):
+                filePath = os.path.join(root, f)
+                try:
+                    info = os.stat(filePath)
+                    hsh.update(f'{os.path.relpath(filePath, path)}|{info.st_mtime_ns}|{info.st_size}'.encode('utf-8'))
+                except OSError:
+                    pass    # removed while walking.
+
+    def _getPath(self, key):
+        return os.path.join(self.m_root, key + self.CEXT)
+
+    def get(self, key, exists=None):
+        """Returns the cached (retVals) or None. (exists) is used to verify the cached outputs are still there."""
+        path = self._getPath(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as reader:
+                entry = json.load(reader)
+        except (OSError, ValueError):
+            return None
+        retVals = entry.get('retVals')
+        if not retVals:
+            return None
+        if exists:
+            for cmd in retVals:
+                output = cmd.get('output')
+                if (isinstance(output, str) and
+                        os.path.isabs(output) and
+                        not exists(output)):
+                    return None
+        return retVals
+
+    def put(self, key, stepId, retVals):
+        try:
+            os.makedirs(self.m_root, exist_ok=True)
+            entry = {
+                'key': key,
+                'step': stepId,
+                'created': datetime.now().isoformat(),
+                'retVals': retVals
+            }
+            tmpPath = self._getPath(key) + '.{}.tmp'.format(os.getpid())
+            with open(tmpPath, 'w') as writer:
+                json.dump(entry, writer)
+            os.replace(tmpPath, self._getPath(key))     # readers never see a partial entry.
+        except (OSError, TypeError, ValueError) as e:
+            print(f'Err. StepCache/{e}')
+            return False
+        return True
+
+    def entries(self):
+        if not os.path.isdir(self.m_root):
+            return []
+        values = []
+        for f in sorted(os.listdir(self.m_root)):
+            if not f.endswith(self.CEXT):
+                continue
+            try:
+                with open(os.path.join(self.m_root, f)) as reader:
+                    entry = json.load(reader)
+                values.append(entry)
+            except (OSError, ValueError):
+                values.append({'key': f[:-len(self.CEXT)]})
+        return values
+
+    def invalidate(self, key=None, stepId=None):
+        """Removes the entries matching (key) / (stepId), all entries if neither is given. Returns the count removed."""
+        removed = 0
+        for entry in self.entries():
+            if key and entry.get('key') != key:
+                continue
+            if stepId and entry.get('step') != stepId:
+                continue
+            try:
+                os.remove(self._getPath(entry['key']))
+                removed += 1
+            except OSError as e:
+                print(f'Err. {e}')
+        return removed
+
+
+def main(argc, argv):
+    if argc < 2:
+        print("\nStepCache.py\nUsage: StepCache.py -clear [-key:<step_key>] [-step:<step_id>] [-r:<cache_folder>]"
+              "\n       StepCache.py -list [-r:<cache_folder>]")
+        return False
+    root = key = stepId = None
+    com = ''
+    for arg in argv[1:]:
+        values = arg.split(':')
+        flag = values.pop(0).lower()
+        value = ':'.join(values).strip()
+        if flag == '-clear' or flag == '-list':
+            com = flag[1:]
+        elif flag == '-key':
+            key = value
+        elif flag == '-step':
+            stepId = value
+        elif flag == '-r':
+            root = value
+    cache = StepCache(root)
+    if com == 'list':
+        for entry in cache.entries():
+            print('{}\t{}\t{}'.format(entry.get('key'), entry.get('step', ''), entry.get('created', '')))
+        return True
+    if com == 'clear':
+        print('Removed ({}) cached step result(s) from ({})'.format(cache.invalidate(key, stepId), cache.m_root))
+        return True
+    print('Err. Unknown command!')
+    return False
+
+
+if __name__ == '__main__':
+    main(len(sys.argv), sys.argv)
@@ -0,0 +1,118 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: benchmark_startup.py
+# Description: Measures the MDCS.py process startup/run time. Not used by MDCS directly.
+# Version: 20261017
+# Requirements: Python
+# Usage: python.exe benchmark_startup.py -n:<Optional:runs> -python:<Optional:python.exe> -gp:<Optional:MDCS.py flags of the GP run>
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+#!/usr/bin/env python
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import statistics
+import subprocess
+
+scriptPath = os.path.dirname(os.path.abspath(__file__))
+MDCSPath = os.path.join(scriptPath, 'MDCS.py')
+DefaultRuns = 5
+DefaultConfig = os.path.join(os.path.dirname(scriptPath), 'Parameter/Config/Amberg1.xml')
+UserFunction = 'sample01'   # MDCS_UC function without any arcpy calls.
+
+
+def getScenarios(gpArgs, folder):
+    logs = '-l:{}/'.format(os.path.join(folder, 'logs'))
+    return [
+        ('help', []),   # usage screen
+        ('user_function', ['-c:{}'.format(UserFunction), logs]),
+        # -plan resolves all commands and loads arcpy without writing any data. Use (-gp) to time an actual build.
+        ('gp', gpArgs + [logs] if gpArgs else ['-i:{}'.format(DefaultConfig), '-plan:{}'.format(os.path.join(folder, 'plan.json')), logs])
+    ]
+
+
+def timeRun(python, args, env):
+    start = time.perf_counter()
+    proc = subprocess.run([python, MDCSPath] + args, cwd=scriptPath, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    elapsed = time.perf_counter() - start
+    return (elapsed, proc.returncode, proc.stderr.decode(errors='replace'))
+
+
+def run(runs, python, gpArgs):
+    env = dict(os.environ)
+    env.pop('MDCS_DEV_RELOAD', None)
+    folder = tempfile.mkdtemp(prefix='mdcs_startup_')
+    report = {'python': python, 'runs': runs, 'scenarios': {}}
+    try:
+        for name, args in getScenarios(gpArgs, folder):
+            timeRun(python, args, env)  # warm up the file system cache/(.pyc) files.
+            times = []
+            codes = set()
+            for i in range(0, runs):
+                (elapsed, code, err) = timeRun(python, args, env)
+                times.append(elapsed)
+                codes.add(code)
+            report['scenarios'][name] = {
+                'args': args,
+                'min_s': round(min(times), 3),
+                'median_s': round(statistics.median(times), 3),
+                'mean_s': round(statistics.mean(times), 3),
+                'exit_codes': sorted(codes)
+            }
+            print('{:<14} min {:>7.3f}s  median {:>7.3f}s  mean {:>7.3f}s  exit {}'.format(
+                name, min(times), statistics.median(times), statistics.mean(times), sorted(codes)))
+            if (name != 'help' and
+                    codes != {0}):
+                print('  last stderr:\n  {}'.format(err.strip()[-1000:]))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return report
+
+
+def main(argv):
+    runs = DefaultRuns
+    python = sys.executable
+    gpArgs = []
+    output = ''
+    for arg in argv[1:]:
+        (values) = arg.split(':')
+        flag = values.pop(0).lower()
+        value = ':'.join(values).strip()
+        if flag == '-n':
+            runs = max(1, int(value))
+        elif flag == '-python':
+            python = value
+        elif flag == '-gp':
+            gpArgs = value.split()
+        elif flag == '-o':
+            output = value
+        else:
+            print('Usage: benchmark_startup.py -n:<Optional:runs> -python:<Optional:python.exe> '
+                  '-gp:<Optional:"MDCS.py flags of the GP run"> -o:<Optional:report.json>')
+            return 1
+    report = run(runs, python, gpArgs)
+    if output:
+        with open(output, 'w') as writer:
+            json.dump(report, writer, indent=4)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -22,14 +22,42 @@
 
 import os
 import sys
+import importlib
 scriptPath = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.join(scriptPath, 'Base'))
+sys.path.append(os.path.join(scriptPath, 'SolutionsLog'))
 import Base
-import arcpy
+import DOMTracker
+import Planner
+from journal import Journal
+import tracer
+import arcpy     # (Base) registers it to import on the first use.
 from defusedxml import minidom
 from string import ascii_letters, digits
 from datetime import datetime
-from inspect import signature
+
+# argument rules of the tool commands, i.e. Solutions.commands[com]['args']
+ArgMD = 'md'                    # (#) defaults to the mosaic dataset path.
+ArgMDProcess = 'md_process'     # (#) defaults to the mosaic dataset path suffixed with the process key.
+ArgDLPK = 'dlpk'                # relative to (Parameter/DLPKpackages)
+ArgACS = 'acs'                  # (.acs) file names relative to (Parameter/ACSFiles)
+# config paths re-read into (Base) when a user function edits them.
+WorkspacePaths = [
+    ('Application', 'Workspace', 'WorkspacePath'),
+    ('Application', 'Workspace', 'Geodatabase'),
+    ('Application', 'Workspace', 'MosaicDataset', 'Name')
+]
+
+class Component(object):
+    """Imports the component module (name) on the first access, i.e. CreateMD only when (CM) runs."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        module = importlib.import_module(self.name)
+        Planner.patch()     # components first imported while planning record their calls too.
+        return module
 
 
 def returnLevelDetails(tilingSchema):
@@ -74,8 +102,9 @@ class Solutions(Base.Base):
         self.userInfo = None
         self.config = ''
 
-    def getAvailableCommands(self):
-        return self.commands
+    @classmethod
+    def getAvailableCommands(cls):
+        return cls.commands
 
     def __invokeDynamicFnCallback(self, args, fn_name=None):
         if (fn_name is None):
@@ -101,12 +130,7 @@ class Solutions(Base.Base):
 
     def __invokeDynamicFn(self, args, processKey, fn_name, index, **kwargs):
         try:
-            nspce = fn_name.split(".")
-            cls = nspce.pop()
-            fnc_ptr = getattr(sys.modules[".".join(nspce)], cls)
-            varnames = list(signature(fnc_ptr).parameters)
-            varcount = len(signature(fnc_ptr).parameters)
-            varnames = varnames[:varcount]
+            varnames = Base.resolveTool(fn_name)[1]
             for i in range(len(args), len(varnames)):
                 args.append(
                     self.getProcessInfoValue(
@@ -172,2501 +196,1898 @@ class Solutions(Base.Base):
 
     # mapping commands to functions
     def executeCommand(self, com, index=0):
-        # create the geodatabse to hold all relevant mosaic datasets.
-        fullPath = os.path.join(
-            self.m_base.m_geoPath,
-            self.m_base.m_mdName)        # MD path used in the MDCS w/f
-        invokeDynamicFnInfo = {
-            'md': fullPath
-        }
-        if (com == 'CM'):
-            createMD = self.CreateMD.CreateMD(self.m_base)
-            bSuccess = createMD.init(self.config)
-            if (bSuccess):
-                bSuccess = self.m_base._getResponseResult(
-                    createMD.createGeodataBase())
-                if (not bSuccess):
-                    return False
-                return createMD.createMD()
+        command = self.commands.get(com)
+        if command is None:
+            return self._invokeUserCommand(com, index)
+        return command['fnc'](self, com, index)
+
+    def _invokeUserCommand(self, com, index=0):
+        # The command could be a user defined function externally defined
+        # in the module (MDCS_UC.py). Let's invoke it.
+        if Planner.isActive():
+            Planner.skip('user function')
+            return True
+        data = self.m_base.m_data
+        data['useResponse'] = False
+        tracker = self.m_base.getDOMTracker()
+        version = tracker.version if tracker else 0
+        bSuccess = self.m_base.invoke_user_function(com, data)
+        if ('useResponse' in data and
+                data['useResponse']):
+            response = {'response': data['response']}
+            if ('code' in data):
+                response['code'] = data['code']
+            if ('status' in data):
+                response['status'] = data['status']
+            elif (isinstance(data['response'], dict) and
+                    'status' in data['response']):
+                response['status'] = data['response']['status']
+            else:
+                response['status'] = bSuccess
+            if (not bSuccess):
+                return response
+        if (bSuccess):
+            changed = tracker.changedSince(version) if tracker else []
+            if [p for p in WorkspacePaths if DOMTracker.isAffected(changed, p)]:
+                model = self.m_base.getConfigModel()
+                mosaicDataset = model.md.name if model.md else ''
+                workspace = (model.workspace_path or '').strip()
+                geoDatabase = (model.geodatabase or '').strip()
+                mkGeoPath = '{}{}'.format(
+                    os.path.join(
+                        workspace, geoDatabase), self.m_base.const_geodatabase_ext.lower() if (
+                        not geoDatabase.lower().endswith(
+                            self.m_base.const_geodatabase_ext.lower()) and not geoDatabase.lower().endswith('sde')) else '').replace(
+                    '\\', '/')
+                self.m_base.m_geodatabase = geoDatabase
+                self.m_base.m_workspace = workspace
+                data['mosaicdataset'] = self.m_base.m_mdName = mosaicDataset
+                data['workspace'] = self.m_base.m_geoPath = mkGeoPath
+            # Update internal data structures if user function has
+            # modifield the in-memory xml dom.
+            ret = True if not self.config else self.processInfo.refresh()
+            if ('useResponse' in data and
+                    data['useResponse']):
+                response = {'response': data['response']}
+                if ('code' in data):
+                    # Optional, any user defined code regardless of the
+                    # function status.
+                    response['code'] = data['code']
+                if ('status' in data):
+                    # Overall function status, i.e. True or False
+                    response['status'] = data['status']
+                return response
+            return ret
+        return False
+
+    def _getCommandArg(self, processKey, key, rule, index):
+        value = self.getProcessInfoValue(processKey, key, index)
+        if rule is None:
+            return value
+        fullPath = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
+        if rule == ArgMD:
+            return fullPath if value == '#' else value
+        if rule == ArgMDProcess:
+            return f'{fullPath}{processKey}' if value == '#' else value
+        if rule == ArgDLPK:
+            return os.path.join(self.m_base.const_workspace_path_, 'Parameter/DLPKpackages', value)
+        if rule == ArgACS:
+            paths = []
+            for path in value.split(';'):
+                if (path.find('.acs') > -1 and
+                        path.find('/') == -1):
+                    path = os.path.join(self.m_base.const_workspace_path_, 'Parameter/ACSFiles', path)
+                paths.append(path)
+            return ';'.join(paths)
+        return value
+
+    def _invokeToolCommand(self, com, index):
+        """Runs the arcpy tool of a declarative (commands) entry. Args not given by (first_arg/args) are read from the process info using the tool's parameter names."""
+        command = self.commands[com]
+        self.m_log.Message(
+            command.get('msg', "\t{desc}:{md}").format(
+                desc=command['desc'],
+                md=self.m_base.m_mdName),
+            self.m_log.const_general_text)
+        processKey = command['process']
+        try:
+            args = []
+            if 'first_arg' in command:
+                args.append(os.path.join(
+                    self.m_base.m_geoPath,
+                    command['first_arg'].format(md=self.m_base.m_mdName)))
+            for arg in command.get('args', []):
+                key, rule = arg if isinstance(arg, tuple) else (arg, None)
+                args.append(self._getCommandArg(processKey, key, rule, index))
+        except BaseException as exp:
+            self.log(str(exp), self.m_log.const_critical_text)
             return False
+        kwargs = {}
+        if command.get('md_default'):
+            # info = to pass extra args to the fnc '__invokeDynamicFn'
+            kwargs['info'] = {
+                'md': os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
+            }
+        return self.__invokeDynamicFn(args, processKey, command['tool'], index, **kwargs)
+
+    def _cmd_CM(self, com, index):
+        createMD = self.CreateMD.CreateMD(self.m_base)
+        bSuccess = createMD.init(self.config)
+        if (bSuccess):
+            bSuccess = self.m_base._getResponseResult(
+                createMD.createGeodataBase())
+            if (not bSuccess):
+                return False
+            return createMD.createMD()
+        return False
 
     # Add custom fields to elevation mosaic datasets.
-        elif (com == 'AF'):
-            addFields = self.AddFields.AddFields(self.m_base)
-            bSuccess = addFields.init(self.config)
-            if (bSuccess):
-                return addFields.CreateFields()
-            return False
+    def _cmd_AF(self, com, index):
+        addFields = self.AddFields.AddFields(self.m_base)
+        bSuccess = addFields.init(self.config)
+        if (bSuccess):
+            return addFields.CreateFields()
+        return False
 
     # Add rasters/data to mosaic datasets.
-        elif (com == 'AR'):
-            addRasters = self.AddRasters.AddRasters(self.m_base)
-            bSuccess = addRasters.init(self.config)
-            if (bSuccess):
-                if (com in self.userInfo.keys()):
-                    if ('cb' in self.userInfo[com].keys()):
-                        bSuccess = addRasters.AddCallBack(
-                            self.userInfo[com]['cb'])
-                return addRasters.AddRasters()
-            return False
+    def _cmd_AR(self, com, index):
+        addRasters = self.AddRasters.AddRasters(self.m_base)
+        bSuccess = addRasters.init(self.config)
+        if (bSuccess):
+            if (com in self.userInfo.keys()):
+                if ('cb' in self.userInfo[com].keys()):
+                    bSuccess = addRasters.AddCallBack(
+                        self.userInfo[com]['cb'])
+            return addRasters.AddRasters()
+        return False
 
     # Create referenced mosaic datasets.
-        elif(com == 'CR'):
-            createRefMD = self.CreateRefMD.CreateReferencedMD(self.m_base)
-            bSuccess = createRefMD.init(self.config)
-            if (bSuccess):
-                return createRefMD.createReferencedMD()
-            return False
-
-        elif(com == 'SP'):
-            setProps = self.SetMDProperties.SetMDProperties(self.m_base)
-            bSuccess = setProps.init(self.config)
-            if (bSuccess):
-                path = os.path.join(
-                    self.m_base.m_geoPath,
-                    self.m_base.m_mdName)
-                return setProps.setMDProperties(path)
-            return False
-
-        elif (com == 'CBMD'):
-            try:
-                self.m_log.Message(
-                    "\tColor Balancing mosaic dataset : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'colorbalancemosaicdataset'
-                arcpy.ColorBalanceMosaicDataset_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'balancing_method', index), self.getProcessInfoValue(
-                        processKey, 'color_surface_type', index), self.getProcessInfoValue(
-                        processKey, 'target_raster', index), self.getProcessInfoValue(
-                        processKey, 'exclude_raster', index), self.getProcessInfoValue(
-                        processKey, 'stretch_type', index), self.getProcessInfoValue(
-                            processKey, 'gamma', index), self.getProcessInfoValue(
-                                processKey, 'block_field', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+    def _cmd_CR(self, com, index):
+        createRefMD = self.CreateRefMD.CreateReferencedMD(self.m_base)
+        bSuccess = createRefMD.init(self.config)
+        if (bSuccess):
+            return createRefMD.createReferencedMD()
+        return False
 
-    # Remove Index from Mosaic dataset.
-        elif (com == 'RI'):
-            fullPath = os.path.join(
+    def _cmd_SP(self, com, index):
+        setProps = self.SetMDProperties.SetMDProperties(self.m_base)
+        bSuccess = setProps.init(self.config)
+        if (bSuccess):
+            path = os.path.join(
                 self.m_base.m_geoPath,
                 self.m_base.m_mdName)
-            processKey = 'removeindex'
-            try:
-                self.log(
-                    "Removing Index(%s) " %
-                    (self.getProcessInfoValue(
-                        processKey,
-                        'index_name',
-                        index)))
-                arcpy.RemoveIndex_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'index_name', index))
-                self.log(arcpy.GetMessages())
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-    # Remove raster/Items from Mosaic dataset.
-        elif (com == 'RRFMD'):
-            try:
-                self.m_log.Message(
-                    "\tRemove rasters from mosaic dataset : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'removerastersfrommosaicdataset'
-                arcpy.RemoveRastersFromMosaicDataset_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'where_clause', index), self.getProcessInfoValue(
-                        processKey, 'update_boundary', index), self.getProcessInfoValue(
-                        processKey, 'mark_overviews_items', index), self.getProcessInfoValue(
-                        processKey, 'delete_overview_images', index), self.getProcessInfoValue(
-                        processKey, 'delete_item_cache', index), self.getProcessInfoValue(
-                            processKey, 'remove_items', index), self.getProcessInfoValue(
-                                processKey, 'update_cellsize_ranges', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-    # Delete mosaic dataset.
-        elif (com == 'DMD'):
-            try:
-                self.m_log.Message(
-                    "\tDelete Mosaic dataset  : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'deletemosaicdataset'
-                arcpy.DeleteMosaicDataset_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'delete_overview_images', index), self.getProcessInfoValue(
-                        processKey, 'delete_item_cache', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-    # Merge mosaic dataset
-        elif (com == 'MMDI'):
-            try:
-                self.m_log.Message(
-                    "\tMerge mosaic dataset  Items: " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'mergemosaicdatasetitems'
-                arcpy.MergeMosaicDatasetItems_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'where_clause', index), self.getProcessInfoValue(
-                        processKey, 'block_field', index), self.getProcessInfoValue(
-                        processKey, 'max_rows_per_merged_items', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif (com == 'ERF'):
-            try:
-                self.m_log.Message(
-                    "\tEditing raster function : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                processKey = 'editrasterfunction'
-                rfunction_path = self.getProcessInfoValue(
-                    processKey, 'function_chain_definition', index)
-                if (rfunction_path.find('.rft') > -
-                        1 and rfunction_path.find('/') == -1):
-                    rfunction_path = self.m_base.const_raster_function_templates_path_ + "/" + rfunction_path
-
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-
-                lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
-                expression = "OBJECTID >%s" % (
-                    str(self.m_base.m_last_AT_ObjectID))
-                arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
-
-                arcpy.EditRasterFunction_management(
-                    lyrName, self.getProcessInfoValue(
-                        processKey, 'edit_mosaic_dataset_item', index), self.getProcessInfoValue(
-                        processKey, 'edit_options', index), rfunction_path, self.getProcessInfoValue(
-                        processKey, 'location_function_name', index), )
-
-                arcpy.Delete_management(lyrName)
-
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+            return setProps.setMDProperties(path)
+        return False
 
-        elif (com == 'ANCP'):
+    def _cmd_CBMD(self, com, index):
+        try:
             self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
+                "\tColor Balancing mosaic dataset : " +
+                self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'analyzecontrolpoints',
-                'arcpy.AnalyzeControlPoints_management',
-                index
-            )
-        elif (com == 'APCP'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'appendcontrolpoints',
-                'arcpy.AppendControlPoints_management ',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'colorbalancemosaicdataset'
+            arcpy.ColorBalanceMosaicDataset_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'balancing_method', index), self.getProcessInfoValue(
+                    processKey, 'color_surface_type', index), self.getProcessInfoValue(
+                    processKey, 'target_raster', index), self.getProcessInfoValue(
+                    processKey, 'exclude_raster', index), self.getProcessInfoValue(
+                    processKey, 'stretch_type', index), self.getProcessInfoValue(
+                        processKey, 'gamma', index), self.getProcessInfoValue(
+                            processKey, 'block_field', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'ABA'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'applyblockadjustment',
-                'arcpy.ApplyBlockAdjustment_management',
-                index
-            )
+    # Remove Index from Mosaic dataset.
+    def _cmd_RI(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'removeindex'
+        try:
+            self.log(
+                "Removing Index(%s) " %
+                (self.getProcessInfoValue(
+                    processKey,
+                    'index_name',
+                    index)))
+            arcpy.RemoveIndex_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'index_name', index))
+            self.log(arcpy.GetMessages())
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CBA'):
+    # Remove raster/Items from Mosaic dataset.
+    def _cmd_RRFMD(self, com, index):
+        try:
             self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
+                "\tRemove rasters from mosaic dataset : " +
+                self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computeblockadjustment',
-                'arcpy.ComputeBlockAdjustment_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'removerastersfrommosaicdataset'
+            arcpy.RemoveRastersFromMosaicDataset_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'where_clause', index), self.getProcessInfoValue(
+                    processKey, 'update_boundary', index), self.getProcessInfoValue(
+                    processKey, 'mark_overviews_items', index), self.getProcessInfoValue(
+                    processKey, 'delete_overview_images', index), self.getProcessInfoValue(
+                    processKey, 'delete_item_cache', index), self.getProcessInfoValue(
+                        processKey, 'remove_items', index), self.getProcessInfoValue(
+                            processKey, 'update_cellsize_ranges', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CCP'):
+    # Delete mosaic dataset.
+    def _cmd_DMD(self, com, index):
+        try:
             self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
+                "\tDelete Mosaic dataset  : " +
+                self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computecontrolpoints',
-                'arcpy.ComputeControlPoints_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'deletemosaicdataset'
+            arcpy.DeleteMosaicDataset_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'delete_overview_images', index), self.getProcessInfoValue(
+                    processKey, 'delete_item_cache', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CTP'):
+    # Merge mosaic dataset
+    def _cmd_MMDI(self, com, index):
+        try:
             self.m_log.Message(
-                "\tCompute Tie Points : " +
+                "\tMerge mosaic dataset  Items: " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computetiepoints',
-                'arcpy.ComputeTiePoints_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'mergemosaicdatasetitems'
+            arcpy.MergeMosaicDatasetItems_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'where_clause', index), self.getProcessInfoValue(
+                    processKey, 'block_field', index), self.getProcessInfoValue(
+                    processKey, 'max_rows_per_merged_items', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'AMDS'):
+    def _cmd_ERF(self, com, index):
+        try:
             self.m_log.Message(
-                "\tAlter Mosaic Dataset Schema : " +
+                "\tEditing raster function : " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
+            processKey = 'editrasterfunction'
+            rfunction_path = self.getProcessInfoValue(
+                processKey, 'function_chain_definition', index)
+            if (rfunction_path.find('.rft') > -
+                    1 and rfunction_path.find('/') == -1):
+                rfunction_path = self.m_base.const_raster_function_templates_path_ + "/" + rfunction_path
+
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'altermosaicdatasetschema',
-                'arcpy.AlterMosaicDatasetSchema_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+
+            lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
+            expression = "OBJECTID >%s" % (
+                str(self.m_base.m_last_AT_ObjectID))
+            arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
+
+            arcpy.EditRasterFunction_management(
+                lyrName, self.getProcessInfoValue(
+                    processKey, 'edit_mosaic_dataset_item', index), self.getProcessInfoValue(
+                    processKey, 'edit_options', index), rfunction_path, self.getProcessInfoValue(
+                    processKey, 'location_function_name', index), )
+
+            arcpy.Delete_management(lyrName)
+
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'AMD'):
+    def _cmd_CS(self, com, index):
+        try:
             self.m_log.Message(
-                r"\Analyze Mosaic Dataset : " +
+                "\tCalculate statistic for the mosaic dataset : " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'analyzemosaicdataset',
-                'arcpy.AnalyzeMosaicDataset_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'calculatestatistics'
+            arcpy.CalculateStatistics_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'x_skip_factor', index), self.getProcessInfoValue(
+                    processKey, 'y_skip_factor', index), self.getProcessInfoValue(
+                    processKey, 'ignore_values', index), self.getProcessInfoValue(
+                    processKey, 'skip_existing', index), self.getProcessInfoValue(
+                    processKey, 'area_of_interest', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'BMDIC'):
+    def _cmd_BPS(self, com, index):
+        try:
             self.m_log.Message(
-                r"\Build Mosaic Dataset Item Cache : " +
+                "\tBuilding Pyramids and Calculating Statistic for the mosaic dataset : " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'buildmosaicdatasetitemcache',
-                'arcpy.BuildMosaicDatasetItemCache_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'buildpyramidsandstatistics'
+
+            lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
+            expression = "OBJECTID >%s" % (
+                str(self.m_base.m_last_AT_ObjectID))
+            arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
+
+            arcpy.BuildPyramidsandStatistics_management(
+                lyrName, self.getProcessInfoValue(
+                    processKey, 'include_subdirectories', index), self.getProcessInfoValue(
+                    processKey, 'build_pyramids', index), self.getProcessInfoValue(
+                    processKey, 'calculate_statistics', index), self.getProcessInfoValue(
+                    processKey, 'BUILD_ON_SOURCE', index), self.getProcessInfoValue(
+                    processKey, 'block_field', index), self.getProcessInfoValue(
+                        processKey, 'estimate_statistics', index), self.getProcessInfoValue(
+                            processKey, 'x_skip_factor', index), self.getProcessInfoValue(
+                                processKey, 'y_skip_factor', index), self.getProcessInfoValue(
+                                    processKey, 'ignore_values', index), self.getProcessInfoValue(
+                                        processKey, 'pyramid_level', index), self.getProcessInfoValue(
+                                            processKey, 'SKIP_FIRST', index), self.getProcessInfoValue(
+                                                processKey, 'resample_technique', index), self.getProcessInfoValue(
+                                                    processKey, 'compression_type', index), self.getProcessInfoValue(
+                                                        processKey, 'compression_quality', index), self.getProcessInfoValue(
+                                                            processKey, 'skip_existing', index))
+
+            arcpy.Delete_management(lyrName)
+
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CDA'):
+    def _cmd_BP(self, com, index):
+        try:
             self.m_log.Message(
-                r"\Compute Dirty Area : " +
+                "\tBuilding Pyramid for the mosaic dataset/raster dataset : " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computedirtyarea',
-                'arcpy.ComputeDirtyArea_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'buildpyramids'
+            arcpy.BuildPyramids_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'pyramid_level', index), self.getProcessInfoValue(
+                    processKey, 'SKIP_FIRST', index), self.getProcessInfoValue(
+                    processKey, 'resample_technique', index), self.getProcessInfoValue(
+                    processKey, 'compression_type', index), self.getProcessInfoValue(
+                    processKey, 'compression_quality', index), self.getProcessInfoValue(
+                        processKey, 'skip_existing', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'GEA'):
+    def _cmd_BF(self, com, index):
+        try:
             self.m_log.Message(
-                r"\Generate Exclude Area : " +
+                "\tRecomputing footprint for the mosaic dataset: " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'generateexcludearea',
-                'arcpy.GenerateExcludeArea_management',
-                index
-            )
-
-        elif (com == 'CS'):
-            try:
-                self.m_log.Message(
-                    "\tCalculate statistic for the mosaic dataset : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'calculatestatistics'
-                arcpy.CalculateStatistics_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'x_skip_factor', index), self.getProcessInfoValue(
-                        processKey, 'y_skip_factor', index), self.getProcessInfoValue(
-                        processKey, 'ignore_values', index), self.getProcessInfoValue(
-                        processKey, 'skip_existing', index), self.getProcessInfoValue(
-                        processKey, 'area_of_interest', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif (com == 'BPS'):
-            try:
-                self.m_log.Message(
-                    "\tBuilding Pyramids and Calculating Statistic for the mosaic dataset : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'buildpyramidsandstatistics'
-
-                lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
-                expression = "OBJECTID >%s" % (
-                    str(self.m_base.m_last_AT_ObjectID))
-                arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
-
-                arcpy.BuildPyramidsandStatistics_management(
-                    lyrName, self.getProcessInfoValue(
-                        processKey, 'include_subdirectories', index), self.getProcessInfoValue(
-                        processKey, 'build_pyramids', index), self.getProcessInfoValue(
-                        processKey, 'calculate_statistics', index), self.getProcessInfoValue(
-                        processKey, 'BUILD_ON_SOURCE', index), self.getProcessInfoValue(
-                        processKey, 'block_field', index), self.getProcessInfoValue(
-                            processKey, 'estimate_statistics', index), self.getProcessInfoValue(
-                                processKey, 'x_skip_factor', index), self.getProcessInfoValue(
-                                    processKey, 'y_skip_factor', index), self.getProcessInfoValue(
-                                        processKey, 'ignore_values', index), self.getProcessInfoValue(
-                                            processKey, 'pyramid_level', index), self.getProcessInfoValue(
-                                                processKey, 'SKIP_FIRST', index), self.getProcessInfoValue(
-                                                    processKey, 'resample_technique', index), self.getProcessInfoValue(
-                                                        processKey, 'compression_type', index), self.getProcessInfoValue(
-                                                            processKey, 'compression_quality', index), self.getProcessInfoValue(
-                                                                processKey, 'skip_existing', index))
+            fullPath = os.path.join(
+                self.m_base.m_geoPath, self.m_base.m_mdName)
 
-                arcpy.Delete_management(lyrName)
+            processKey = 'buildfootprint'
 
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+            isQuery = False
+            query = self.getProcessInfoValue(
+                processKey, 'where_clause', index)
+            if (len(query) > 0 and
+                    query != '#'):
+                isQuery = True
 
-        elif(com == 'BP'):
-            try:
-                self.m_log.Message(
-                    "\tBuilding Pyramid for the mosaic dataset/raster dataset : " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'buildpyramids'
-                arcpy.BuildPyramids_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'pyramid_level', index), self.getProcessInfoValue(
-                        processKey, 'SKIP_FIRST', index), self.getProcessInfoValue(
-                        processKey, 'resample_technique', index), self.getProcessInfoValue(
-                        processKey, 'compression_type', index), self.getProcessInfoValue(
-                        processKey, 'compression_quality', index), self.getProcessInfoValue(
-                            processKey, 'skip_existing', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+            expression = "OBJECTID >%s" % (
+                str(self.m_base.m_last_AT_ObjectID))
+            if (isQuery):
+                expression += ' AND %s' % (query)
 
-        elif(com == 'BF'):
-            try:
-                self.m_log.Message(
-                    "\tRecomputing footprint for the mosaic dataset: " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-
-                processKey = 'buildfootprint'
-
-                isQuery = False
-                query = self.getProcessInfoValue(
-                    processKey, 'where_clause', index)
-                if (len(query) > 0 and
-                        query != '#'):
-                    isQuery = True
-
-                expression = "OBJECTID >%s" % (
-                    str(self.m_base.m_last_AT_ObjectID))
-                if (isQuery):
-                    expression += ' AND %s' % (query)
-
-                args = []
-                args.append(fullPath)
-                args.append(expression)
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'reset_footprint',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'min_data_value',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'max_data_value',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'approx_num_vertices',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'shrink_distance',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'maintain_edges',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'skip_derived_images',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'update_boundary',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'request_size',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'min_region_size',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'simplification_method',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'edge_tolerance',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'max_sliver_size',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'min_thinness_ratio',
-                        index))
-
-                setBuitFootprints = Base.DynaInvoke(
-                    'arcpy.BuildFootprints_management', args, None, self.m_log.Message)
-                if (setBuitFootprints.init() == False):
-                    return False
-                return setBuitFootprints.invoke()
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif (com == 'BS'):
-            try:
-                self.m_log.Message(
-                    "\tBuild Seamline for the mosaic dataset: " +
-                    self.m_base.m_mdName,
-                    self.m_log.const_general_text)
-                fullPath = os.path.join(
-                    self.m_base.m_geoPath, self.m_base.m_mdName)
-                processKey = 'buildseamlines'
-                args = []
-                args.append(fullPath)
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey, 'cell_size', index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'sort_method',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey, 'sort_order', index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'order_by_attribute',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'order_by_base_value',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey, 'view_point', index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'computation_method',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'blend_width',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey, 'blend_type', index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'request_size',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'request_size_type',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'blend_width_units',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'area_of_interest',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'where_clause',
-                        index))
-                args.append(
-                    self.getProcessInfoValue(
-                        processKey,
-                        'update_existing',
-                        index))
+            args = []
+            args.append(fullPath)
+            args.append(expression)
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'reset_footprint',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'min_data_value',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'max_data_value',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'approx_num_vertices',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'shrink_distance',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'maintain_edges',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'skip_derived_images',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'update_boundary',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'request_size',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'min_region_size',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'simplification_method',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'edge_tolerance',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'max_sliver_size',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'min_thinness_ratio',
+                    index))
 
-                setBuitSeamlines = Base.DynaInvoke(
-                    'arcpy.BuildSeamlines_management', args, None, self.m_log.Message)
-                if (setBuitSeamlines.init() == False):
-                    return False
-                return setBuitSeamlines.invoke()
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            setBuitFootprints = Base.DynaInvoke(
+                'arcpy.BuildFootprints_management', args, None, self.m_log.Message)
+            if (setBuitFootprints.init() == False):
                 return False
+            return setBuitFootprints.invoke()
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'EMDG'):
+    def _cmd_BS(self, com, index):
+        try:
             self.m_log.Message(
-                "\tExport mosaic dataset geometry:" +
+                "\tBuild Seamline for the mosaic dataset: " +
                 self.m_base.m_mdName,
                 self.m_log.const_general_text)
             fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'exportmosaicdatasetgeometry',
-                'arcpy.ExportMosaicDatasetGeometry_management',
-                index
-            )
+                self.m_base.m_geoPath, self.m_base.m_mdName)
+            processKey = 'buildseamlines'
+            args = []
+            args.append(fullPath)
+            args.append(
+                self.getProcessInfoValue(
+                    processKey, 'cell_size', index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'sort_method',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey, 'sort_order', index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'order_by_attribute',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'order_by_base_value',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey, 'view_point', index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'computation_method',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'blend_width',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey, 'blend_type', index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'request_size',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'request_size_type',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'blend_width_units',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'area_of_interest',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'where_clause',
+                    index))
+            args.append(
+                self.getProcessInfoValue(
+                    processKey,
+                    'update_existing',
+                    index))
 
-        elif (com == 'EMDI'):
-            self.m_log.Message(
-                "\tExport mosaic dataset items:" +
-                self.m_base.m_mdName,
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'exportmosaicdatasetitems',
-                'arcpy.ExportMosaicDatasetItems_management',
-                index
-            )
+            setBuitSeamlines = Base.DynaInvoke(
+                'arcpy.BuildSeamlines_management', args, None, self.m_log.Message)
+            if (setBuitSeamlines.init() == False):
+                return False
+            return setBuitSeamlines.invoke()
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'SMDI'):
-            self.m_log.Message(
-                "\tSplit mosaic dataset items:" +
-                self.m_base.m_mdName,
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'splitmosaicdatasetitems',
-                'arcpy.MergeMosaicDatasetItems_management',
-                index
-            )
+    def _cmd_CPCSLP(self, com, index):
+        self.m_log.Message(
+            "\t{}".format(
+                self.commands[com]['desc']),
+            self.m_log.const_general_text)
+        try:
+            processKey = 'createpointcloudscenelayerpackage'
+            arcpy.management.CreatePointCloudSceneLayerPackage(
+                self.getProcessInfoValue(
+                    processKey, 'in_dataset', index), self.getProcessInfoValue(
+                    processKey, 'out_slpk', index), arcpy.SpatialReference(
+                    int(
+                        self.getProcessInfoValue(
+                            processKey, 'out_coor_system', index))), None, self.getProcessInfoValue(
+                        processKey, 'attributes', index), self.getProcessInfoValue(
+                            processKey, 'point_size_m', index), self.getProcessInfoValue(
+                                processKey, 'xy_max_error_m', index), self.getProcessInfoValue(
+                                    processKey, 'z_max_error_m', index), None, self.getProcessInfoValue(
+                                        processKey, 'scene_layer_version', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'SY'):
-            self.m_log.Message(
-                "\tSynchronize mosaic dataset:" +
-                self.m_base.m_mdName,
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'synchronizemosaicdataset',
-                'arcpy.SynchronizeMosaicDataset_management',
-                index
-            )
+    def _cmd_JF(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        try:
+            processKey = 'joinfield'
+            arcpy.JoinField_management(
+                self.getProcessInfoValue(
+                    processKey, 'in_data', index), self.getProcessInfoValue(
+                    processKey, 'in_field', index), self.getProcessInfoValue(
+                    processKey, 'join_table', index), self.getProcessInfoValue(
+                    processKey, 'join_field', index), self.getProcessInfoValue(
+                    processKey, 'fields', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CSDD'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'createimagesddraft',
-                'arcpy.CreateImageSDDraft',
-                index,
-                info=invokeDynamicFnInfo
-            )
+    def _cmd_DN(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        try:
+            processKey = 'definemosaicdatasetnodata'
+
+            lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
+            expression = "OBJECTID >%s" % (
+                str(self.m_base.m_last_AT_ObjectID))
+            arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
+
+            arcpy.DefineMosaicDatasetNoData_management(
+                lyrName, self.getProcessInfoValue(
+                    processKey, 'num_bands', index), self.getProcessInfoValue(
+                    processKey, 'bands_for_nodata_value', index), self.getProcessInfoValue(
+                    processKey, 'bands_for_valid_data_range', index), self.getProcessInfoValue(
+                    processKey, 'where_clause', index), self.getProcessInfoValue(
+                    processKey, 'composite_nodata_value', index))
+            arcpy.Delete_management(lyrName)
+            return True
 
-        elif (com == 'STS'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'stageservice_server',
-                'arcpy.StageService_server',
-                index
-            )
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'USD'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'uploadservicedefinition_server',
-                'arcpy.UploadServiceDefinition_server',
-                index
-            )
+    def _cmd_IG(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        try:
+            processKey = 'importgeometry'
+            importPath = self.getProcessInfoValue(
+                processKey, 'input_featureclass', index)
+            const_ig_search_ = '.gdb\\'
+            igIndx = importPath.lower().find(const_ig_search_)
+            igIndxSep = importPath.find('\\')
+
+            if (igIndxSep == igIndx + len(const_ig_search_) - 1):
+                importPath = self.prefixFolderPath(
+                    importPath, self.m_base.const_import_geometry_features_path_)
+
+            arcpy.ImportMosaicDatasetGeometry_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'target_featureclass_type', index), self.getProcessInfoValue(
+                    processKey, 'target_join_field', index), importPath, self.getProcessInfoValue(
+                    processKey, 'input_join_field', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif (com == 'CPCSLP'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
+    def _cmd_IF(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'importfieldvalues'
+
+        try:
+            j = 0
+            joinTable = self.getProcessInfoValue(
+                processKey, 'input_featureclass', index)
+            confTableName = os.path.basename(joinTable)
+
+            joinFeildList = [f.name for f in arcpy.ListFields(joinTable)]
+            self.log(joinFeildList)
+            mlayer = os.path.basename(fullPath) + "layer" + str(j)
+            j = j + 1
+            arcpy.MakeMosaicLayer_management(fullPath, mlayer)
+            self.log(
+                "Joining the mosaic dataset layer with the configuration table",
                 self.m_log.const_general_text)
-            try:
-                processKey = 'createpointcloudscenelayerpackage'
-                arcpy.management.CreatePointCloudSceneLayerPackage(
-                    self.getProcessInfoValue(
-                        processKey, 'in_dataset', index), self.getProcessInfoValue(
-                        processKey, 'out_slpk', index), arcpy.SpatialReference(
-                        int(
-                            self.getProcessInfoValue(
-                                processKey, 'out_coor_system', index))), None, self.getProcessInfoValue(
-                            processKey, 'attributes', index), self.getProcessInfoValue(
-                                processKey, 'point_size_m', index), self.getProcessInfoValue(
-                                    processKey, 'xy_max_error_m', index), self.getProcessInfoValue(
-                                        processKey, 'z_max_error_m', index), None, self.getProcessInfoValue(
-                                            processKey, 'scene_layer_version', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-        elif(com == 'JF'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            try:
-                processKey = 'joinfield'
-                arcpy.JoinField_management(
-                    self.getProcessInfoValue(
-                        processKey, 'in_data', index), self.getProcessInfoValue(
-                        processKey, 'in_field', index), self.getProcessInfoValue(
-                        processKey, 'join_table', index), self.getProcessInfoValue(
-                        processKey, 'join_field', index), self.getProcessInfoValue(
-                        processKey, 'fields', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'DN'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            try:
-                processKey = 'definemosaicdatasetnodata'
-
-                lyrName = 'lyr_%s' % str(self.m_base.m_last_AT_ObjectID)
-                expression = "OBJECTID >%s" % (
-                    str(self.m_base.m_last_AT_ObjectID))
-                arcpy.MakeMosaicLayer_management(fullPath, lyrName, expression)
-
-                arcpy.DefineMosaicDatasetNoData_management(
-                    lyrName, self.getProcessInfoValue(
-                        processKey, 'num_bands', index), self.getProcessInfoValue(
-                        processKey, 'bands_for_nodata_value', index), self.getProcessInfoValue(
-                        processKey, 'bands_for_valid_data_range', index), self.getProcessInfoValue(
-                        processKey, 'where_clause', index), self.getProcessInfoValue(
-                        processKey, 'composite_nodata_value', index))
-                arcpy.Delete_management(lyrName)
-                return True
-
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-
-        elif(com == 'IG'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            try:
-                processKey = 'importgeometry'
-                importPath = self.getProcessInfoValue(
-                    processKey, 'input_featureclass', index)
-                const_ig_search_ = '.gdb\\'
-                igIndx = importPath.lower().find(const_ig_search_)
-                igIndxSep = importPath.find('\\')
-
-                if (igIndxSep == igIndx + len(const_ig_search_) - 1):
-                    importPath = self.prefixFolderPath(
-                        importPath, self.m_base.const_import_geometry_features_path_)
-
-                arcpy.ImportMosaicDatasetGeometry_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'target_featureclass_type', index), self.getProcessInfoValue(
-                        processKey, 'target_join_field', index), importPath, self.getProcessInfoValue(
-                        processKey, 'input_join_field', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-
-        elif(com == 'IF'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'importfieldvalues'
-
-            try:
-                j = 0
-                joinTable = self.getProcessInfoValue(
-                    processKey, 'input_featureclass', index)
-                confTableName = os.path.basename(joinTable)
-
-                joinFeildList = [f.name for f in arcpy.ListFields(joinTable)]
-                self.log(joinFeildList)
-                mlayer = os.path.basename(fullPath) + "layer" + str(j)
-                j = j + 1
-                arcpy.MakeMosaicLayer_management(fullPath, mlayer)
-                self.log(
-                    "Joining the mosaic dataset layer with the configuration table",
-                    self.m_log.const_general_text)
-                mlayerJoin = arcpy.AddJoin_management(
-                    mlayer + "/Footprint",
-                    self.getProcessInfoValue(
-                        processKey,
-                        'input_join_field',
-                        index),
-                    joinTable,
-                    self.getProcessInfoValue(
-                        processKey,
-                        'target_join_field',
-                        index),
-                    "KEEP_ALL")
-                for jfl in joinFeildList:
-                    if jfl == "Comments" or jfl == "OBJECTID" or jfl == "Dataset_ID":
-                        self.log(
-                            "\t\tvalues exist for the field : " + jfl,
-                            self.m_log.const_general_text)
-                    else:
-                        fieldcal = "AMD_" + mdName + "_CAT." + jfl
-                        fromfield = "[" + confTableName + "." + jfl + "]"
-                        try:
-                            arcpy.CalculateField_management(
-                                mlayerJoin, fieldcal, fromfield)
-                            self.log(
-                                "\t\tDone calculating values for the Field :" + fieldcal,
-                                self.m_log.const_general_text)
-                        except BaseException:
-                            self.log(
-                                "Failed to calculate values for the field : " + fieldcal,
-                                self.m_log.const_warning_text)
-                            self.log(
-                                arcpy.GetMessages(),
-                                self.m_log.const_warning_text)
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-
-        elif(com == 'BB'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'buildboundary'
-            self.log(
-                "Building the boundary " +
+            mlayerJoin = arcpy.AddJoin_management(
+                mlayer + "/Footprint",
                 self.getProcessInfoValue(
                     processKey,
-                    'simplification_method',
-                    index))
-            try:
-                arcpy.BuildBoundary_management(
-                    fullPath, self.getProcessInfoValue(
-                        processKey, 'where_clause', index), self.getProcessInfoValue(
-                        processKey, 'append_to_existing', index), self.getProcessInfoValue(
-                        processKey, 'simplification_method', index))
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        # Delete fields
-        elif(com == 'DF'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'deletefield'
-            try:
-                self.log(
-                    "Deleting fields (%s) " %
-                    (self.getProcessInfoValue(
-                        processKey,
-                        'drop_field',
-                        index)))
-
-                arcpy.DeleteField_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'drop_field', index)
-                )
-                self.log(arcpy.GetMessages())
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'RP'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'repairmosaicdatasetpaths'
-            self.log("Repairing mosaic dataset paths ")
-            try:
-                arcpy.RepairMosaicDatasetPaths_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'paths_list', index),
-                    self.getProcessInfoValue(processKey, 'where_clause', index)
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'SS'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'setstatistics'
-            self.log(
-                "Setting MD statistics for:" + fullPath,
-                self.m_log.const_general_text)
-            stats_file_ss = self.m_base.getAbsPath(
+                    'input_join_field',
+                    index),
+                joinTable,
                 self.getProcessInfoValue(
-                    processKey, 'stats_file', index))
-            if stats_file_ss != '#' and stats_file_ss != '':
-                stats_file_ss = self.prefixFolderPath(self.getProcessInfoValue(
-                    processKey, 'stats_file', index), self.m_base.const_statistics_path_)
-
-            try:
-                arcpy.SetRasterProperties_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'data_type', index),
-                    self.getProcessInfoValue(processKey, 'statistics', index),
-                    stats_file_ss,
-                    self.getProcessInfoValue(processKey, 'nodata', index)
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'CC'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'calculatecellsizeranges'
-            self.log(
-                "Calculating cell ranges for:" +
-                fullPath,
-                self.m_log.const_general_text)
-
-            try:
-                arcpy.CalculateCellSizeRanges_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'where_clause', index),
-                    self.getProcessInfoValue(processKey, 'do_compute_min', index),
-                    self.getProcessInfoValue(processKey, 'do_compute_max', index),
-                    self.getProcessInfoValue(processKey, 'max_range_factor', index),
-                    self.getProcessInfoValue(processKey, 'cell_size_tolerance_factor', index),
-                    self.getProcessInfoValue(processKey, 'update_missing_only', index),
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'BO'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'buildoverviews'
-            self.log(
-                "Building overviews for:" + fullPath,
-                self.m_log.const_general_text)
-
-            try:
-                arcpy.BuildOverviews_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'where_clause', index),
-                    self.getProcessInfoValue(processKey, 'define_missing_tiles', index),
-                    self.getProcessInfoValue(processKey, 'generate_overviews', index),
-                    self.getProcessInfoValue(processKey, 'generate_missing_images', index),
-                    self.getProcessInfoValue(processKey, 'regenerate_stale_images', index)
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'DO'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'defineoverviews'
-            self.log(
-                "Define overviews for:" + fullPath,
-                self.m_log.const_general_text)
-
-            try:
-                arcpy.DefineOverviews_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'overview_image_folder', index),
-                    self.getProcessInfoValue(processKey, 'in_template_dataset', index),
-                    self.getProcessInfoValue(processKey, 'extent', index),
-                    self.getProcessInfoValue(processKey, 'pixel_size', index),
-                    self.getProcessInfoValue(processKey, 'number_of_levels', index),
-                    self.getProcessInfoValue(processKey, 'tile_rows', index),
-                    self.getProcessInfoValue(processKey, 'tile_cols', index),
-                    self.getProcessInfoValue(processKey, 'overview_factor', index),
-                    self.getProcessInfoValue(processKey, 'force_overview_tiles', index),
-                    self.getProcessInfoValue(processKey, 'resampling_method', index),
-                    self.getProcessInfoValue(processKey, 'compression_method', index),
-                    self.getProcessInfoValue(processKey, 'compression_quality', index)
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif(com == 'AI'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'addindex'
-            self.log("Adding Index:" + fullPath, self.m_log.const_general_text)
-
-            maxValues = len(self.processInfo.processInfo[processKey][index])
-            isError = False
-            for indx in range(0, maxValues):
-
-                try:
-                    arcpy.AddIndex_management(
-                        fullPath, self.getProcessInfoValue(
-                            processKey, 'fields', index, indx), self.getProcessInfoValue(
-                            processKey, 'index_name', index, indx), self.getProcessInfoValue(
-                            processKey, 'unique', index, indx), self.getProcessInfoValue(
-                            processKey, 'ascending', index, indx))
-                except BaseException:
-                    self.log(
-                        arcpy.GetMessages(),
-                        self.m_log.const_critical_text)
-                    isError = True
-
-            return not isError
-
-        elif(com == 'CFC'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'cachefeatureclass'
-
-            seamlineFC_name = 'AMD_' + self.m_base.m_mdName + '_SML'
-            seamlineFC_Path = os.path.join(
-                self.m_base.m_geoPath, seamlineFC_name)
-            if (arcpy.Exists(seamlineFC_Path) == False):
-                self.log(
-                    "Seamline does not exist for the mosaic dataset: " +
-                    fullPath,
-                    self.m_log.const_general_text)
-                return False
-
-            try:
-                outCFC = self.getProcessInfoValue(
                     processKey,
-                    'out_cache_featureclass',
-                    index).replace(
-                    '\\',
-                    '/')
-            except Exception as inf:
-                self.log(str(inf), self.m_log.const_critical_text)
-                return False
-
-            if (outCFC.find('/') == -1):
-                outCFC = os.path.join(self.m_base.m_geoPath, outCFC)
-
-            if arcpy.Exists(outCFC):
-                self.log(
-                    "Output cache feature class already exists: " + outCFC,
-                    self.m_log.const_critical_text)
-                return False
-
-            (outCFC_wrk, outCFC_name) = os.path.split(outCFC)
-            self.log("Exporting seamline as a feaure class: " +
-                     outCFC, self.m_log.const_general_text)
-
-            try:
-                arcpy.FeatureClassToFeatureClass_conversion(
-                    seamlineFC_Path, outCFC_wrk, outCFC_name, "#", "#", "#")
-            except BaseException:
-                self.log(
-                    'Failed to create the output featue class (%s): (%s)' %
-                    (outCFC, arcpy.GetMessages()), self.m_log.const_critical_text)
-                return False
-            try:
-                dropFList = [
-                    'BlendWidthUnits',
-                    'BlendType',
-                    'BlendWidth',
-                    'ItemHash']
-                sfieldList = arcpy.ListFields(seamlineFC_Path)
-                for sfield in sfieldList:
-                    if sfield.name.lower() in dropFList:
-                        dropFList.remove(sfield.name)
-
-                arcpy.DeleteField_management(outCFC, dropFList)
-            except BaseException:
-                self.log(
-                    'Failed to delete the fields: ' +
-                    arcpy.GetMessages(),
-                    self.m_log.const_critical_text)
-
-            catfieldList = []
-            catfield = arcpy.ListFields(fullPath)
-            for field in catfield:
-                catfieldList.append(field.name)
-            removelist = [
-                u'OBJECTID',
-                u'Shape',
-                u'Raster',
-                u'MinPS',
-                u'MaxPS',
-                u'HighPS',
-                u'Category',
-                u'Tag',
-                u'GroupName',
-                u'ProductName',
-                u'CenterX',
-                u'CenterY',
-                u'ZOrder',
-                u'TypeID',
-                u'ItemTS',
-                u'UriHash',
-                u'Uri',
-                u'Shape_Length',
-                u'Shape_Area',
-                u'SOrder',
-                u'SLevelPS']
-            importField = list(set(catfieldList) - set(removelist))
-
-            try:
-                arcpy.JoinField_management(
-                    outCFC, "RasterID", fullPath, "OBJECTID", importField)
-            except BaseException:
-                self.log(
-                    "Failed to import metadata fields:" +
-                    arcpy.GetMessages(),
-                    self.m_log.const_critical_text)
-                return False
-
-            return True
-
-        elif(com == 'CV'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'calculatevalues'
-
-            max_CV = len(self.processInfo.processInfo[processKey])
-            if (index > max_CV - 1):
-                self.log(
-                    'Wrong index (%s) specified for (%s). Max index is (%s)' %
-                    (index, processKey, max_CV - 1), self.m_log.const_critical_text)
-                return False
-
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            maxValues = len(self.processInfo.processInfo[processKey][index])
-            self.log(
-                "Calculate values:" + fullPath,
-                self.m_log.const_general_text)
-            isError = False
-            for indx in range(0, maxValues):
-                isQuery = False
-                query = self.getProcessInfoValue(
-                    processKey, 'query', index, indx)
-                lyrName = 'lyr_%s_%s' % (str(
-                    self.m_base.m_last_AT_ObjectID),
-                    datetime.strftime(
-                    datetime.now(),
-                    "%Y%d%d%H%M%S%f"))
-                if (query != '#'):
-                    isQuery = True
-
-                expression = "OBJECTID >%s" % (
-                    str(self.m_base.m_last_AT_ObjectID))
-                if (isQuery):
-                    expression += ' AND %s' % (query)
-                try:
-                    arcpy.MakeMosaicLayer_management(fullPath, lyrName)
-                    arcpy.SelectLayerByAttribute_management(
-                        lyrName, "NEW_SELECTION", expression)
-                    lyrName_footprint = lyrName  # + "/Footprint"
-                    result = arcpy.CalculateField_management(
-                        lyrName_footprint, self.getProcessInfoValue(
-                            processKey, 'fieldname', index, indx), self.getProcessInfoValue(
-                            processKey, 'expression', index, indx), self.getProcessInfoValue(
-                            processKey, 'expression_type', index, indx), self.getProcessInfoValue(
-                            processKey, 'code_block', index, indx))
-                    Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
-                except BaseException:
+                    'target_join_field',
+                    index),
+                "KEEP_ALL")
+            for jfl in joinFeildList:
+                if jfl == "Comments" or jfl == "OBJECTID" or jfl == "Dataset_ID":
                     self.log(
-                        arcpy.GetMessages(),
-                        self.m_log.const_critical_text)
-                    isError = True
-                try:
-                    # passes for unknown/uncreated layer names
-                    arcpy.Delete_management(lyrName)
-                except BaseException:
-                    self.log(
-                        arcpy.GetMessages(),
-                        self.m_log.const_critical_text)
-                    isError = True
-
-            return not isError
-
-        elif(com == 'CP'):
-            self.log(
-                "Compacting file geodatabase:" +
-                self.m_base.m_geoPath,
-                self.m_log.const_general_text)
-
-            try:
-                arcpy.Compact_management(self.m_base.m_geoPath)
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+                        "\t\tvalues exist for the field : " + jfl,
+                        self.m_log.const_general_text)
+                else:
+                    fieldcal = "AMD_" + self.m_base.m_mdName + "_CAT." + jfl
+                    fromfield = "[" + confTableName + "." + jfl + "]"
+                    try:
+                        arcpy.CalculateField_management(
+                            mlayerJoin, fieldcal, fromfield)
+                        self.log(
+                            "\t\tDone calculating values for the Field :" + fieldcal,
+                            self.m_log.const_general_text)
+                    except BaseException:
+                        self.log(
+                            "Failed to calculate values for the field : " + fieldcal,
+                            self.m_log.const_warning_text)
+                        self.log(
+                            arcpy.GetMessages(),
+                            self.m_log.const_warning_text)
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif(com == 'SE'):
-            self.log("Set environment variables on index: %s" %
-                     (index), self.m_log.const_general_text)
+    def _cmd_BB(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'buildboundary'
+        self.log(
+            "Building the boundary " +
+            self.getProcessInfoValue(
+                processKey,
+                'simplification_method',
+                index))
+        try:
+            arcpy.BuildBoundary_management(
+                fullPath, self.getProcessInfoValue(
+                    processKey, 'where_clause', index), self.getProcessInfoValue(
+                    processKey, 'append_to_existing', index), self.getProcessInfoValue(
+                    processKey, 'simplification_method', index))
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-            node = self.m_base.m_doc.getElementsByTagName('Environment')
-            if (len(node) == 0 or
-                    index > len(node) - 1):
-                self.log(
-                    'No environment variables could be found/at index (%s)' %
-                    (index), self.m_log.const_warning_text)
-                return False
-            json = {}
-            self.processEnv(node[index].firstChild, 0, json)
-            for l in range(0, len(json)):
-                p = str(l)
-                pIndx = -1
-                parent = json[p]['parent'].lower()
-                if (parent == 'environment'):
-                    pIndx = 0
-
-                key_ = val_ = ''
-                key_len_ = len(json[p]['key'])
-                for i in range(0, key_len_):
-                    typ = json[p]['type'][i]
-                    if (typ != 'p'):
-                        try:
-                            k = json[p]['key'][i]
-                            v = json[p]['val'][i]
-
-                            if (k == 'ClearEnvironment' or      # no use for these yet.
-                                    k == 'ResetEnvironments'):
-                                continue
-                            if (pIndx == 0):
-                                key_ = k
-                                val_ = v.strip()
-                                if val_ not in ['', '#']:
-                                    arcpy.env[key_] = val_
-                                    self.log(
-                                        'Env[%s]=%s' %
-                                        (key_, val_), self.m_log.const_general_text)
-                                continue
-                            else:
-                                key_ = json[p]['parent']
-                            val_ += json[p]['val'][i]
-                            if (i < key_len_ - 1):
-                                val_ += ' '
-                            else:
-                                if (val_.strip() != ''):
-                                    arcpy.env[key_] = val_
-                                    self.log(
-                                        'Env[%s]=%s' %
-                                        (key_, val_), self.m_log.const_general_text)
-                        except Exception as inst:
-                            self.log(str(inst), self.m_log.const_warning_text)
-                            continue
-            return True  # should unable to set environment variables return False?
-
-        elif (com == 'MTC'):
-
-            mdName = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
-            processKey = 'managetilecache'
+    # Delete fields
+    def _cmd_DF(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'deletefield'
+        try:
             self.log(
-                "Building cache for:" + mdName,
-                self.m_log.const_general_text)
-            self.log("Getting tiling Schema : ", self.m_log.const_general_text)
-            tileSchemeMtc = self.m_base.getAbsPath(
-                self.getProcessInfoValue(
-                    processKey, 'import_tiling_scheme', index))
-            if tileSchemeMtc != '#' and tileSchemeMtc != '':
-                tileSchemeMtc = self.prefixFolderPath(
-                    self.getProcessInfoValue(
-                        processKey, 'import_tiling_scheme', index), os.path.dirname(
-                        self.config))
-            self.log(tileSchemeMtc, self.m_log.const_general_text)
-            try:
-                cacheLocation = self.getProcessInfoValue(
-                    processKey, 'in_cache_location', index)
-                if (os.path.exists(cacheLocation)) == False:
-                    os.makedirs(cacheLocation)
-                self.log("Running Manage Tile Cache tool with following params:", self.m_log.const_general_text)
-                self.log(f"\t\tCache Location: {cacheLocation}", self.m_log.const_general_text)
-                self.log(f"\t\tManage Mode: {self.getProcessInfoValue(processKey, 'manage_mode', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tCache Name: {self.getProcessInfoValue(processKey, 'in_cache_name', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tInput Data Source: {mdName}", self.m_log.const_general_text)
-                self.log(f"\t\tInput Tiling Scheme: {self.getProcessInfoValue(processKey, 'tiling_scheme', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tImport Tiling Scheme: {tileSchemeMtc}", self.m_log.const_general_text)
-                self.log(f"\t\tScales: {self.getProcessInfoValue(processKey, 'scales', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tArea of Interest: {self.getProcessInfoValue(processKey, 'area_of_interest', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tMax Cell Size: {self.getProcessInfoValue(processKey, 'max_cell_size', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tMin Cached Scale: {self.getProcessInfoValue(processKey, 'min_cached_scale', index)}", self.m_log.const_general_text)
-                self.log(f"\t\tMax Cached Scale: {self.getProcessInfoValue(processKey, 'max_cached_scale', index)}", self.m_log.const_general_text)
-                result = arcpy.ManageTileCache_management(
-                    cacheLocation,
-                    self.getProcessInfoValue(processKey, 'manage_mode', index),
-                    self.getProcessInfoValue(processKey, 'in_cache_name', index),
-                    mdName,
-                    self.getProcessInfoValue(processKey, 'tiling_scheme', index),
-                    tileSchemeMtc,
-                    self.getProcessInfoValue(processKey, 'scales', index),
-                    self.getProcessInfoValue(processKey, 'area_of_interest', index),
-                    self.getProcessInfoValue(processKey, 'max_cell_size', index),
-                    self.getProcessInfoValue(processKey, 'min_cached_scale', index),
-                    self.getProcessInfoValue(processKey, 'max_cached_scale', index))
-                Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
-                try:
-                    if os.path.isfile(tileSchemeMtc):
-                        cachepath = os.path.join(
-                            self.getProcessInfoValue(
-                                processKey, 'in_cache_location', index), self.getProcessInfoValue(
-                                processKey, 'in_cache_name', index))
-                        lodNodesList = returnLevelDetails(
-                            os.path.join(cachepath, 'conf.xml'))
-                        lodNodesList = sorted(
-                            lodNodesList, key=lambda k: int(
-                                k['level']))
-                        maxLODNode = lodNodesList[-1]
-                        maxScale = maxLODNode['scale']
-                        modifyConfProperties(
-                            os.path.join(
-                                cachepath,
-                                'conf.properties'),
-                            maxScale)
-                except Exception as exp:
-                    self.log(str(exp), self.m_log.const_critical_text)
-                return True
-            except BaseException as exp:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                self.log(str(exp), self.m_log.const_critical_text)
-                return False
-
-        elif (com == 'ETC'):
-            processKey = 'exporttilecache'
-            try:
-                self.log(
-                    "Exporting cache for:" +
-                    self.getProcessInfoValue(
-                        processKey,
-                        'in_target_cache_name',
-                        index),
-                    self.m_log.const_general_text)
-                targetLocation = self.getProcessInfoValue(
-                    processKey, 'in_target_cache_folder', index)
-                os.makedirs(targetLocation)
-                result = arcpy.ExportTileCache_management(
-                    self.getProcessInfoValue(
-                        processKey, 'in_cache_source', index), targetLocation, self.getProcessInfoValue(
-                        processKey, 'in_target_cache_name', index), self.getProcessInfoValue(
-                        processKey, 'export_cache_type', index), self.getProcessInfoValue(
-                        processKey, 'storage_format_type', index), self.getProcessInfoValue(
-                        processKey, 'scales', index), self.getProcessInfoValue(
-                            processKey, 'area_of_interest', index))
-                Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-
-        elif (com == 'STP'):
-            processKey = 'sharepackage'
-            try:
-                self.log(
-                    "Publishing Tile Package:" +
-                    self.getProcessInfoValue(
-                        processKey,
-                        'in_package',
-                        index),
-                    self.m_log.const_general_text)
-
-                arcpy.SharePackage_management(
-                    self.getProcessInfoValue(processKey, 'in_package', index),
-                    self.getProcessInfoValue(processKey, 'username', index),
-                    self.getProcessInfoValue(processKey, 'password', index),
-                    self.getProcessInfoValue(processKey, 'summary', index),
-                    self.getProcessInfoValue(processKey, 'tags', index),
-                    self.getProcessInfoValue(processKey, 'credits', index),
-                    self.getProcessInfoValue(processKey, 'public', index),
-                    self.getProcessInfoValue(processKey, 'groups', index))
+                "Deleting fields (%s) " %
+                (self.getProcessInfoValue(
+                    processKey,
+                    'drop_field',
+                    index)))
 
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-        elif (com == 'CRTT'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                "AMD_{0}_ART".format(
-                    self.m_base.m_mdName))
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'clearrastertypetable',
-                'arcpy.DeleteRows_management',
-                index
-            )
-        elif (com == 'CLT'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                "AMD_{0}_LOG".format(
-                    self.m_base.m_mdName))
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'clearlogstable',
-                'arcpy.DeleteRows_management',
-                index
-            )
-        elif(com == 'RP'):
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            processKey = 'repairmosaicdatasetpaths'
-            self.log("Repairing mosaic dataset paths ")
-            try:
-                arcpy.RepairMosaicDatasetPaths_management(
-                    fullPath,
-                    self.getProcessInfoValue(processKey, 'paths_list', index),
-                    self.getProcessInfoValue(processKey, 'where_clause', index)
-                )
-                return True
-            except BaseException:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
-        elif (com == 'CCM'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computecameramodel',
-                'arcpy.ComputeCameraModel_management',
-                index
-            )
-        elif (com == 'BSM'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'buildstereomodel',
-                'arcpy.BuildStereoModel_management',
-                index
-            )
-        elif (com == 'GPC'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'generatepointcloud',
-                'arcpy.GeneratePointCloud_management',
-                index
-            )
-        elif (com == 'IFPC'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'interpolatefrompointcloud',
-                'arcpy.InterpolateFromPointCloud_management',
-                index
-            )
-        elif (com == 'CRA'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'copyraster',
-                'arcpy.CopyRaster_management',
-                index,
-                info=invokeDynamicFnInfo  # info = to pass extra args to the fnc '__invokeDynamicFn'
-            )
-        elif (com == 'CCSCF'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'createcloudstorageconnectionfile',
-                'arcpy.CreateCloudStorageConnectionFile_management',
-                index
-            )
-        elif (com == 'DEL'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [],
-                'delete',
-                'arcpy.Delete_management',
-                index
-            )
-        elif (com == 'BMI'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'buildmultidimensionalinfo',
-                'arcpy.BuildMultidimensionalInfo_management',
-                index
-            )
-        elif (com == 'AMR'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'aggregatemultidimensionalraster',
-                'arcpy.ia.AggregateMultidimensionalRaster',
-                index
-            )
-        elif (com == 'COID'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'createorientedimagerydataset',
-                'arcpy.oi.CreateOrientedImageryDataset',
-                index
-            )
-        elif (com == 'AITOID'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'addimagestoorientedimagerydataset',
-                'arcpy.oi.AddImagesToOrientedImageryDataset',
-                index
-            )
-        elif (com == 'AIFCIT'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'addimagesfromcustominputtype',
-                'arcpy.oi.AddImagesFromCustomInputType',
-                index
-            )
-        elif (com == 'BOIF'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'buildorientedimageryfootprint',
-                'arcpy.oi.BuildOrientedImageryFootprint',
-                index
-            )
-        elif (com == 'GSFOID'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'generateservicefromorientedimagerydataset',
-                'arcpy.oi.GenerateServiceFromOrientedImageryDataset',
-                index
-            )
-        elif (com == 'UOIDP'):
-            self.m_log.Message(
-                "\t{}".format(
-                    self.commands[com]['desc']),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'updateorientedimagerydatasetproperties',
-                'arcpy.oi.UpdateOrientedImageryDatasetProperties',
-                index
-            )
-        elif com == "PTDT":
-            self.m_log.Message(f"\t{self.commands[com]['desc']}", self.m_log.const_general_text)
-            return self.__invokeDynamicFn([], "package3dtiles", "arcpy.management.Package3DTiles", index)
-        elif (com == 'ACUC'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'analyzechangesusingccdc',
-                'arcpy.ia.AnalyzeChangesUsingCCDC',
-                index
-            )
-        elif (com == 'DCUCAR'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'detectchangeusingchangeanalysis',
-                'arcpy.ia.DetectChangeUsingChangeAnalysis',
-                index
-            )
-        elif (com == 'FAS'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'findargumentstatistics',
-                'arcpy.ia.FindArgumentStatistics',
-                index
-            )
-        elif (com == 'GMA'):    # chs
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'generatemultidimensionalanomaly',
-                'arcpy.ia.GenerateMultidimensionalAnomaly',
-                index
-            )
-        elif (com == 'CF'):    # chs
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'computefiducials',
-                'arcpy.ComputeFiducials_management',
-                index
-            )
-        elif (com == 'UIO'):    # chs
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'updateinteriororientation',
-                'arcpy.UpdateInteriorOrientation_management',
-                index
+            arcpy.DeleteField_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'drop_field', index)
             )
-        elif (com == 'EFACP'):    # chs
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'exportframeandcameraparameters',
-                'arcpy.ExportFrameAndCameraParameters_management',
-                index
+            self.log(arcpy.GetMessages())
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_RP(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'repairmosaicdatasetpaths'
+        self.log("Repairing mosaic dataset paths ")
+        try:
+            arcpy.RepairMosaicDatasetPaths_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'paths_list', index),
+                self.getProcessInfoValue(processKey, 'where_clause', index)
             )
-        elif (com == 'GBAR'):    # chs
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            fullPath = os.path.join(
-                self.m_base.m_geoPath,
-                self.m_base.m_mdName)
-            return self.__invokeDynamicFn(
-                [fullPath],
-                'generateblockadjustmentreport',
-                'arcpy.GenerateBlockAdjustmentReport_management',
-                index
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_SS(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'setstatistics'
+        self.log(
+            "Setting MD statistics for:" + fullPath,
+            self.m_log.const_general_text)
+        stats_file_ss = self.m_base.getAbsPath(
+            self.getProcessInfoValue(
+                processKey, 'stats_file', index))
+        if stats_file_ss != '#' and stats_file_ss != '':
+            stats_file_ss = self.prefixFolderPath(self.getProcessInfoValue(
+                processKey, 'stats_file', index), self.m_base.const_statistics_path_)
+
+        try:
+            arcpy.SetRasterProperties_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'data_type', index),
+                self.getProcessInfoValue(processKey, 'statistics', index),
+                stats_file_ss,
+                self.getProcessInfoValue(processKey, 'nodata', index)
             )
-        elif (com == 'GTR'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'generatetrendraster',
-                'arcpy.ia.GenerateTrendRaster',
-                index
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_CC(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'calculatecellsizeranges'
+        self.log(
+            "Calculating cell ranges for:" +
+            fullPath,
+            self.m_log.const_general_text)
+
+        try:
+            arcpy.CalculateCellSizeRanges_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'where_clause', index),
+                self.getProcessInfoValue(processKey, 'do_compute_min', index),
+                self.getProcessInfoValue(processKey, 'do_compute_max', index),
+                self.getProcessInfoValue(processKey, 'max_range_factor', index),
+                self.getProcessInfoValue(processKey, 'cell_size_tolerance_factor', index),
+                self.getProcessInfoValue(processKey, 'update_missing_only', index),
             )
-        elif (com == 'PUTR'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'predictusingtrendraster',
-                'arcpy.ia.PredictUsingTrendRaster',
-                index
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_BO(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'buildoverviews'
+        self.log(
+            "Building overviews for:" + fullPath,
+            self.m_log.const_general_text)
+
+        try:
+            arcpy.BuildOverviews_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'where_clause', index),
+                self.getProcessInfoValue(processKey, 'define_missing_tiles', index),
+                self.getProcessInfoValue(processKey, 'generate_overviews', index),
+                self.getProcessInfoValue(processKey, 'generate_missing_images', index),
+                self.getProcessInfoValue(processKey, 'regenerate_stale_images', index)
             )
-        elif (com == 'RR'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_DO(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'defineoverviews'
+        self.log(
+            "Define overviews for:" + fullPath,
+            self.m_log.const_general_text)
+
+        try:
+            arcpy.DefineOverviews_management(
+                fullPath,
+                self.getProcessInfoValue(processKey, 'overview_image_folder', index),
+                self.getProcessInfoValue(processKey, 'in_template_dataset', index),
+                self.getProcessInfoValue(processKey, 'extent', index),
+                self.getProcessInfoValue(processKey, 'pixel_size', index),
+                self.getProcessInfoValue(processKey, 'number_of_levels', index),
+                self.getProcessInfoValue(processKey, 'tile_rows', index),
+                self.getProcessInfoValue(processKey, 'tile_cols', index),
+                self.getProcessInfoValue(processKey, 'overview_factor', index),
+                self.getProcessInfoValue(processKey, 'force_overview_tiles', index),
+                self.getProcessInfoValue(processKey, 'resampling_method', index),
+                self.getProcessInfoValue(processKey, 'compression_method', index),
+                self.getProcessInfoValue(processKey, 'compression_quality', index)
+            )
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_AI(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'addindex'
+        self.log("Adding Index:" + fullPath, self.m_log.const_general_text)
+
+        maxValues = len(self.processInfo.processInfo[processKey][index])
+        isError = False
+        for indx in range(0, maxValues):
+
+            try:
+                arcpy.AddIndex_management(
+                    fullPath, self.getProcessInfoValue(
+                        processKey, 'fields', index, indx), self.getProcessInfoValue(
+                        processKey, 'index_name', index, indx), self.getProcessInfoValue(
+                        processKey, 'unique', index, indx), self.getProcessInfoValue(
+                        processKey, 'ascending', index, indx))
+            except BaseException:
+                self.log(
+                    arcpy.GetMessages(),
+                    self.m_log.const_critical_text)
+                isError = True
+
+        return not isError
+
+    def _cmd_CFC(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'cachefeatureclass'
+
+        seamlineFC_name = 'AMD_' + self.m_base.m_mdName + '_SML'
+        seamlineFC_Path = os.path.join(
+            self.m_base.m_geoPath, seamlineFC_name)
+        if (arcpy.Exists(seamlineFC_Path) == False):
+            self.log(
+                "Seamline does not exist for the mosaic dataset: " +
+                fullPath,
                 self.m_log.const_general_text)
-            fullPath = fullPath = os.path.join(
-                self.m_base.m_geoPath, self.m_base.m_mdName)
-            processKey = 'registerraster'
+            return False
+
+        try:
+            outCFC = self.getProcessInfoValue(
+                processKey,
+                'out_cache_featureclass',
+                index).replace(
+                '\\',
+                '/')
+        except Exception as inf:
+            self.log(str(inf), self.m_log.const_critical_text)
+            return False
+
+        if (outCFC.find('/') == -1):
+            outCFC = os.path.join(self.m_base.m_geoPath, outCFC)
+
+        if arcpy.Exists(outCFC):
+            self.log(
+                "Output cache feature class already exists: " + outCFC,
+                self.m_log.const_critical_text)
+            return False
+
+        (outCFC_wrk, outCFC_name) = os.path.split(outCFC)
+        self.log("Exporting seamline as a feaure class: " +
+                 outCFC, self.m_log.const_general_text)
+
+        try:
+            arcpy.FeatureClassToFeatureClass_conversion(
+                seamlineFC_Path, outCFC_wrk, outCFC_name, "#", "#", "#")
+        except BaseException:
+            self.log(
+                'Failed to create the output featue class (%s): (%s)' %
+                (outCFC, arcpy.GetMessages()), self.m_log.const_critical_text)
+            return False
+        try:
+            dropFList = [
+                'BlendWidthUnits',
+                'BlendType',
+                'BlendWidth',
+                'ItemHash']
+            sfieldList = arcpy.ListFields(seamlineFC_Path)
+            for sfield in sfieldList:
+                if sfield.name.lower() in dropFList:
+                    dropFList.remove(sfield.name)
+
+            arcpy.DeleteField_management(outCFC, dropFList)
+        except BaseException:
+            self.log(
+                'Failed to delete the fields: ' +
+                arcpy.GetMessages(),
+                self.m_log.const_critical_text)
+
+        catfieldList = []
+        catfield = arcpy.ListFields(fullPath)
+        for field in catfield:
+            catfieldList.append(field.name)
+        removelist = [
+            u'OBJECTID',
+            u'Shape',
+            u'Raster',
+            u'MinPS',
+            u'MaxPS',
+            u'HighPS',
+            u'Category',
+            u'Tag',
+            u'GroupName',
+            u'ProductName',
+            u'CenterX',
+            u'CenterY',
+            u'ZOrder',
+            u'TypeID',
+            u'ItemTS',
+            u'UriHash',
+            u'Uri',
+            u'Shape_Length',
+            u'Shape_Area',
+            u'SOrder',
+            u'SLevelPS']
+        importField = list(set(catfieldList) - set(removelist))
+
+        try:
+            arcpy.JoinField_management(
+                outCFC, "RasterID", fullPath, "OBJECTID", importField)
+        except BaseException:
+            self.log(
+                "Failed to import metadata fields:" +
+                arcpy.GetMessages(),
+                self.m_log.const_critical_text)
+            return False
+
+        return True
+
+    def _cmd_CV(self, com, index):
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        processKey = 'calculatevalues'
+
+        max_CV = len(self.processInfo.processInfo[processKey])
+        if (index > max_CV - 1):
+            self.log(
+                'Wrong index (%s) specified for (%s). Max index is (%s)' %
+                (index, processKey, max_CV - 1), self.m_log.const_critical_text)
+            return False
+
+        fullPath = os.path.join(
+            self.m_base.m_geoPath,
+            self.m_base.m_mdName)
+        maxValues = len(self.processInfo.processInfo[processKey][index])
+        self.log(
+            "Calculate values:" + fullPath,
+            self.m_log.const_general_text)
+        isError = False
+        for indx in range(0, maxValues):
+            isQuery = False
+            query = self.getProcessInfoValue(
+                processKey, 'query', index, indx)
+            lyrName = 'lyr_%s_%s' % (str(
+                self.m_base.m_last_AT_ObjectID),
+                datetime.strftime(
+                datetime.now(),
+                "%Y%d%d%H%M%S%f"))
+            if (query != '#'):
+                isQuery = True
+
+            expression = "OBJECTID >%s" % (
+                str(self.m_base.m_last_AT_ObjectID))
+            if (isQuery):
+                expression += ' AND %s' % (query)
+            try:
+                arcpy.MakeMosaicLayer_management(fullPath, lyrName)
+                arcpy.SelectLayerByAttribute_management(
+                    lyrName, "NEW_SELECTION", expression)
+                lyrName_footprint = lyrName  # + "/Footprint"
+                result = arcpy.CalculateField_management(
+                    lyrName_footprint, self.getProcessInfoValue(
+                        processKey, 'fieldname', index, indx), self.getProcessInfoValue(
+                        processKey, 'expression', index, indx), self.getProcessInfoValue(
+                        processKey, 'expression_type', index, indx), self.getProcessInfoValue(
+                        processKey, 'code_block', index, indx))
+                Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
+            except BaseException:
+                self.log(
+                    arcpy.GetMessages(),
+                    self.m_log.const_critical_text)
+                isError = True
+            try:
+                # passes for unknown/uncreated layer names
+                arcpy.Delete_management(lyrName)
+            except BaseException:
+                self.log(
+                    arcpy.GetMessages(),
+                    self.m_log.const_critical_text)
+                isError = True
+
+        return not isError
+
+    def _cmd_CP(self, com, index):
+        self.log(
+            "Compacting file geodatabase:" +
+            self.m_base.m_geoPath,
+            self.m_log.const_general_text)
+
+        try:
+            arcpy.Compact_management(self.m_base.m_geoPath)
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_SE(self, com, index):
+        self.log("Set environment variables on index: %s" %
+                 (index), self.m_log.const_general_text)
+
+        model = self.m_base.getConfigModel()
+        environment = model.md.environment if model.md else ()
+        if (index > len(environment) - 1):
+            self.log(
+                'No environment variables could be found/at index (%s)' %
+                (index), self.m_log.const_warning_text)
+            return False
+        skip = ['ClearEnvironment', 'ResetEnvironments']    # no use for these yet.
+        for setting in environment[index]:
+            if (setting.name in skip):
+                continue
+            try:
+                key_ = setting.name
+                if (setting.children):      # e.g. <pyramid> values are joined by spaces.
+                    val_ = ' '.join([v for k, v in setting.children if k not in skip])
+                    if (val_.strip() == ''):
+                        continue
+                else:
+                    val_ = setting.value
+                    if val_ in ['', '#']:
+                        continue
+                arcpy.env[key_] = val_
+                self.log(
+                    'Env[%s]=%s' %
+                    (key_, val_), self.m_log.const_general_text)
+            except Exception as inst:
+                self.log(str(inst), self.m_log.const_warning_text)
+                continue
+        return True  # should unable to set environment variables return False?
+
+    def _cmd_MTC(self, com, index):
+
+        mdName = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
+        processKey = 'managetilecache'
+        self.log(
+            "Building cache for:" + mdName,
+            self.m_log.const_general_text)
+        self.log("Getting tiling Schema : ", self.m_log.const_general_text)
+        tileSchemeMtc = self.m_base.getAbsPath(
+            self.getProcessInfoValue(
+                processKey, 'import_tiling_scheme', index))
+        if tileSchemeMtc != '#' and tileSchemeMtc != '':
+            tileSchemeMtc = self.prefixFolderPath(
+                self.getProcessInfoValue(
+                    processKey, 'import_tiling_scheme', index), os.path.dirname(
+                    self.config))
+        self.log(tileSchemeMtc, self.m_log.const_general_text)
+        try:
+            cacheLocation = self.getProcessInfoValue(
+                processKey, 'in_cache_location', index)
+            if (os.path.exists(cacheLocation) == False and
+                    not Planner.isActive()):
+                os.makedirs(cacheLocation)
+            self.log("Running Manage Tile Cache tool with following params:", self.m_log.const_general_text)
+            self.log(f"\t\tCache Location: {cacheLocation}", self.m_log.const_general_text)
+            self.log(f"\t\tManage Mode: {self.getProcessInfoValue(processKey, 'manage_mode', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tCache Name: {self.getProcessInfoValue(processKey, 'in_cache_name', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tInput Data Source: {mdName}", self.m_log.const_general_text)
+            self.log(f"\t\tInput Tiling Scheme: {self.getProcessInfoValue(processKey, 'tiling_scheme', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tImport Tiling Scheme: {tileSchemeMtc}", self.m_log.const_general_text)
+            self.log(f"\t\tScales: {self.getProcessInfoValue(processKey, 'scales', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tArea of Interest: {self.getProcessInfoValue(processKey, 'area_of_interest', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tMax Cell Size: {self.getProcessInfoValue(processKey, 'max_cell_size', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tMin Cached Scale: {self.getProcessInfoValue(processKey, 'min_cached_scale', index)}", self.m_log.const_general_text)
+            self.log(f"\t\tMax Cached Scale: {self.getProcessInfoValue(processKey, 'max_cached_scale', index)}", self.m_log.const_general_text)
+            result = arcpy.ManageTileCache_management(
+                cacheLocation,
+                self.getProcessInfoValue(processKey, 'manage_mode', index),
+                self.getProcessInfoValue(processKey, 'in_cache_name', index),
+                mdName,
+                self.getProcessInfoValue(processKey, 'tiling_scheme', index),
+                tileSchemeMtc,
+                self.getProcessInfoValue(processKey, 'scales', index),
+                self.getProcessInfoValue(processKey, 'area_of_interest', index),
+                self.getProcessInfoValue(processKey, 'max_cell_size', index),
+                self.getProcessInfoValue(processKey, 'min_cached_scale', index),
+                self.getProcessInfoValue(processKey, 'max_cached_scale', index))
+            Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
             try:
-                query = self.m_base.getXMLXPathValue(
-                    'Application/Workspace/MosaicDataset/Processes/RegisterRaster/query', 'query')
+                if os.path.isfile(tileSchemeMtc):
+                    cachepath = os.path.join(
+                        self.getProcessInfoValue(
+                            processKey, 'in_cache_location', index), self.getProcessInfoValue(
+                            processKey, 'in_cache_name', index))
+                    lodNodesList = returnLevelDetails(
+                        os.path.join(cachepath, 'conf.xml'))
+                    lodNodesList = sorted(
+                        lodNodesList, key=lambda k: int(
+                            k['level']))
+                    maxLODNode = lodNodesList[-1]
+                    maxScale = maxLODNode['scale']
+                    modifyConfProperties(
+                        os.path.join(
+                            cachepath,
+                            'conf.properties'),
+                        maxScale)
             except Exception as exp:
                 self.log(str(exp), self.m_log.const_critical_text)
-                self.log(
-                    "Setting query value as #",
-                    self.m_log.const_warning_text)
-                query = "#"
-            if query == "#":  # run the tool on the entire mosaic dataset
-                return self.__invokeDynamicFn(
-                    [fullPath],
-                    'registerraster',
-                    'arcpy.RegisterRaster_management',
-                    index
-                )
-            else:
-                with arcpy.da.SearchCursor(fullPath, ["OBJECTID", "Name"], where_clause=query) as sc:
-                    for row in sc:
-                        try:
-                            rasteritem = os.path.join(
-                                fullPath, "OBJECTID={}".format(row[0]))
-                            status = self.__invokeDynamicFn(
-                                [rasteritem],
-                                'registerraster',
-                                'arcpy.RegisterRaster_management',
-                                index
-                            )
-                            if not status:
-                                self.log(
-                                    "Failed for {}".format(
-                                        row[1]), self.m_log.const_critical_text)
-                            else:
-                                self.log(
-                                    "Successful for {}".format(
-                                        row[1]), self.m_log.const_general_text)
-                        except Exception as exp:
-                            self.log(
-                                "Failed for {}...{}".format(
-                                    row[1],
-                                    str(exp)),
-                                self.m_log.const_critical_text)
-                            continue
-                del sc
-                return True
-        elif (com == 'CPUDL'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]["desc"], self.m_base.m_mdName), self.m_log.const_general_text)
-            fullPath = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
-            return self.__invokeDynamicFn([], "classifypixelsusingdeeplearning", "arcpy.ia.ClassifyPixelsUsingDeepLearning", index)
-
-        elif (com == 'DOUDL'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            processKey = 'detectobjectsusingdeeplearning'
-            fullPath = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
-            in_raster = self.getProcessInfoValue(processKey, 'in_raster', index)
-            output_path = self.getProcessInfoValue(processKey, 'out_detected_objects', index)
-            if in_raster == '#':
-                in_raster = fullPath
-            if output_path == '#':
-                output_path = f'{fullPath}{processKey}'
-            return self.__invokeDynamicFn(
-                [
-                    in_raster, output_path, os.path.join(
-                        self.m_base.const_workspace_path_, 'Parameter/DLPKpackages', self.getProcessInfoValue(
-                            processKey, 'in_model_definition', index)), self.getProcessInfoValue(
-                        processKey, 'arguments', index), self.getProcessInfoValue(
-                            processKey, 'run_nms', index), self.getProcessInfoValue(
-                                processKey, 'confidence_score_field', index), self.getProcessInfoValue(
-                                    processKey, 'class_value_field', index), self.getProcessInfoValue(
-                                        processKey, 'max_overlap_ratio', index), self.getProcessInfoValue(
-                                            processKey, 'processing_mode', index)], processKey, 'arcpy.ia.DetectObjectsUsingDeepLearning', index)
-
-        elif (com == 'COUDL'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            processKey = 'classifyobjectsusingdeeplearning'
-            fullPath = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
-            in_raster = self.getProcessInfoValue(processKey, 'in_raster', index)
-            output_path = self.getProcessInfoValue(processKey, 'out_feature_class', index)
-            if in_raster == '#':
-                in_raster = fullPath
-            if output_path == '#':
-                output_path = f'{fullPath}{processKey}'
-            return self.__invokeDynamicFn(
-                [in_raster,
-                 output_path,
-                 os.path.join(self.m_base.const_workspace_path_, 'Parameter/DLPKpackages', self.getProcessInfoValue(processKey, 'in_model_definition', index)),
-                 self.getProcessInfoValue(processKey, 'in_features', index),
-                 self.getProcessInfoValue(processKey, 'class_label_field', index),
-                 self.getProcessInfoValue(processKey, 'processing_mode', index),
-                 self.getProcessInfoValue(processKey, 'model_arguments', index)],
-                processKey,
-                'arcpy.ia.ClassifyObjectsUsingDeepLearning',
-                index
-            )
-        elif (com == 'EFUAIM'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            processKey = 'extractfeaturesusingaimodels'
-            fullPath = os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)
-            in_raster = self.getProcessInfoValue(processKey, 'in_raster', index)
-            output_path = self.getProcessInfoValue(processKey, 'out_location', index)
-            out_prefix = self.getProcessInfoValue(processKey, 'out_prefix', index)
-            if in_raster == '#':
-                in_raster = fullPath
-            if output_path == '#':
-                output_path = f'{fullPath}{processKey}'
-            if out_prefix == '#':
-                out_prefix = f'{fullPath}{processKey}'
-            return self.__invokeDynamicFn(
-                [in_raster,
-                 self.getProcessInfoValue(processKey, 'mode', index),
-                 output_path,
-                 out_prefix,
-                 self.getProcessInfoValue(processKey, 'area_of_interest', index),
-                 self.getProcessInfoValue(processKey, 'pretrained_models', index),
-                 self.getProcessInfoValue(processKey, 'additional_models', index),
-                 self.getProcessInfoValue(processKey, 'confidence_threshold', index),
-                 self.getProcessInfoValue(processKey, 'save_intermediate_output', index),
-                 self.getProcessInfoValue(processKey, 'test_time_augmentation', index),
-                 self.getProcessInfoValue(processKey, 'buffer_distance', index),
-                 self.getProcessInfoValue(processKey, 'extend_length', index),
-                 self.getProcessInfoValue(processKey, 'smoothing_tolerance', index),
-                 self.getProcessInfoValue(processKey, 'dangle_length', index),
-                 self.getProcessInfoValue(processKey, 'in_road_features', index),
-                 self.getProcessInfoValue(processKey, 'road_buffer_width', index),
-                 self.getProcessInfoValue(processKey, 'regularize_parcels', index),
-                 self.getProcessInfoValue(processKey, 'post_processing_workflow', index),
-                 self.getProcessInfoValue(processKey, 'out_features', index),
-                 self.getProcessInfoValue(processKey, 'parcel_tolerance', index),
-                 self.getProcessInfoValue(processKey, 'regularization_method', index),
-                 self.getProcessInfoValue(processKey, 'poly_tolerance', index)],
-                processKey,
-                'arcpy.geoai.ExtractFeaturesUsingAIModels',
-                index
-            )
-        elif (com == 'CL'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'convertlas',
-                'arcpy.conversion.ConvertLas',
-                index
-            )
-        elif (com == 'EL'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'extractlas',
-                'arcpy.ddd.ExtractLas',
-                index
-            )
-        elif (com == 'CLAS'):
-            self.m_log.Message("\t{}:{}".format(self.commands[com]['desc'], self.m_base.m_mdName), self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'colorizelas',
-                'arcpy.ddd.ColorizeLas',
-                index
-            )
-        elif (com == 'CSTCDL'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'createspacetimecubedefinedlocations',
-                'arcpy.stpm.CreateSpaceTimeCubeDefinedLocations',
-                index
-            )
-        elif (com == 'STCCPD'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
-                self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'changepointdetection',
-                'arcpy.stpm.ChangePointDetection',
-                index
-            )
-        elif (com == 'STCTSC'):
-            self.m_log.Message(
-                "\t{}:{}".format(
-                    self.commands[com]['desc'],
-                    self.m_base.m_mdName),
+            return True
+        except BaseException as exp:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            self.log(str(exp), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_ETC(self, com, index):
+        processKey = 'exporttilecache'
+        try:
+            self.log(
+                "Exporting cache for:" +
+                self.getProcessInfoValue(
+                    processKey,
+                    'in_target_cache_name',
+                    index),
                 self.m_log.const_general_text)
-            return self.__invokeDynamicFn(
-                [],
-                'timeseriesclustering',
-                'arcpy.stpm.TimeSeriesClustering',
-                index
-            )
-        elif com == "TF":
-            try:
-                self.m_log.Message("\t{}:{}".format(self.commands[com]["desc"], self.m_base.m_mdName), self.m_log.const_general_text)
-                processKey = "transferfiles"
-                inacspath_update = []
-                inacspath = self.getProcessInfoValue(processKey, "input_paths", index)
-                inacspath_split = inacspath.split(";")
-                for inacsfile in inacspath_split:
-                    if (inacsfile.find(".acs")) > -1 and (inacsfile.find("/") == -1):
-                        inacspath_update.append(os.path.join(self.m_base.const_workspace_path_, "Parameter/ACSFiles", inacsfile))
-                    else:
-                        inacspath_update.append(inacsfile)
-                inacspath = ";".join(inacspath_update)
-                outpath = self.getProcessInfoValue(processKey, "output_folder", index)
-                if (outpath.find(".acs")) > -1 and (outpath.find("/") == -1):
-                    outpath = os.path.join(self.m_base.const_workspace_path_, "Parameter/ACSFiles", outpath)
-                return self.__invokeDynamicFn(
-                    [inacspath, outpath, self.getProcessInfoValue(processKey, "file_filter", index)],
+            targetLocation = self.getProcessInfoValue(
+                processKey, 'in_target_cache_folder', index)
+            if not Planner.isActive():
+                os.makedirs(targetLocation)
+            result = arcpy.ExportTileCache_management(
+                self.getProcessInfoValue(
+                    processKey, 'in_cache_source', index), targetLocation, self.getProcessInfoValue(
+                    processKey, 'in_target_cache_name', index), self.getProcessInfoValue(
+                    processKey, 'export_cache_type', index), self.getProcessInfoValue(
+                    processKey, 'storage_format_type', index), self.getProcessInfoValue(
+                    processKey, 'scales', index), self.getProcessInfoValue(
+                        processKey, 'area_of_interest', index))
+            Base.log_gptool_result(self.log, self.m_log.const_general_text, result)
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
+
+    def _cmd_STP(self, com, index):
+        processKey = 'sharepackage'
+        try:
+            self.log(
+                "Publishing Tile Package:" +
+                self.getProcessInfoValue(
                     processKey,
-                    "arcpy.management.TransferFiles",
-                    index,
-                )
+                    'in_package',
+                    index),
+                self.m_log.const_general_text)
 
-            except BaseException as exp:
-                self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
-                return False
+            arcpy.SharePackage_management(
+                self.getProcessInfoValue(processKey, 'in_package', index),
+                self.getProcessInfoValue(processKey, 'username', index),
+                self.getProcessInfoValue(processKey, 'password', index),
+                self.getProcessInfoValue(processKey, 'summary', index),
+                self.getProcessInfoValue(processKey, 'tags', index),
+                self.getProcessInfoValue(processKey, 'credits', index),
+                self.getProcessInfoValue(processKey, 'public', index),
+                self.getProcessInfoValue(processKey, 'groups', index))
 
-        elif com == "ZSAT":
-            self.m_log.Message("\t{}:{}".format(self.commands[com]["desc"], self.m_base.m_mdName), self.m_log.const_general_text)
-            return self.__invokeDynamicFn([], "zonalstatisticsastable", "arcpy.ia.ZonalStatisticsAsTable", index)
+            return True
+        except BaseException:
+            self.log(arcpy.GetMessages(), self.m_log.const_critical_text)
+            return False
 
-        elif com == "GRFRF":
-            self.m_log.Message("\t{}:{}".format(self.commands[com]["desc"], self.m_base.m_mdName), self.m_log.const_general_text)
+    def _cmd_RR(self, com, index):
+        self.m_log.Message(
+            "\t{}:{}".format(
+                self.commands[com]['desc'],
+                self.m_base.m_mdName),
+            self.m_log.const_general_text)
+        fullPath = fullPath = os.path.join(
+            self.m_base.m_geoPath, self.m_base.m_mdName)
+        processKey = 'registerraster'
+        try:
+            query = self.m_base.getXMLXPathValue(
+                'Application/Workspace/MosaicDataset/Processes/RegisterRaster/query', 'query')
+        except Exception as exp:
+            self.log(str(exp), self.m_log.const_critical_text)
+            self.log(
+                "Setting query value as #",
+                self.m_log.const_warning_text)
+            query = "#"
+        if query == "#":  # run the tool on the entire mosaic dataset
             return self.__invokeDynamicFn(
-                [], "generaterasterfromrasterfunction", "arcpy.management.GenerateRasterFromRasterFunction", index
+                [fullPath],
+                'registerraster',
+                'arcpy.RegisterRaster_management',
+                index
             )
         else:
-            # The command could be a user defined function externally defined
-            # in the module (MDCS_UC.py). Let's invoke it.
-            data = self.m_base.m_data
-            data['useResponse'] = False
-            bSuccess = self.m_base.invoke_user_function(com, data)
-            if ('useResponse' in data and
-                    data['useResponse']):
-                response = {'response': data['response']}
-                if ('code' in data):
-                    response['code'] = data['code']
-                if ('status' in data):
-                    response['status'] = data['status']
-                elif (isinstance(data['response'], dict) and
-                        'status' in data['response']):
-                    response['status'] = data['response']['status']
-                else:
-                    response['status'] = bSuccess
-                if (not bSuccess):
-                    return response
-            if (bSuccess):
-                if self.config:
-                    ParentRoot = 'Application/Workspace'
-                    mosaicDataset = self.m_base.getXMLXPathValue(
-                        '{}/MosaicDataset/Name'.format(ParentRoot), 'Name')
-                    workspace = self.m_base.getXMLXPathValue(
-                        '{}/WorkspacePath'.format(ParentRoot), 'WorkspacePath')
-                    geoDatabase = self.m_base.getXMLXPathValue(
-                        '{}/Geodatabase'.format(ParentRoot), 'Geodatabase')
-                    mkGeoPath = '{}{}'.format(
-                        os.path.join(
-                            workspace, geoDatabase), self.m_base.const_geodatabase_ext.lower() if (
-                            not geoDatabase.lower().endswith(
-                                self.m_base.const_geodatabase_ext.lower()) and not geoDatabase.lower().endswith('sde')) else '').replace(
-                        '\\', '/')
-                    self.m_base.m_geodatabase = geoDatabase
-                    self.m_base.m_workspace = workspace
-                    data['mosaicdataset'] = self.m_base.m_mdName = mosaicDataset
-                    data['workspace'] = self.m_base.m_geoPath = mkGeoPath
-                # Update internal data structures if user function has
-                # modifield the in-memory xml dom.
-                ret = True if not self.config else self.processInfo.init(self.config)
-                if ('useResponse' in data and
-                        data['useResponse']):
-                    response = {'response': data['response']}
-                    if ('code' in data):
-                        # Optional, any user defined code regardless of the
-                        # function status.
-                        response['code'] = data['code']
-                    if ('status' in data):
-                        # Overall function status, i.e. True or False
-                        response['status'] = data['status']
-                    return response
-                return ret
-        return False            # main function body return, no matching command found!
+            with arcpy.da.SearchCursor(fullPath, ["OBJECTID", "Name"], where_clause=query) as sc:
+                for row in sc:
+                    try:
+                        rasteritem = os.path.join(
+                            fullPath, "OBJECTID={}".format(row[0]))
+                        status = self.__invokeDynamicFn(
+                            [rasteritem],
+                            'registerraster',
+                            'arcpy.RegisterRaster_management',
+                            index
+                        )
+                        if not status:
+                            self.log(
+                                "Failed for {}".format(
+                                    row[1]), self.m_log.const_critical_text)
+                        else:
+                            self.log(
+                                "Successful for {}".format(
+                                    row[1]), self.m_log.const_general_text)
+                    except Exception as exp:
+                        self.log(
+                            "Failed for {}...{}".format(
+                                row[1],
+                                str(exp)),
+                            self.m_log.const_critical_text)
+                        continue
+            del sc
+            return True
+
 
     commands = \
         {
             'CM':
             {'desc': 'Create a new mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_CM
              },
             'CR':
             {'desc': 'Create new referenced mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_CR
              },
             'AF':
             {'desc': 'Add fields.',
-             'fnc': executeCommand
+             'fnc': _cmd_AF
              },
             'AR':
             {'desc': 'Add rasters/data to a mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_AR
              },
             'BF':
             {'desc': 'Build footprint.',
-             'fnc': executeCommand
+             'fnc': _cmd_BF
              },
             'JF':
             {'desc': 'Join the content of two tables based on a common attribute field.',
-             'fnc': executeCommand
+             'fnc': _cmd_JF
              },
             'BS':
             {'desc': 'Build Seamlines.',
-             'fnc': executeCommand
+             'fnc': _cmd_BS
              },
             'BP':
             {'desc': 'Build Pyramid.',
-             'fnc': executeCommand
+             'fnc': _cmd_BP
              },
             'ANCP':
             {'desc': 'Analyze Control Points.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'analyzecontrolpoints',
+             'tool': 'arcpy.AnalyzeControlPoints_management',
+             'first_arg': '{md}'
              },
             'APCP':
             {'desc': 'Append Control Points.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'appendcontrolpoints',
+             'tool': 'arcpy.AppendControlPoints_management '
              },
             'ABA':
             {'desc': 'Apply Block Adjustment.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'applyblockadjustment',
+             'tool': 'arcpy.ApplyBlockAdjustment_management',
+             'first_arg': '{md}'
              },
             'CBA':
             {'desc': 'Compute Block Adjustment.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'computeblockadjustment',
+             'tool': 'arcpy.ComputeBlockAdjustment_management',
+             'first_arg': '{md}'
              },
             'CCP':
             {'desc': 'Compute Control Points.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'computecontrolpoints',
+             'tool': 'arcpy.ComputeControlPoints_management',
+             'first_arg': '{md}'
              },
             'CTP':
             {'desc': 'Compute Tie Points.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'computetiepoints',
+             'tool': 'arcpy.ComputeTiePoints_management',
+             'first_arg': '{md}',
+             'msg': "\tCompute Tie Points : {md}"
              },
             'AMDS':
             {'desc': 'Alter Mosaic Dataset Schema.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'altermosaicdatasetschema',
+             'tool': 'arcpy.AlterMosaicDatasetSchema_management',
+             'first_arg': '{md}',
+             'msg': "\tAlter Mosaic Dataset Schema : {md}"
              },
             'AMD':
             {'desc': 'Analyze Mosaic Dataset.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'analyzemosaicdataset',
+             'tool': 'arcpy.AnalyzeMosaicDataset_management',
+             'first_arg': '{md}',
+             'msg': "\tAnalyze Mosaic Dataset : {md}"
              },
             'BMDIC':
             {'desc': 'Build Mosaic Dataset Item Cache.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'buildmosaicdatasetitemcache',
+             'tool': 'arcpy.BuildMosaicDatasetItemCache_management',
+             'first_arg': '{md}',
+             'msg': "\tBuild Mosaic Dataset Item Cache : {md}"
              },
             'CDA':
             {'desc': 'Compute Dirty Area.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'computedirtyarea',
+             'tool': 'arcpy.ComputeDirtyArea_management',
+             'first_arg': '{md}',
+             'msg': "\tCompute Dirty Area : {md}"
              },
             'GEA':
             {'desc': 'Generate Exclude Area.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'generateexcludearea',
+             'tool': 'arcpy.GenerateExcludeArea_management',
+             'msg': "\tGenerate Exclude Area : {md}"
              },
             'CS':
             {'desc': 'Calculate Statistics.',
-             'fnc': executeCommand
+             'fnc': _cmd_CS
              },
             'RP':
             {'desc': 'Repair mosaic dataset paths',
-             'fnc': executeCommand
+             'fnc': _cmd_RP
              },
             'CBMD':
             {'desc': 'Color balance mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_CBMD
              },
             'RRFMD':
             {'desc': 'Remove Rasters from Mosaic ataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_RRFMD
              },
             'DMD':
             {'desc': 'Delete Mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_DMD
              },
             'MMDI':
             {'desc': 'Merge Mosaic dataset items.',
-             'fnc': executeCommand
+             'fnc': _cmd_MMDI
              },
             'BPS':
             {'desc': 'Build pyramid and Statistics.',
-             'fnc': executeCommand
+             'fnc': _cmd_BPS
              },
             'ERF':
             {'desc': 'Edit raster function.',
-             'fnc': executeCommand
+             'fnc': _cmd_ERF
              },
             'DN':
             {'desc': 'Define no data values.',
-             'fnc': executeCommand
+             'fnc': _cmd_DN
              },
             'SP':
             {'desc': 'Set mosaic dataset properties.',
-             'fnc': executeCommand
+             'fnc': _cmd_SP
              },
             'IG':
             {'desc': 'Import mosaic dataset geometry.',
-             'fnc': executeCommand
+             'fnc': _cmd_IG
              },
             'DF':
             {'desc': 'Delete field.',
-             'fnc': executeCommand
+             'fnc': _cmd_DF
              },
             'IF':
             {'desc': 'Import field values/calculate fields.',
-             'fnc': executeCommand
+             'fnc': _cmd_IF
              },
             'BB':
             {'desc': 'Build boundary.',
-             'fnc': executeCommand
+             'fnc': _cmd_BB
              },
             'SS':
             {'desc': 'Set statistics for a raster or mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_SS
              },
             'CC':
             {'desc': 'Computes the minimum and maximum cell sizes for the rasters in a mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_CC
              },
             'BO':
             {'desc': 'Defines and generates overviews for a mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_BO
              },
             'DO':
             {'desc': 'Defines the tiling schema and properties of the preprocessed raster datasets.',
-             'fnc': executeCommand
+             'fnc': _cmd_DO
              },
             'AI':
             {'desc': 'Adds attribute index on the mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_AI
              },
             'RI':
             {'desc': 'Removes attribute index on the mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _cmd_RI
              },
             'CFC':
             {'desc': 'Create cache feature class.',
-             'fnc': executeCommand
+             'fnc': _cmd_CFC
              },
             'CV':
             {'desc': 'Calculate mosaic dataset values.',
-             'fnc': executeCommand
+             'fnc': _cmd_CV
              },
             'CP':
             {'desc': 'Compact file geodatabase.',
-             'fnc': executeCommand
+             'fnc': _cmd_CP
              },
             'SY':
             {'desc': 'Synchronize mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'synchronizemosaicdataset',
+             'tool': 'arcpy.SynchronizeMosaicDataset_management',
+             'first_arg': '{md}',
+             'msg': "\tSynchronize mosaic dataset:{md}"
              },
             'SE':
             {'desc': 'Set environment variables.',
-             'fnc': executeCommand
+             'fnc': _cmd_SE
              },
             'MTC':
             {'desc': 'Manage Tile Cache.',
-             'fnc': executeCommand
+             'fnc': _cmd_MTC
              },
             'ETC':
             {'desc': 'Export Tile Cache.',
-             'fnc': executeCommand
+             'fnc': _cmd_ETC
              },
             'STP':
             {'desc': 'Share Package.',
-             'fnc': executeCommand
+             'fnc': _cmd_STP
              },
             'EMDG':
             {'desc': 'Export mosaic dataset geometry.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'exportmosaicdatasetgeometry',
+             'tool': 'arcpy.ExportMosaicDatasetGeometry_management',
+             'first_arg': '{md}',
+             'msg': "\tExport mosaic dataset geometry:{md}"
              },
             'EMDI':
             {'desc': 'Export mosaic dataset items.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'exportmosaicdatasetitems',
+             'tool': 'arcpy.ExportMosaicDatasetItems_management',
+             'first_arg': '{md}',
+             'msg': "\tExport mosaic dataset items:{md}"
              },
             'SMDI':
             {'desc': 'Split mosaic dataset items.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'splitmosaicdatasetitems',
+             'tool': 'arcpy.MergeMosaicDatasetItems_management',
+             'first_arg': '{md}',
+             'msg': "\tSplit mosaic dataset items:{md}"
              },
             'CSDD':
             {'desc': 'Create an image service definition draft file.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'createimagesddraft',
+             'tool': 'arcpy.CreateImageSDDraft',
+             'md_default': True
              },
             'STS':
             {'desc': 'Stages a service definition.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'stageservice_server',
+             'tool': 'arcpy.StageService_server'
              },
             'USD':
             {'desc': 'Uploads and publishes a service definition to a specified server.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'uploadservicedefinition_server',
+             'tool': 'arcpy.UploadServiceDefinition_server',
+             'msg': "\t{desc}"
              },
             'CRTT':
             {'desc': 'Delete records from the Raster Type table.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'clearrastertypetable',
+             'tool': 'arcpy.DeleteRows_management',
+             'first_arg': 'AMD_{md}_ART'
              },
             'CLT':
             {'desc': 'Delete records from the Logs table.',
-             'fnc': executeCommand
-             },
-            'AR':
-            {'desc': 'Add rasters/data to a mosaic dataset.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'clearlogstable',
+             'tool': 'arcpy.DeleteRows_management',
+             'first_arg': 'AMD_{md}_LOG'
              },
             'CCM':
             {'desc': 'Compute Camera Model.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'computecameramodel',
+             'tool': 'arcpy.ComputeCameraModel_management',
+             'first_arg': '{md}'
              },
             'BSM':
             {'desc': 'Build Stereo Model.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'buildstereomodel',
+             'tool': 'arcpy.BuildStereoModel_management',
+             'first_arg': '{md}'
              },
             'GPC':
             {'desc': 'Generate Point Cloud.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'generatepointcloud',
+             'tool': 'arcpy.GeneratePointCloud_management',
+             'first_arg': '{md}'
              },
             'IFPC':
             {'desc': 'Interpolate From Point Cloud.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'interpolatefrompointcloud',
+             'tool': 'arcpy.InterpolateFromPointCloud_management'
              },
             'CRA':
             {'desc': 'Copy Raster.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'copyraster',
+             'tool': 'arcpy.CopyRaster_management',
+             'md_default': True
              },
             'DEL':
             {'desc': 'Delete Mosaic.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'delete',
+             'tool': 'arcpy.Delete_management'
              },
             'RR':
             {'desc': 'Register Raster.',
-             'fnc': executeCommand
+             'fnc': _cmd_RR
              },
             'BMI':
             {'desc': 'Build Multidimensional Info.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'buildmultidimensionalinfo',
+             'tool': 'arcpy.BuildMultidimensionalInfo_management',
+             'first_arg': '{md}'
              },
             'AMR':
             {'desc': 'Aggregate Multidimensional Raster.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'aggregatemultidimensionalraster',
+             'tool': 'arcpy.ia.AggregateMultidimensionalRaster'
              },
             'ACUC':
             {'desc': 'Analyze Changes Using CCDC.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'analyzechangesusingccdc',
+             'tool': 'arcpy.ia.AnalyzeChangesUsingCCDC'
              },
             'DCUCAR':
             {'desc': 'Detect Change Using Change Analysis Raster.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'detectchangeusingchangeanalysis',
+             'tool': 'arcpy.ia.DetectChangeUsingChangeAnalysis'
              },
             'FAS':
             {'desc': 'Find Argument Statistics.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'findargumentstatistics',
+             'tool': 'arcpy.ia.FindArgumentStatistics'
              },
             'GMA':
             {'desc': 'Generate Multidimensional Anomaly.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'generatemultidimensionalanomaly',
+             'tool': 'arcpy.ia.GenerateMultidimensionalAnomaly'
              },
             'CF':
-            {
-                'desc': 'Compute Fiducials.',
-                'fnc': executeCommand
-            },
+            {'desc': 'Compute Fiducials.',
+             'fnc': _invokeToolCommand,
+             'process': 'computefiducials',
+             'tool': 'arcpy.ComputeFiducials_management',
+             'first_arg': '{md}'
+             },
             'UIO':
-            {
-                'desc': 'Update Interior Orientation.',
-                'fnc': executeCommand
-            },
+            {'desc': 'Update Interior Orientation.',
+             'fnc': _invokeToolCommand,
+             'process': 'updateinteriororientation',
+             'tool': 'arcpy.UpdateInteriorOrientation_management',
+             'first_arg': '{md}'
+             },
             'EFACP':
-            {
-                'desc': 'Export Frame And Camera Parameters.',
-                'fnc': executeCommand
-            },
+            {'desc': 'Export Frame And Camera Parameters.',
+             'fnc': _invokeToolCommand,
+             'process': 'exportframeandcameraparameters',
+             'tool': 'arcpy.ExportFrameAndCameraParameters_management',
+             'first_arg': '{md}'
+             },
             'GBAR':
-            {
-                'desc': 'Generate Block Adjustment Report.',
-                'fnc': executeCommand
-            },
+            {'desc': 'Generate Block Adjustment Report.',
+             'fnc': _invokeToolCommand,
+             'process': 'generateblockadjustmentreport',
+             'tool': 'arcpy.GenerateBlockAdjustmentReport_management',
+             'first_arg': '{md}'
+             },
             'GTR':
             {'desc': 'Generate Trend Raster.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'generatetrendraster',
+             'tool': 'arcpy.ia.GenerateTrendRaster'
              },
             'PUTR':
             {'desc': 'Predict Using Trend Raster.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'predictusingtrendraster',
+             'tool': 'arcpy.ia.PredictUsingTrendRaster'
              },
             'CPCSLP':
             {'desc': 'Creates a point cloud scene layer package (.slpk file) from LAS, zLAS, LAZ, or LAS dataset input.',
-             'fnc': executeCommand
+             'fnc': _cmd_CPCSLP
              },
             'CPUDL':
             {'desc': 'Gives Segmentaed image as output using Deep Learning',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'classifypixelsusingdeeplearning',
+             'tool': 'arcpy.ia.ClassifyPixelsUsingDeepLearning'
              },
             'COUDL':
             {'desc': 'Classifying Objects using Deep Learning',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'classifyobjectsusingdeeplearning',
+             'tool': 'arcpy.ia.ClassifyObjectsUsingDeepLearning',
+             'args': [('in_raster', ArgMD), ('out_feature_class', ArgMDProcess),
+                      ('in_model_definition', ArgDLPK), 'in_features', 'class_label_field', 'processing_mode',
+                      'model_arguments']
              },
             'DOUDL':
             {'desc': 'Detecing Objects using Deep Learning',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'detectobjectsusingdeeplearning',
+             'tool': 'arcpy.ia.DetectObjectsUsingDeepLearning',
+             'args': [('in_raster', ArgMD), ('out_detected_objects', ArgMDProcess),
+                      ('in_model_definition', ArgDLPK), 'arguments', 'run_nms', 'confidence_score_field',
+                      'class_value_field', 'max_overlap_ratio', 'processing_mode']
              },
             'EFUAIM':
             {'desc': 'Extract Features Using AI Models',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'extractfeaturesusingaimodels',
+             'tool': 'arcpy.geoai.ExtractFeaturesUsingAIModels',
+             'args': [('in_raster', ArgMD), 'mode', ('out_location', ArgMDProcess), ('out_prefix', ArgMDProcess),
+                      'area_of_interest', 'pretrained_models', 'additional_models', 'confidence_threshold',
+                      'save_intermediate_output', 'test_time_augmentation', 'buffer_distance', 'extend_length',
+                      'smoothing_tolerance', 'dangle_length', 'in_road_features', 'road_buffer_width',
+                      'regularize_parcels', 'post_processing_workflow', 'out_features', 'parcel_tolerance',
+                      'regularization_method', 'poly_tolerance']
              },
             'CL':
             {'desc': 'Convert LAS',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'convertlas',
+             'tool': 'arcpy.conversion.ConvertLas'
              },
             'CLAS':
             {'desc': 'Colorize LAS',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'colorizelas',
+             'tool': 'arcpy.ddd.ColorizeLas'
              },
             'EL':
             {'desc': 'Extract LAS',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'extractlas',
+             'tool': 'arcpy.ddd.ExtractLas'
              },
             'COID':
             {'desc': 'Create Oriented Imagery Dataset',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'createorientedimagerydataset',
+             'tool': 'arcpy.oi.CreateOrientedImageryDataset',
+             'msg': "\t{desc}"
              },
             'GSFOID':
             {'desc': 'Generate Service From Oriented Imagery Dataset',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'generateservicefromorientedimagerydataset',
+             'tool': 'arcpy.oi.GenerateServiceFromOrientedImageryDataset',
+             'msg': "\t{desc}"
              },
             'BOIF':
             {'desc': 'Build Oriented Imagery Footprint',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'buildorientedimageryfootprint',
+             'tool': 'arcpy.oi.BuildOrientedImageryFootprint',
+             'msg': "\t{desc}"
              },
             'AIFCIT':
             {'desc': 'Add Images From Custom Input Type',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'addimagesfromcustominputtype',
+             'tool': 'arcpy.oi.AddImagesFromCustomInputType',
+             'msg': "\t{desc}"
              },
             'AITOID':
             {'desc': 'Add Images To Oriented Imagery Dataset',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'addimagestoorientedimagerydataset',
+             'tool': 'arcpy.oi.AddImagesToOrientedImageryDataset',
+             'msg': "\t{desc}"
              },
             'UOIDP':
             {'desc': 'Update Oriented Imagery Dataset Properties',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'updateorientedimagerydatasetproperties',
+             'tool': 'arcpy.oi.UpdateOrientedImageryDatasetProperties',
+             'msg': "\t{desc}"
              },
             'CCSCF':
             {'desc': 'Create Cloud Storage Connection File',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'createcloudstorageconnectionfile',
+             'tool': 'arcpy.CreateCloudStorageConnectionFile_management',
+             'msg': "\t{desc}"
              },
             'CSTCDL':
             {'desc': 'Create Space Time Cube Defined Locations.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'createspacetimecubedefinedlocations',
+             'tool': 'arcpy.stpm.CreateSpaceTimeCubeDefinedLocations'
              },
             'STCCPD':
             {'desc': 'Change Point Detection.',
-             'fnc': executeCommand
+             'fnc': _invokeToolCommand,
+             'process': 'changepointdetection',
+             'tool': 'arcpy.stpm.ChangePointDetection'
              },
             'STCTSC':
             {'desc': 'Time Series Clustering.',
-             'fnc': executeCommand
-             },
-        "TF": {"desc": "Transfer Files", "fnc": executeCommand},
-        "ZSAT": {"desc": "Zonal Statistics As Table", "fnc": executeCommand},
-        "PTDT": {"desc": "Publish 3D Tiles", "fnc": executeCommand},
-        "GRFRF": {"desc": "Generate Raster From Raster Function", "fnc": executeCommand},
+             'fnc': _invokeToolCommand,
+             'process': 'timeseriesclustering',
+             'tool': 'arcpy.stpm.TimeSeriesClustering'
+             },
+            'TF':
+            {'desc': 'Transfer Files',
+             'fnc': _invokeToolCommand,
+             'process': 'transferfiles',
+             'tool': 'arcpy.management.TransferFiles',
+             'args': [('input_paths', ArgACS), ('output_folder', ArgACS), 'file_filter']
+             },
+            'ZSAT':
+            {'desc': 'Zonal Statistics As Table',
+             'fnc': _invokeToolCommand,
+             'process': 'zonalstatisticsastable',
+             'tool': 'arcpy.ia.ZonalStatisticsAsTable'
+             },
+            'PTDT':
+            {'desc': 'Publish 3D Tiles',
+             'fnc': _invokeToolCommand,
+             'process': 'package3dtiles',
+             'tool': 'arcpy.management.Package3DTiles',
+             'msg': "\t{desc}"
+             },
+            'GRFRF':
+            {'desc': 'Generate Raster From Raster Function',
+             'fnc': _invokeToolCommand,
+             'process': 'generaterasterfromrasterfunction',
+             'tool': 'arcpy.management.GenerateRasterFromRasterFunction'
+             }
         }
 
     # mapping of config/component paths.
@@ -2714,14 +2135,13 @@ class Solutions(Base.Base):
     sys.path.append(com_locations['ProcessInfo']['pyc'])
     sys.path.append(com_locations['Base']['pyc'])
 
-    # import all the modules required for the MDCS project.
-    #import Base
-    import CreateMD
-    import AddFields
-    import AddRasters
-    import SetMDProperties
-    import CreateRefMD
-    import ProcessInfo
+    # modules required for the MDCS project, imported on the first use.
+    CreateMD = Component('CreateMD')
+    AddFields = Component('AddFields')
+    AddRasters = Component('AddRasters')
+    SetMDProperties = Component('SetMDProperties')
+    CreateRefMD = Component('CreateRefMD')
+    ProcessInfo = Component('ProcessInfo')
 
     def getProcessInfoValue(self, process, key, index=0, indx=-1):
         if (index > len(self.processInfo.processInfo[process]) - 1):
@@ -2750,7 +2170,8 @@ class Solutions(Base.Base):
             if ret == False:
                 if (msg == self.m_base.const_init_ret_version or
                     msg == self.m_base.const_init_ret_sde or
-                        msg == self.m_base.const_init_ret_patch):
+                    msg == self.m_base.const_init_ret_patch or
+                        msg == self.m_base.const_init_ret_md_index):
                     return False
                 raise
             UserArgs = '__user'
@@ -2799,8 +2220,19 @@ class Solutions(Base.Base):
             if self.m_base.isUser_Function(self.m_base.EVT_ON_START):
                 aryCmds.insert(0, self.m_base.EVT_ON_START)
         cmdResults = []
+        journal = self._getJournal()
+        resumed = None
+        if journal:
+            if self.m_base.m_resume:
+                resumed = journal.resume(aryCmds)
+                if resumed is None:
+                    self.log('Resume: no previous run of this command chain/config found.', self.const_warning_text)
+            if resumed is None:
+                journal.start(aryCmds)
+        pos = -1
         while aryCmds:
             command = aryCmds.pop(0)
+            pos += 1
             ucCommand = command
             command = command.upper()
             is_user_cmd = False
@@ -2822,7 +2254,7 @@ class Solutions(Base.Base):
                             ucCommand)
                         # can't use self.executeCommand directly here. Need to
                         # check.
-                        self.commands[ucCommand]['fnc'] = self.commands['CM']['fnc']
+                        self.commands[ucCommand]['fnc'] = Solutions._invokeUserCommand
                         # preserve user defined function case.
                         cmd = ucCommand
                         is_user_cmd = True
@@ -2853,7 +2285,24 @@ class Solutions(Base.Base):
                     'Using parameter values at index (%s)' %
                     index, self.const_general_text)
             success = 'OK'
-            response = self.commands[cmd]['fnc'](self, cmd, index)
+            if (resumed and
+                    (pos, cat_cmd) in resumed and
+                    not self.m_base._is_builtin_event(cat_cmd)):
+                record = resumed[(pos, cat_cmd)]
+                self.m_base.m_last_AT_ObjectID = record['last_AT_ObjectID']
+                self.log('Resume: command completed in the previous run, skipping.', self.const_general_text)
+                response = {'status': True}
+                if record.get('output') is not None:
+                    response['output'] = record['output']
+            else:
+                toolCache = Base.getToolCacheInfo()
+                with tracer.span(cat_cmd, 'command', {'index': index, 'md': self.m_base.m_mdName}) as span, \
+                        Planner.command(cat_cmd, self.commands[cmd]['desc'],
+                                        os.path.join(self.m_base.m_geoPath, self.m_base.m_mdName)):
+                    response = self.commands[cmd]['fnc'](self, cmd, index)
+                    cacheInfo = Base.getToolCacheInfo()
+                    span.set('tool_cache_hits', cacheInfo.hits - toolCache.hits)
+                    span.set('tool_cache_misses', cacheInfo.misses - toolCache.misses)
             respVals = {'cmd': cmd}
             status = False
             if isinstance(response, bool):
@@ -2869,6 +2318,9 @@ class Solutions(Base.Base):
                     respVals['output'] = response['output']
             respVals['value'] = status
             cmdResults.append(respVals)
+            Planner.done(cat_cmd, status, respVals.get('output'))
+            if journal:
+                journal.command(pos, cat_cmd, status, respVals.get('output'), self.m_base.m_last_AT_ObjectID)
             if status == False:
                 success = 'Failed!'
             self.log(success, self.const_status_text)
@@ -2891,8 +2343,21 @@ class Solutions(Base.Base):
             if not aryCmds:
                 if self.on_exit():
                     aryCmds.append(self.m_base.EVT_ON_EXIT)
+        cacheInfo = Base.getToolCacheInfo()
+        self.log('Tool cache: hits({}) misses({}) size({})'.format(
+            cacheInfo.hits, cacheInfo.misses, cacheInfo.currsize), self.const_general_text)
         return cmdResults
 
+    def _getJournal(self):
+        if (Planner.isActive() or       # planned commands must not be taken as done by -resume.
+                not self.isLog() or
+                not self.m_log.logFolder):
+            return None
+        name = os.path.splitext(os.path.basename(self.config))[0] if self.config else 'MDCS'
+        if self.m_base.m_mdName:
+            name = '{}_{}'.format(name, self.m_base.m_mdName)
+        return Journal(self.m_log.logFolder, name, self.config)
+
     def on_exit(self):
         """ _OnExit event that gets fired at the end of the w/f """
         if self.m_base.EVT_ON_EXIT in self.m_base.on_evnt_args:
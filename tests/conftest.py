@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------
+# Copyright 2026 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: conftest.py
+# Description: Test setup, the MDCS module paths and a mocked (arcpy) for the runs without ArcGIS.
+# Version: 20261017
+# Requirements: Python, pytest
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+scriptPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+for folder in ['', 'Base', 'SolutionsLog', 'StepCache', 'AddRasters']:
+    path = os.path.join(scriptPath, folder)
+    if path not in sys.path:
+        sys.path.append(path)
+
+
+class ExecuteError(Exception):
+    pass
+
+
+def getArcpyMock():
+    arcpy = mock.MagicMock(name='arcpy')
+    arcpy.__name__ = 'arcpy'
+    arcpy.__spec__ = None
+    arcpy.ExecuteError = ExecuteError
+    arcpy.GetInstallInfo.return_value = {'Version': '3.3', 'BuildNumber': '1'}
+    arcpy.GetMessages.return_value = ''
+    arcpy.Exists.side_effect = lambda path, *args: os.path.exists(str(path))
+    return arcpy
+
+
+if 'arcpy' not in sys.modules:      # the real arcpy is used if it's already loaded.
+    sys.modules['arcpy'] = getArcpyMock()
+
+
+@pytest.fixture
+def arcpy():
+    """The (arcpy) mock with its call records cleared."""
+    module = sys.modules['arcpy']
+    if isinstance(module, mock.MagicMock):
+        module.reset_mock()
+    return module
@@ -0,0 +1,44 @@
+import os
+
+import ARTCache
+
+
+def writeART(path, value):
+    with open(path, 'w') as writer:
+        writer.write('<RasterType><DEM>{}</DEM></RasterType>'.format(value))
+
+
+def setDEM(doc, workspace, dataset):
+    node = doc.getElementsByTagName('DEM')[0].firstChild
+    if node.nodeValue == dataset:
+        return False
+    node.nodeValue = dataset
+    return True
+
+
+def test_getDocument(tmp_path):
+    path = str(tmp_path / 'a.art.xml')
+    writeART(path, 'a')
+    doc = ARTCache.getDocument(path)
+    assert ARTCache.getDocument(path) is doc
+    writeART(path, 'changed')
+    doc = ARTCache.getDocument(path)
+    assert doc.getElementsByTagName('DEM')[0].firstChild.nodeValue == 'changed'
+
+
+def test_getVariant(tmp_path):
+    template = str(tmp_path / 'a.art.xml')
+    writeART(template, 'a')
+    assert ARTCache.getVariant(template, 'ws', 'a', setDEM) is None    # unchanged.
+    path = ARTCache.getVariant(template, 'ws', 'dem', setDEM)
+    assert os.path.basename(path) == 'a.art.xml'
+    assert path.startswith(ARTCache.getFolder())
+    with open(path) as reader:
+        assert '<DEM>dem</DEM>' in reader.read()
+    assert ARTCache.getVariant(template, 'ws', 'dem', setDEM) == path
+    assert ARTCache.getVariant(template, 'ws', 'other', setDEM) != path
+    with open(template) as reader:
+        assert '<DEM>a</DEM>' in reader.read()
+    os.remove(path)
+    assert ARTCache.getVariant(template, 'ws', 'dem', setDEM) == path     # copied again.
+    assert os.path.exists(path)
@@ -0,0 +1,63 @@
+from xml.dom import minidom
+
+import pytest
+
+import Base
+
+
+class Log(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def Message(self, msg, level=0):
+        self.messages.append((msg, level))
+
+
+@pytest.fixture
+def base():
+    base = Base.Base()
+    base.m_log = Log()
+    base.m_dynamic_params = {'X': 'x1', 'Y': 'y1'}
+    return base
+
+
+def test_resolveDynamicValue(base):
+    assert base.resolveDynamicValue(' $x$ ') == 'x1'
+    assert base.resolveDynamicValue('a$x$b$y$c') == 'ax1by1c'
+    assert base.resolveDynamicValue('c:/data/$x$/$y$.tif') == 'c:/data/x1/y1.tif'
+    assert base.resolveDynamicValue('plain') == 'plain'
+
+
+def test_resolveDynamicValue_default(base):
+    assert base.resolveDynamicValue('d;$x$') == 'x1'
+    assert base.resolveDynamicValue('d;$unset$') == 'd'
+    assert base.resolveDynamicValue('a\\;b;$unset$') == 'a;b'
+    unresolved = {}
+    assert base.resolveDynamicValue('d;a$unset$', unresolved) == 'aunset'     # defaults apply to whole values only.
+    assert unresolved == {'unset': 'd'}
+
+
+def test_resolveDynamicValue_unset(base):
+    unresolved = {}
+    assert base.resolveDynamicValue('$unset$', unresolved) == 'unset'
+    assert base.resolveDynamicValue('$x$_$other$', unresolved) == 'x1_other'
+    assert unresolved == {'unset': '', 'other': ''}
+
+
+def test_resolveDynamicValue_escape(base):
+    assert base.resolveDynamicValue('\\$') == '$'
+    assert base.resolveDynamicValue('cost \\$5 $x$') == 'cost $5 x1'
+    assert base.resolveDynamicValue('C:\\data\\$x$') == 'C:\\data\\x1'     # a variable follows, not an escape.
+    assert base.resolveDynamicValue('$ 5') == '$ 5'
+
+
+def test_setUserDefinedValues(base):
+    base.m_doc = minidom.parseString(
+        '<Application><a>$x$</a><b>d;$unset$</b><c><d>$missing$</d></c><e>\\$</e></Application>')
+    assert base.setUserDefinedValues() == {'unset': 'd', 'missing': ''}
+    assert [base.m_doc.getElementsByTagName(n)[0].firstChild.data for n in 'abde'] == ['x1', 'd', 'missing', '$']
+    assert base.m_log.messages == [
+        ('Dynamic variable(s) not set, using defaults (unset=d)', base.const_general_text),
+        ('Dynamic variable(s) not set and without defaults (missing)', base.const_warning_text)
+    ]
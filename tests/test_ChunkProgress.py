@@ -0,0 +1,36 @@
+import pytest
+
+import ChunkProgress
+
+
+def test_getChunkSize():
+    assert ChunkProgress.getChunkSize(None) == 0
+    assert ChunkProgress.getChunkSize(' 50 ') == 50
+    assert ChunkProgress.getChunkSize('-1') == 0
+    with pytest.raises(ValueError):
+        ChunkProgress.getChunkSize('a')
+
+
+def test_getChunks():
+    assert ChunkProgress.getChunks(list('abcde'), 2) == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_getKey():
+    chunks = [['a', 'b'], ['c']]
+    key = ChunkProgress.getKey('a.gdb/md', 'id', 'Raster Dataset', chunks)
+    assert ChunkProgress.getKey('a.gdb/md', 'id', 'Raster Dataset', [['a', 'b'], ['c']]) == key
+    assert ChunkProgress.getKey('a.gdb/md', 'id', 'Raster Dataset', [['a'], ['b', 'c']]) != key
+    assert ChunkProgress.getKey('a.gdb/md', 'other', 'Raster Dataset', chunks) != key
+
+
+def test_resume(tmp_path):
+    geoPath = str(tmp_path / 'Amberg.gdb')
+    progress = ChunkProgress.ChunkProgress(geoPath, 'md', 'key')
+    assert progress.path == str(tmp_path / 'Amberg.md.ar_progress.journal')
+    assert progress.open(3, True) == {}
+    progress.chunk(0, 2, 0, 2, True, 1.0)
+    progress.chunk(1, 2, 2, 3, False, 1.0)
+    assert sorted(progress.open(3, True)) == [0]
+    assert sorted(ChunkProgress.ChunkProgress(geoPath, 'md', 'other').getDone()) == []     # other sources.
+    assert progress.open(3, False) == {}
+    assert progress.getDone() == {}     # a new run.
@@ -0,0 +1,74 @@
+from xml.dom import minidom
+
+import pytest
+
+import ConfigModel
+
+Config = '''<Application>
+    <Name>Amberg</Name>
+    <Command>CM+AR</Command>
+    <Workspace>
+        <WorkspacePath>c:/data</WorkspacePath>
+        <Geodatabase>Amberg.gdb</Geodatabase>
+        <MosaicDataset>
+            <Name> md </Name>
+            <MosaicDatasetType>Source</MosaicDatasetType>
+            <AddRasters>
+                <AddRaster>
+                    <raster_type>Raster Dataset</raster_type>
+                    <filter></filter>
+                    <Sources>
+                        <data_path>c:/images</data_path>
+                        <data_path> c:/more </data_path>
+                    </Sources>
+                </AddRaster>
+            </AddRasters>
+            <Processes>
+                <CalculateValues>
+                    <CalculateValue><fieldname>a</fieldname><expression></expression></CalculateValue>
+                    <CalculateValue><fieldname>b</fieldname></CalculateValue>
+                </CalculateValues>
+                <BuildOverviews><define_missing_tiles>NO_DEFINE_MISSING_TILES</define_missing_tiles></BuildOverviews>
+                <Environment><pyramid>PYRAMIDS<levels>-1</levels></pyramid></Environment>
+            </Processes>
+            <Fields>
+                <Field><Name>Tag</Name><Type>TEXT</Type><Length>50</Length></Field>
+            </Fields>
+        </MosaicDataset>
+        <MosaicDataset><Name>other</Name></MosaicDataset>
+    </Workspace>
+</Application>'''
+
+
+@pytest.fixture
+def doc():
+    return minidom.parseString(Config)
+
+
+def test_fromDoc(doc):
+    model = ConfigModel.ConfigModel.fromDoc(doc)
+    assert (model.name, model.command, model.workspace_path, model.geodatabase) == ('Amberg', 'CM+AR', 'c:/data', 'Amberg.gdb')
+    md = model.md
+    assert (md.name, md.type) == ('md', 'Source')
+    assert md.add_rasters[0].values['raster_type'] == 'Raster Dataset'
+    assert md.add_rasters[0].values['filter'] == ''
+    assert md.add_rasters[0].data_paths == ('c:/images', 'c:/more')
+    values = md.processes['calculatevalues'][0]
+    assert [dict(v) for v in values] == [{'fieldname': 'a', 'expression': '#'}, {'fieldname': 'b'}]
+    assert md.processes['buildoverviews'][0]['define_missing_tiles'] == 'NO_DEFINE_MISSING_TILES'
+    assert md.environment[0][0].children == (('levels', '-1'),)
+    assert (md.fields[0].name, md.fields[0].type, md.fields[0].length) == ('Tag', 'TEXT', '50')
+
+
+def test_readOnly(doc):
+    model = ConfigModel.ConfigModel.fromDoc(doc)
+    with pytest.raises(AttributeError):
+        model.name = 'other'
+    with pytest.raises(TypeError):
+        model.md.values['Name'] = 'other'
+
+
+def test_getMosaicDatasetNodes(doc):
+    assert [ConfigModel.getValue(n.getElementsByTagName('Name')[0]) for n in ConfigModel.getMosaicDatasetNodes(doc)] == [' md ', 'other']
+    assert ConfigModel.getMosaicDatasetNode(minidom.parseString('<Application/>')) is None
+    assert ConfigModel.ConfigModel.fromDoc(None).md is None
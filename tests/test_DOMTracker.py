@@ -0,0 +1,57 @@
+from xml.dom import minidom
+
+from defusedxml import minidom as dminidom
+
+import DOMTracker
+
+Config = ('<Application><Workspace><Geodatabase>a</Geodatabase></Workspace>'
+          '<Processes><X><k>1</k></X></Processes></Application>')
+
+
+def test_values():
+    doc = dminidom.parseString(Config)
+    tracker = DOMTracker.track(doc)
+    assert DOMTracker.track(doc) is tracker
+    assert tracker.changedSince(0) == []
+    doc.getElementsByTagName('Geodatabase')[0].firstChild.data = 'b'
+    assert tracker.changedSince(0) == [('Application', 'Workspace', 'Geodatabase')]
+    assert tracker.structure_version == 0
+    version = tracker.version
+    doc.getElementsByTagName('k')[0].firstChild.nodeValue = '2'
+    doc.getElementsByTagName('X')[0].setAttribute('a', '1')
+    assert sorted(tracker.changedSince(version)) == [('Application', 'Processes', 'X'), ('Application', 'Processes', 'X', 'k')]
+
+
+def test_structure():
+    doc = dminidom.parseString(Config)
+    tracker = DOMTracker.track(doc)
+    node = doc.createElement('Y')
+    node.appendChild(doc.createTextNode('v'))
+    assert tracker.version == 0     # detached nodes aren't tracked until appended.
+    processes = doc.getElementsByTagName('Processes')[0]
+    processes.appendChild(node)
+    assert tracker.changedSince(0) == [('Application', 'Processes', 'Y')]
+    assert tracker.structure_version == 1
+    version = tracker.version
+    node.firstChild.data = 'w'
+    clone = doc.getElementsByTagName('X')[0].cloneNode(True)
+    processes.replaceChild(clone, node)
+    assert ('Application', 'Processes', 'Y') in tracker.changedSince(version)
+    clone.firstChild.firstChild.data = '3'
+    assert tracker.changedSince(tracker.version - 1) == [('Application', 'Processes', 'X', 'k')]
+
+
+def test_untracked_documents():
+    DOMTracker.track(dminidom.parseString(Config))
+    doc = minidom.parseString(Config)
+    assert type(doc.documentElement) is minidom.Element
+    assert type(doc.createTextNode('a')) is minidom.Text
+    assert minidom.Element.appendChild is minidom.Node.appendChild
+    assert not hasattr(minidom.Node.appendChild, '__wrapped__')
+
+
+def test_isAffected():
+    changed = [('Application', 'Processes', 'X')]
+    assert DOMTracker.isAffected(changed, ('Application', 'Processes'))
+    assert DOMTracker.isAffected(changed, ('Application', 'Processes', 'X', 'k'))
+    assert not DOMTracker.isAffected(changed, ('Application', 'Workspace'))
@@ -0,0 +1,78 @@
+import sys
+import threading
+
+import pytest
+
+import LazyImport
+
+
+@pytest.fixture
+def slowModule(tmp_path, monkeypatch):
+    (tmp_path / 'mdcs_slowmod.py').write_text(
+        'import time\n'
+        'import mdcs_slowcount\n'
+        'mdcs_slowcount.runs += 1\n'
+        'time.sleep(0.2)\n'
+        'def f():\n'
+        '    return 1\n')
+    (tmp_path / 'mdcs_slowcount.py').write_text('runs = 0\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'mdcs_slowmod'
+    for name in ['mdcs_slowmod', 'mdcs_slowcount']:
+        sys.modules.pop(name, None)
+
+
+def test_lazyImport_defers(slowModule):
+    module = LazyImport.lazyImport(slowModule)
+    assert not LazyImport.isLoaded(module)
+    assert module.__spec__.name == slowModule
+    assert not LazyImport.isLoaded(module)
+    import mdcs_slowmod
+    assert mdcs_slowmod is module
+    assert module.f() == 1
+    assert LazyImport.isLoaded(module)
+    assert LazyImport.lazyImport(slowModule) is module
+
+
+def test_lazyImport_threads(slowModule):
+    module = LazyImport.lazyImport(slowModule)
+    results = []
+    errors = []
+    start = threading.Barrier(8)
+
+    def call():
+        start.wait()
+        try:
+            results.append(module.f())
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=call) for i in range(0, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert results == [1] * 8
+    assert sys.modules['mdcs_slowcount'].runs == 1
+
+
+def test_load(slowModule):
+    module = LazyImport.load(LazyImport.lazyImport(slowModule))
+    assert LazyImport.isLoaded(module)
+    assert sys.modules['mdcs_slowcount'].runs == 1
+
+
+def test_lazyImport_missing():
+    with pytest.raises(ModuleNotFoundError):
+        LazyImport.lazyImport('mdcs_no_such_module')
+
+
+def test_reloadModule(monkeypatch):
+    monkeypatch.delenv(LazyImport.DevReloadEnv, raising=False)
+    assert LazyImport.reloadModule(LazyImport) is LazyImport
+    assert not LazyImport.isDevReload()
+    LazyImport.setDevReload(True)
+    try:
+        assert LazyImport.isDevReload()
+    finally:
+        LazyImport.setDevReload(False)
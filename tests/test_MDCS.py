@@ -0,0 +1,308 @@
+import os
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+import MDCS
+
+
+class FakePool(object):
+    """Runs the pooled MDCS steps in-process, records the specs."""
+
+    def __init__(self):
+        self.specs = []
+        self._lock = threading.Lock()
+
+    def run(self, fnc, spec):
+        with self._lock:
+            self.specs.append(spec)
+        return [{'cmd': c, 'output': spec.md_path, 'value': True} for c in spec.com.split('+')]
+
+
+class FakeInvoke(object):
+    calls = []
+
+    def __init__(self, name, args, evnt_fnc_update_args=None, log=None):
+        self.name = name
+        self.args = args
+
+    def init(self, **kwargs):
+        return True
+
+    def invoke(self):
+        FakeInvoke.calls.append((self.name, list(self.args)))
+        return True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(MDCS, 'getWarmPool', lambda settings=None: pool)
+    FakeInvoke.calls = []
+    monkeypatch.setattr(MDCS.Base, 'DynaInvoke', FakeInvoke)
+    return pool
+
+
+def test_getHostPaths():
+    root = os.path.abspath('root')
+    assert MDCS.getHostPaths(root, 'a') == os.path.join(root, 'a')
+    assert MDCS.getHostPaths(root, 'a; b') == ';'.join([os.path.join(root, 'a'), os.path.join(root, 'b')])
+    assert MDCS.getHostPaths(root, ['a', 'b']) == ';'.join([os.path.join(root, 'a'), os.path.join(root, 'b')])
+    absPath = os.path.abspath('data')
+    assert MDCS.getHostPaths(root, absPath) == absPath
+
+
+def test_getShards():
+    assert MDCS.getShards(list('abcde'), 2) == [['a', 'b', 'c'], ['d', 'e']]
+    assert MDCS.getShards(list('ab'), 4) == [['a'], ['b']]
+
+
+def test_runShardStep(pool, arcpy, tmp_path):
+    root = str(tmp_path)
+    mdcs = {'c': 'CM+AR+BO', 'm': 'Amberg.gdb/Amberg', 's': 'a;b;c', '__step__': 'md'}
+    captureMsg = MDCS.CaptureMessages()
+    retVals, status = MDCS.runShardStep({'path': 'job'}, root, mdcs, 3, captureMsg, use_threads=True, __mdcs__={'resp': []})
+    assert status, captureMsg.getMessages()['logs']
+    shards = sorted([s for s in pool.specs if '#' in s.user_args.get('__step__', '')], key=lambda s: s.user_args['__step__'])
+    assert len(shards) == 3
+    assert [s.sources for s in shards] == [[os.path.join(root, p)] for p in 'abc']
+    assert [s.com for s in shards] == ['CM+AR'] * 3
+    merge = [c for c in FakeInvoke.calls if c[0] == 'arcpy.AddRastersToMosaicDataset_management']
+    assert len(merge) == 1
+    target = os.path.join(root, 'output', 'job', 'Amberg.gdb/Amberg')
+    assert merge[0][1][:2] == [target, 'Table']
+    assert merge[0][1][2].split(';') == [s.md_path for s in shards]
+    assert [r['cmd'] for r in retVals] == ['CM', 'AR', 'BO']
+    assert arcpy.Delete_management.call_count == 3
+
+
+def test_runShardStep_requiresAR(pool):
+    captureMsg = MDCS.CaptureMessages()
+    mdcs = {'c': 'CM+BO', 'm': 'a.gdb/md', 's': 'a;b', '__step__': 'md'}
+    assert MDCS.runShardStep({'path': 'job'}, 'root', mdcs, 2, captureMsg, __mdcs__={'resp': []}) == ([], False)
+
+
+def test_getPoolSettings():
+    build = {'workers': 3, 'pool': {'max_tasks': 5}, 'steps': []}
+    assert MDCS.getPoolSettings({'job': {'params': {'build': build}}}) == {'max_tasks': 5, 'size': 3}
+    build['steps'] = [{'id': 'md', 'type': 'shard', 'shards': 4, 'args': {}}]
+    assert MDCS.getPoolSettings({'job': {'params': {'build': build}}})['size'] == 4   # shards of a step run side by side.
+    assert MDCS.getPoolSettings({'job': {}}) == {}
+
+
+def test_StepGraph():
+    steps = [
+        {'id': 'root', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'CM', 'm': 'A.gdb/md'}},
+        {'id': 'other', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'CM', 'm': 'B.gdb/md'}},
+        {'id': 'af', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'AF', 'm': '@root/o/CM'}},
+        {'id': 'tail', 'type': 'MDCS', 'enabled': 1, 'depends': ['other', 'later'], 'args': {'c': 'hello'}},
+        {'id': 'af.count', 'type': 'arcpy', 'enabled': 1, 'GetCount_management': {'in_rows': '@af/o/AF'}}
+    ]
+    graph = MDCS.StepGraph(steps)
+    assert graph.dependencies('root') == set()
+    assert graph.dependencies('other') == set()
+    assert graph.dependencies('af') == set(['root'])
+    assert graph.dependencies('tail') == set(['other'])     # unknown/later steps are ignored.
+    assert graph.dependencies('af.count') == set(['af'])
+    assert not graph.isReady('af', set(['other']))
+    assert graph.isReady('af', set(['root']))
+
+
+def getAmbergSteps():
+    with open(os.path.join(os.path.dirname(MDCS.solutionLib_path), 'jobSamples', 'Amberg1.job')) as reader:
+        import json
+        return json.load(reader)['job']['params']['build']['steps']
+
+
+def test_StepGraph_sameGeodatabase():
+    graph = MDCS.StepGraph(getAmbergSteps(), os.path.abspath('output/md'))
+    assert graph.dependencies('root') == set()
+    assert graph.dependencies('add_fields') == set(['root'])
+    assert graph.dependencies('add_rasters') == set(['root', 'add_fields'])
+    assert graph.dependencies('tail_end') == set(['root', 'add_rasters'])
+    assert not graph.isReady('add_rasters', set(['root']))
+
+
+def test_StepGraph_differentGeodatabases():
+    steps = [
+        {'id': 'a', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'CM+AR', 'm': 'A.gdb/md'}},
+        {'id': 'b', 'type': 'shard', 'enabled': 1, 'args': {'c': 'CM+AR', 'm': 'B.gdb/md', 's': 'x;y'}},
+        {'id': 'c', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'BO', 'm': 'A.gdb/md2'}},
+        {'id': 'd', 'type': 'MDCS', 'enabled': 1, 'args': {'c': 'BO', 'm': '@b/o/AR'}},
+        {'id': 'e', 'type': 'MDCS', 'enabled': 1, 'depends': 'a', 'args': {'c': 'hello'}},
+        {'id': 'd.stats', 'type': 'arcpy', 'enabled': 1, 'GetCount_management': {'in_rows': '@d/o/BO'}}
+    ]
+    graph = MDCS.StepGraph(steps, os.path.abspath('output/md'))
+    assert graph.dependencies('b') == set()
+    assert graph.dependencies('c') == set(['a'])
+    assert graph.dependencies('d') == set(['b'])
+    assert graph.dependencies('e') == set(['a'])
+    assert graph.dependencies('d.stats') == set(['d'])
+
+
+def test_getProcessRSS(monkeypatch):
+    import builtins
+    rss = MDCS.getProcessRSS()
+    assert rss is None or rss > 0
+    realImport = builtins.__import__
+    realOpen = builtins.open
+
+    def noPsutil(name, *args, **kwargs):
+        if name == 'psutil':
+            raise ImportError(name)
+        return realImport(name, *args, **kwargs)
+
+    def noProc(path, *args, **kwargs):
+        if path == '/proc/self/statm':
+            raise OSError(path)
+        return realOpen(path, *args, **kwargs)
+    monkeypatch.setattr(builtins, '__import__', noPsutil)
+    monkeypatch.setattr(builtins, 'open', noProc)
+    assert MDCS.getProcessRSS() is None    # no peak RSS fallback.
+
+
+def test_getWarmPool(monkeypatch):
+    monkeypatch.setattr(MDCS, 'g_warm_pools', {})
+    pool = MDCS.getWarmPool({'size': 2})
+    assert MDCS.getWarmPool({'size': '2', 'max_tasks': 0}) is pool
+    other = MDCS.getWarmPool({'size': 4, 'max_rss_mb': 1024})
+    assert other is not pool
+    assert (other.size, other.max_tasks, other.max_rss_mb) == (4, 0, 1024.0)
+    assert MDCS.getWarmPool({'size': 2}) is pool     # still usable, not shut down by the other settings.
+    MDCS.shutdownWarmPool()
+    assert MDCS.g_warm_pools == {}
+
+
+class FakeExecutor(object):
+    """Completes the tasks right away with the worker (rss)"""
+
+    def __init__(self, rss):
+        self.rss = rss
+        self.shutdowns = 0
+
+    def submit(self, fnc, tracePath, task, *args):
+        future = Future()
+        future.set_result({'result': task(*args), 'rss': self.rss})
+        return future
+
+    def shutdown(self, wait=True):
+        self.shutdowns += 1
+
+
+def test_WarmPool_recycleRSS():
+    pool = MDCS.WarmPool(2, max_rss_mb=1024)
+    pool._executor = executor = FakeExecutor(512)
+    assert pool.submit(abs, -1).result()['result'] == 1
+    assert pool._executor is executor
+    executor.rss = 2048
+    pool.submit(abs, -1)     # the batch/multi target path, not only (run)
+    assert executor.shutdowns == 1
+    assert pool._executor is None
+
+
+def test_WarmPool_recycleTasks():
+    pool = MDCS.WarmPool(1, max_tasks=2)
+    pool._executor = executor = FakeExecutor(None)
+    assert pool.run(abs, -1) == 1
+    assert executor.shutdowns == 0
+    pool.submit(abs, -1)
+    assert executor.shutdowns == 1
+
+
+class Log(object):
+    const_general_text = 0
+    const_warning_text = 1
+    const_critical_text = 2
+
+    def __init__(self):
+        self.messages = []
+
+    def Message(self, msg, level):
+        self.messages.append((msg, level))
+
+
+@pytest.fixture
+def log(monkeypatch):
+    log = Log()
+    monkeypatch.setattr(MDCS, 'log', log)
+    return log
+
+
+class FakeManifest(object):
+
+    def __init__(self):
+        self.commits = []
+
+    def commit(self, paths=None):
+        self.commits.append(paths)
+        return len(paths or [])
+
+
+def getAddDataInfo(manifest, sources, start=0, end=10):
+    return {'md': 'md', 'type': 'source', 'Dataset_ID': 'a', 'pre_AddRasters_record_count': start,
+            'post_AddRasters_record_count': end, 'manifest': manifest, 'sources': sources}
+
+
+def test_postAddData_manifest(arcpy, log):
+    manifest = FakeManifest()
+    info = getAddDataInfo(manifest, ['a.tif', 'b.tif'])
+    assert MDCS.postAddData('md.gdb', 'md', info)
+    assert manifest.commits == []   # not before the Dataset_IDs are set.
+    info['flush'] = True
+    assert MDCS.postAddData('md.gdb', 'md', info)
+    assert manifest.commits == [['a.tif', 'b.tif']]
+    assert arcpy.CalculateField_management.called
+
+
+def test_postAddData_manifestStampFailed(arcpy, log, monkeypatch):
+    manifest = FakeManifest()
+    info = getAddDataInfo(manifest, None)
+    assert MDCS.postAddData('md.gdb', 'md', info)
+    monkeypatch.setattr(arcpy.MakeMosaicLayer_management, 'side_effect', arcpy.ExecuteError('failed'))
+    info['flush'] = True
+    assert MDCS.postAddData('md.gdb', 'md', info) is False
+    assert manifest.commits == []   # the next run adds the sources again.
+    assert MDCS.ManifestCommits not in info
+
+
+def runCodeBlock(codeBlock, oid):
+    scope = {}
+    exec(codeBlock, scope)
+    return scope['getDatasetID'](oid)
+
+
+def test_getDatasetIDExpression_contiguous():
+    assert MDCS.getDatasetIDExpression([(0, 10, 'a'), (10, 25, 'a')]) == ("'a'", '')
+    expression, codeBlock = MDCS.getDatasetIDExpression([(0, 10, 'a'), (12, 25, 'a')])     # a gap, not a single range.
+    assert expression == 'getDatasetID(!OBJECTID!)'
+    assert [runCodeBlock(codeBlock, oid) for oid in (1, 11, 13)] == ['a', None, 'a']
+
+
+def test_getDatasetIDExpression_overlap():
+    expression, codeBlock = MDCS.getDatasetIDExpression([(0, 10, 'a'), (5, 20, 'b')])
+    assert expression == 'getDatasetID(!OBJECTID!)'
+    assert [runCodeBlock(codeBlock, oid) for oid in (0, 1, 5, 6, 20, 21)] == [None, 'a', 'a', 'b', 'b', None]   # the last node wins.
+
+
+def test_getDatasetIDExpression_openEnded():
+    expression, codeBlock = MDCS.getDatasetIDExpression([(0, 10, 'a'), (10, None, 'b')])
+    assert [runCodeBlock(codeBlock, oid) for oid in (10, 11, 1000000)] == ['a', 'b', 'b']
+    assert MDCS.getDatasetIDExpression([(0, 10, 'a'), (10, None, 'a')]) == ("'a'", '')
+
+
+@pytest.mark.parametrize('ranges, where', [
+    ([(4, 10, 'a'), (10, 25, 'b')], 'OBJECTID >4 AND OBJECTID <=25'),
+    ([(4, 10, 'a'), (10, None, 'b')], 'OBJECTID >4'),
+])
+def test_stampDatasetIDs(arcpy, log, monkeypatch, ranges, where):
+    monkeypatch.setattr(arcpy.ListFields, 'return_value', [])
+    monkeypatch.setattr(arcpy.GetCount_management, 'return_value', ['21'])
+    info = {'md': 'md', MDCS.DatasetIDRanges: ranges}
+    assert MDCS.stampDatasetIDs('md.gdb', info)
+    (path, lyrName, expression), _ = arcpy.MakeMosaicLayer_management.call_args
+    assert (path, expression) == (os.path.join('md.gdb', 'md'), where)
+    assert arcpy.AddField_management.call_count == 1
+    assert arcpy.CalculateField_management.call_args[0][:3] == (lyrName, MDCS.DatasetIDField, 'getDatasetID(!OBJECTID!)')
+    arcpy.Delete_management.assert_called_once_with(lyrName)
+    assert MDCS.DatasetIDRanges not in info
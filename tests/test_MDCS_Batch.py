@@ -0,0 +1,59 @@
+import os
+from concurrent.futures import Future
+
+import MDCS
+import MDCS_Batch
+
+
+def getPayload(steps):
+    return {'job': {'params': {'output': {'path': 'md'}, 'build': {'steps': steps}}}}
+
+
+def getKey(path):
+    return MDCS_Batch.getGeodatabaseKey(os.path.join(MDCS_Batch.hstCleanUpRoot, 'output', 'md', path))
+
+
+def test_getGeodatabasePath():
+    assert MDCS_Batch.getGeodatabasePath('c:/data/Amberg.gdb/Amberg1') == 'c:/data/Amberg.gdb'
+    assert MDCS_Batch.getGeodatabasePath('c:\\data\\conn.sde\\md') == 'c:/data/conn.sde'
+    assert MDCS_Batch.getGeodatabasePath('c:/data/md') is None
+
+
+def test_getJobGeodatabases():
+    payload = getPayload([
+        {'type': 'MDCS', 'id': 'root', 'args': {'c': 'CM', 'm': 'Amberg.gdb/Amberg1'}},
+        {'type': 'shard', 'id': 'sharded', 'args': {'c': 'AR', 'm': 'Sharded.gdb/md', 's': 'a;b'}},
+        {'type': 'MDCS', 'id': 'af', 'args': {'c': 'AF', 'm': '@root/o/CM'}},
+        {'type': 'gis', 'id': 'other', 'args': {'m': 'Other.gdb/md'}}
+    ])
+    assert MDCS_Batch.getJobGeodatabases(payload) == set([getKey('Amberg.gdb'), getKey('Sharded.gdb')])
+
+
+def test_getJobGeodatabases_invalid():
+    assert MDCS_Batch.getJobGeodatabases({}) == set()
+
+
+def test_getPoolSettings():
+    jobs = [
+        ('a', {'job': {'params': {'build': {'pool': {'size': 8, 'max_tasks': 10, 'max_rss_mb': 2048}}}}}),
+        ('b', {'job': {'params': {'build': {'pool': {'max_tasks': 5, 'max_rss_mb': 'x'}}}}}),
+        ('c', {})
+    ]
+    assert MDCS_Batch.getPoolSettings(jobs) == {'max_tasks': 5, 'max_rss_mb': 2048.0}
+
+
+class FakePool(object):
+
+    def submit(self, fnc, *args):
+        task = Future()
+        task.set_result({'result': fnc(*args), 'rss': None})
+        return task
+
+
+def test_schedule_settings(monkeypatch):
+    settings = []
+    monkeypatch.setattr(MDCS, 'getWarmPool', lambda value: settings.append(value) or FakePool())
+    tasks = [{'id': 'a', 'source': 'a', 'payload': 1, 'gdbs': set(['x'])}, {'id': 'b', 'source': 'b', 'payload': 2, 'gdbs': set(['x'])}]
+    report = MDCS_Batch.schedule(tasks, 2, lambda payload: {'status': True, 'response': payload}, settings={'max_rss_mb': 1024})
+    assert settings == [{'max_rss_mb': 1024, 'size': 2}]
+    assert report['summary']['succeeded'] == 2
@@ -0,0 +1,84 @@
+import os
+import sys
+import types
+
+import pytest
+
+import Planner
+
+
+def getArcpy():
+    arcpy = types.ModuleType('arcpy')
+    arcpy.ExecuteError = type('ExecuteError', (Exception,), {})
+    arcpy.calls = []
+
+    def CreateMosaicDataset_management(in_workspace, in_mosaicdataset_name, coordinate_system=None):
+        arcpy.calls.append('CreateMosaicDataset_management')
+
+    def Exists(path):
+        return False
+    arcpy.CreateMosaicDataset_management = CreateMosaicDataset_management
+    arcpy.Exists = Exists
+    arcpy.ListFields = lambda *args: arcpy.calls.append('ListFields')
+    return arcpy
+
+
+@pytest.fixture
+def module(monkeypatch):
+    """A loaded MDCS module using (arcpy)"""
+    arcpy = getArcpy()
+    monkeypatch.setitem(sys.modules, 'arcpy', arcpy)
+    module = types.ModuleType('mdcs_planned')
+    module.__file__ = os.path.join(os.path.dirname(os.path.dirname(Planner.__file__)), 'mdcs_planned.py')
+    module.arcpy = arcpy
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    yield module
+    Planner.stop()
+
+
+def test_plan(module):
+    arcpy = module.arcpy
+    plan = Planner.start({('command', 'CM'): 2.0})
+    assert Planner.isActive()
+    Planner.setStep('md')
+    with Planner.command('CM', 'Create mosaic dataset', 'md'):
+        module.arcpy.CreateMosaicDataset_management('c:/data/a.gdb', 'md', coordinate_system='$srs$')
+        assert module.arcpy.Exists('c:/data/a.gdb/md')
+        assert not module.arcpy.Exists('c:/data/b.gdb/md')
+        assert list(module.arcpy.ListFields('md')) == []
+        Planner.done('CM', True, 'c:/data/a.gdb/md')
+    assert arcpy.calls == []    # nothing ran.
+    assert Planner.stop() is plan
+    assert module.arcpy is arcpy
+    report = plan.report()
+    assert (report['status'], report['gptools'], report['warnings'], report['estimate_s']) == (True, 1, 1, 2.0)
+    command = report['commands'][0]
+    assert (command['step'], command['command'], command['output']) == ('md', 'CM', 'c:/data/a.gdb/md')
+    calls = command['calls']
+    assert [c['tool'] for c in calls] == ['arcpy.CreateMosaicDataset_management', 'arcpy.ListFields']
+    assert calls[0]['args'] == {'in_workspace': 'c:/data/a.gdb', 'in_mosaicdataset_name': 'md', 'coordinate_system': '$srs$'}
+    assert 'unresolved dynamic variable' in calls[0]['warnings'][0]
+
+
+def test_command_inactive():
+    with Planner.command('CM', 'desc') as entry:
+        assert entry is None
+    Planner.record('arcpy.Delete_management', ['a'])
+    assert not Planner.isActive()
+
+
+def test_getWarnings(tmp_path):
+    art = tmp_path / 'a.art.xml'
+    art.write_text('<a/>')
+    assert Planner.getWarnings({'raster_type': str(art), 'n': 1}) == []
+    assert len(Planner.getWarnings({'raster_type': str(tmp_path / 'none.art.xml')})) == 1
+    assert len(Planner.getWarnings({'where_clause': "Tag = 'a"})) == 1
+    assert Planner.getWarnings({'raster_type': 'https://host/a.art.xml'}) == []
+
+
+def test_Result():
+    result = Planner.Result('arcpy.da.SearchCursor')
+    with result as cursor:
+        assert list(cursor) == []
+    assert str(result.getOutput(0)) == '<arcpy.da.SearchCursor.getOutput>'
+    assert bool(result) and len(result) == 0
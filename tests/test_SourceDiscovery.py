@@ -0,0 +1,75 @@
+import os
+import csv
+
+import pytest
+
+import SourceDiscovery
+
+
+def touch(path, size=1):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as writer:
+        writer.write(b'x' * size)
+    return path
+
+
+@pytest.fixture
+def folder(tmp_path):
+    touch(str(tmp_path / 'a.tif'))
+    touch(str(tmp_path / 'a.txt'))
+    touch(str(tmp_path / 'sub' / 'b.TIF'), 10)
+    touch(str(tmp_path / 'sub' / 'deep' / 'c.tif'), 100)
+    return tmp_path
+
+
+def getNames(files):
+    return sorted([os.path.basename(f[0]) for f in files])
+
+
+def test_discover(folder):
+    (files, others) = SourceDiscovery.discover(str(folder), '*.tif')
+    assert getNames(files) == ['a.tif', 'b.TIF', 'c.tif']
+    assert others == []
+    (files, others) = SourceDiscovery.discover(str(folder), '*.tif', recursive=False)
+    assert getNames(files) == ['a.tif']
+
+
+def test_discover_paths(folder):
+    dataPaths = '{}; {}; https://host/a.tif'.format(folder / 'a.txt', folder / 'sub')
+    (files, others) = SourceDiscovery.discover(dataPaths, '*.tif')
+    assert getNames(files) == ['a.txt', 'b.TIF', 'c.tif']   # listed files aren't filtered.
+    assert others == ['https://host/a.tif']
+
+
+def test_discover_options(folder):
+    options = SourceDiscovery.getOptions({'discovery_regex': '^[ab]', 'discovery_min_size': '5', 'discovery_workers': '2'})
+    assert options.workers == 2
+    (files, others) = SourceDiscovery.discover(str(folder), '*.tif', options=options)
+    assert getNames(files) == ['b.TIF']
+    options = SourceDiscovery.getOptions({'discovery_max_size': '10', 'discovery_newer_than': '1'})
+    (files, others) = SourceDiscovery.discover(str(folder), '*.tif', options=options)
+    assert getNames(files) == ['a.tif', 'b.TIF']
+    options = SourceDiscovery.getOptions({'discovery_older_than': '1'})
+    (files, others) = SourceDiscovery.discover(str(folder), '*.tif', options=options)
+    assert getNames(files) == []
+
+
+def test_getOptions_invalid():
+    with pytest.raises(ValueError):
+        SourceDiscovery.getOptions({'discovery_min_size': 'a'})
+    with pytest.raises(ValueError):
+        SourceDiscovery.getTime('yesterday')
+    assert SourceDiscovery.getTime('2026-10-01') is not None
+
+
+def test_walk_errors(tmp_path):
+    errors = []
+    assert list(SourceDiscovery.walk([str(tmp_path / 'none')], errors=errors)) == []
+    assert [e[0] for e in errors] == [str(tmp_path / 'none')]
+
+
+def test_writeTable(tmp_path):
+    (path, count) = SourceDiscovery.writeTable(iter(['a.tif', 'b.tif']), str(tmp_path))
+    assert count == 2
+    with open(path, newline='') as reader:
+        assert list(csv.reader(reader)) == [[SourceDiscovery.TableField], ['a.tif'], ['b.tif']]
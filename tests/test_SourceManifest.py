@@ -0,0 +1,53 @@
+import os
+
+import SourceManifest
+from SourceManifest import SourceManifest as Manifest
+
+
+def getFiles(paths):
+    return [(p, os.path.getsize(p), os.path.getmtime(p)) for p in paths]
+
+
+def write(path, data):
+    with open(path, 'w') as writer:
+        writer.write(data)
+
+
+def test_getMode():
+    assert SourceManifest.getMode(' Content_Hash ') == SourceManifest.ModeContentHash
+    assert SourceManifest.getMode('') is None
+    assert SourceManifest.getMode('other') is None
+
+
+def test_getPath():
+    path = SourceManifest.getPath(os.path.join('data', 'Amberg.gdb'), 'md')
+    assert path == os.path.join('data', 'Amberg.md' + SourceManifest.CEXT)
+
+
+def test_filter(tmp_path):
+    paths = [str(tmp_path / n) for n in ('a.tif', 'b.tif')]
+    for p in paths:
+        write(p, p)
+    manifest = Manifest(str(tmp_path / 'md.manifest.sqlite'))
+    assert list(manifest.filter(getFiles(paths), 'id')) == paths
+    assert manifest.commit([paths[0]]) == 1      # an (AR) chunk.
+    assert manifest.commit() == 1
+    assert manifest.commit() == 0
+    assert list(manifest.filter(getFiles(paths))) == []
+    write(paths[1], 'changed')
+    assert list(manifest.filter(getFiles(paths))) == [paths[1]]
+
+
+def test_filter_contentHash(tmp_path):
+    path = str(tmp_path / 'a.tif')
+    write(path, 'data')
+    manifest = Manifest(str(tmp_path / 'md.manifest.sqlite'), SourceManifest.ModeContentHash)
+    assert list(manifest.filter(getFiles([path]))) == [path]
+    manifest.commit()
+    os.utime(path, (1, 1))      # touched, same content.
+    assert list(manifest.filter(getFiles([path]))) == []
+    assert manifest.commit() == 1
+    assert list(manifest.filter(getFiles([path]))) == []
+    assert manifest.m_touched == []
+    write(path, 'else')
+    assert list(manifest.filter(getFiles([path]))) == [path]
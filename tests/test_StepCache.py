@@ -0,0 +1,59 @@
+import os
+
+from StepCache import StepCache
+
+
+def touch(path, data=b'x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as writer:
+        writer.write(data)
+
+
+def test_getKey_args(tmp_path):
+    cache = StepCache(str(tmp_path / 'cache'))
+    args = {'c': 'CM+AR', 'm': 'a.gdb/md'}
+    key = cache.getKey(args)
+    assert cache.getKey(dict(args, __step__='other', l='log')) == key     # volatile args.
+    assert cache.getKey(dict(args, c='CM')) != key
+    config = str(tmp_path / 'config.xml')
+    touch(config, b'<a/>')
+    key = cache.getKey(dict(args, i=config))
+    touch(config, b'<b/>')
+    assert cache.getKey(dict(args, i=config)) != key
+
+
+def test_getKey_folderSources(tmp_path):
+    cache = StepCache(str(tmp_path / 'cache'))
+    source = tmp_path / 'src'
+    touch(str(source / 'a' / 'b' / '1.tif'))
+    args = {'c': 'AR', 's': str(source)}
+    key = cache.getKey(args)
+    assert cache.getKey(args) == key
+    touch(str(source / 'a' / 'b' / '2.tif'))    # the mtime of (src) doesn't change.
+    added = cache.getKey(args)
+    assert added != key
+    touch(str(source / 'a' / 'b' / '1.tif'), b'xy')
+    assert cache.getKey(args) != added
+
+
+def test_getKey_missingSource(tmp_path):
+    cache = StepCache(str(tmp_path / 'cache'))
+    args = {'s': '{};{}'.format(tmp_path / 'none', tmp_path)}
+    key = cache.getKey(args)
+    touch(str(tmp_path / 'none'))
+    assert cache.getKey(args) != key
+
+
+def test_putGet(tmp_path):
+    cache = StepCache(str(tmp_path / 'cache'))
+    output = str(tmp_path / 'out.gdb')
+    retVals = [{'cmd': 'AR', 'output': output, 'value': True}]
+    assert cache.get('k') is None
+    assert cache.put('k', 'md', retVals)
+    assert cache.get('k') == retVals
+    assert cache.get('k', os.path.exists) is None   # the output is gone.
+    assert [e['step'] for e in cache.entries()] == ['md']
+    assert cache.put('j', 'other', retVals)
+    assert cache.invalidate(stepId='md') == 1
+    assert [e['key'] for e in cache.entries()] == ['j']
+    assert cache.invalidate() == 1
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+
+import MDCS
+
+
+@pytest.fixture
+def stepInfo(monkeypatch):
+    info = MDCS.StepInfoMDCS()
+    info.init()
+    item = SimpleNamespace(title='Amberg', tags=['a', 'b'], count=lambda n=1: n * 2)
+    info.addInput('x', {})
+    info.addResults('x', [{'cmd': 'x', 'output': item}])
+    info.addInput('md.item', {})
+    info.addResults('md.item', [{'cmd': 'md.item', 'output': SimpleNamespace(title='')}])
+    monkeypatch.setattr(MDCS, 'stepInfo', info)
+    return info
+
+
+def test_literals(stepInfo):
+    assert MDCS.parse_syntax('') == ''
+    assert MDCS.parse_syntax(5) == 5
+    assert MDCS.parse_syntax('plain') == 'plain'
+    assert MDCS.parse_syntax('@root/o/CM') == '@root/o/CM'
+    assert MDCS.parse_syntax('user@domain.com') == 'user@domain.com'
+
+
+def test_references(stepInfo):
+    assert MDCS.parse_syntax('@x.title') == 'Amberg'
+    assert MDCS.parse_syntax('@x.tags[1]') == 'b'
+    assert MDCS.parse_syntax('@x.count(n=3)') == 6
+
+
+def test_embedded(stepInfo):
+    assert MDCS.parse_syntax('title_@x.title') == 'title_Amberg'
+    assert MDCS.parse_syntax('tag_@x.tags[0]_end') == 'tag_a_end'
+    assert MDCS.parse_syntax('@x.title: @x.tags[0]') == 'Amberg: a'
+    assert MDCS.parse_syntax('a @x.title and @x.tags[0]') == 'a Amberg and a'
+    assert MDCS.parse_syntax('n=@x.count(2)') == 4   # non (str) values are returned as is.
+
+
+def test_assignment(stepInfo):
+    assert MDCS.parse_syntax('@md.item.title=@x.title') == 'Amberg'
+    assert MDCS.stepInfo.getResults('@md.item/o/md.item').title == 'Amberg'
+
+
+def test_errors(stepInfo):
+    with pytest.raises(MDCS.StepExpressionError):
+        MDCS.parse_syntax('@unknown.title')
+    with pytest.raises(MDCS.StepExpressionError):
+        MDCS.parse_syntax('@x.title + 1')
+    with pytest.raises(MDCS.StepExpressionError):
+        MDCS.parse_syntax('title_@x.missing')
+
+
+def test_splitStepAssignments():
+    assert MDCS.splitStepAssignments("@a.b=@c.f(x='=')") == ['@a.b', "@c.f(x='=')"]
+    assert MDCS.splitStepAssignments('@a.f(1==2)') == ['@a.f(1==2)']
+
+
+def test_getStepReferences():
+    assert MDCS.getStepReferences({'m': '@root/o/CM', 'p': ['@md.raster[0]$x']}) == ['root', 'md.raster']
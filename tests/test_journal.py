@@ -0,0 +1,42 @@
+from journal import Journal, const_rec_resume
+
+
+def test_resume(tmp_path):
+    config = tmp_path / 'config.xml'
+    config.write_text('<a/>')
+    journal = Journal(str(tmp_path / 'logs'), 'job', str(config))
+    assert journal.resume('CM+AR+BO') is None
+    assert journal.start('CM+AR+BO')
+    assert journal.command(0, 'CM', True, 'md', None)
+    assert journal.command(1, 'AR', True, 'md', 10)
+    assert journal.command(2, 'BO', False, 'md', 10)
+    done = journal.resume('CM+AR+BO')
+    assert sorted(done) == [(0, 'CM'), (1, 'AR')]
+    assert done[(1, 'AR')]['last_AT_ObjectID'] == 10
+    assert journal._read()[-1]['type'] == const_rec_resume
+    assert journal.resume('CM+AR') is None      # a different chain.
+
+
+def test_resume_lastRun(tmp_path):
+    journal = Journal(str(tmp_path), 'job')
+    journal.start('CM+AR')
+    journal.command(0, 'CM', True, 'md', None)
+    journal.start('CM+AR')
+    assert journal.resume('CM+AR') == {}
+
+
+def test_resume_configChanged(tmp_path):
+    config = tmp_path / 'config.xml'
+    config.write_text('<a/>')
+    Journal(str(tmp_path), 'job', str(config)).start('CM')
+    config.write_text('<b/>')
+    assert Journal(str(tmp_path), 'job', str(config)).resume('CM') is None
+
+
+def test_read_partialRecord(tmp_path):
+    journal = Journal(str(tmp_path), 'job')
+    journal.start('CM')
+    journal.command(0, 'CM', True, 'md', None)
+    with open(journal.path, 'a') as writer:
+        writer.write('{"type": "comm')     # killed mid write.
+    assert sorted(journal.resume('CM')) == [(0, 'CM')]
@@ -0,0 +1,291 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import Base
+from solutionsLib import Solutions
+
+GeoPath = 'c:/data/a.gdb'
+WorkspacePath = 'c:/mdcs'
+MD = os.path.join(GeoPath, 'md')
+
+
+def getDLPK(name):
+    return os.path.join(WorkspacePath, 'Parameter/DLPKpackages', name)
+
+
+# code: (tool, process, args if the process info is empty, args if every key is set), as resolved by the former executeCommand chain.
+Commands = {
+    'ANCP': ('arcpy.AnalyzeControlPoints_management', 'analyzecontrolpoints',
+        [MD],
+        [MD]),
+    'APCP': ('arcpy.AppendControlPoints_management ', 'appendcontrolpoints',
+        [],
+        []),
+    'ABA': ('arcpy.ApplyBlockAdjustment_management', 'applyblockadjustment',
+        [MD],
+        [MD]),
+    'CBA': ('arcpy.ComputeBlockAdjustment_management', 'computeblockadjustment',
+        [MD],
+        [MD]),
+    'CCP': ('arcpy.ComputeControlPoints_management', 'computecontrolpoints',
+        [MD],
+        [MD]),
+    'CTP': ('arcpy.ComputeTiePoints_management', 'computetiepoints',
+        [MD],
+        [MD]),
+    'AMDS': ('arcpy.AlterMosaicDatasetSchema_management', 'altermosaicdatasetschema',
+        [MD],
+        [MD]),
+    'AMD': ('arcpy.AnalyzeMosaicDataset_management', 'analyzemosaicdataset',
+        [MD],
+        [MD]),
+    'BMDIC': ('arcpy.BuildMosaicDatasetItemCache_management', 'buildmosaicdatasetitemcache',
+        [MD],
+        [MD]),
+    'CDA': ('arcpy.ComputeDirtyArea_management', 'computedirtyarea',
+        [MD],
+        [MD]),
+    'GEA': ('arcpy.GenerateExcludeArea_management', 'generateexcludearea',
+        [],
+        []),
+    'SY': ('arcpy.SynchronizeMosaicDataset_management', 'synchronizemosaicdataset',
+        [MD],
+        [MD]),
+    'EMDG': ('arcpy.ExportMosaicDatasetGeometry_management', 'exportmosaicdatasetgeometry',
+        [MD],
+        [MD]),
+    'EMDI': ('arcpy.ExportMosaicDatasetItems_management', 'exportmosaicdatasetitems',
+        [MD],
+        [MD]),
+    'SMDI': ('arcpy.MergeMosaicDatasetItems_management', 'splitmosaicdatasetitems',
+        [MD],
+        [MD]),
+    'CSDD': ('arcpy.CreateImageSDDraft', 'createimagesddraft',
+        [],
+        []),
+    'STS': ('arcpy.StageService_server', 'stageservice_server',
+        [],
+        []),
+    'USD': ('arcpy.UploadServiceDefinition_server', 'uploadservicedefinition_server',
+        [],
+        []),
+    'CRTT': ('arcpy.DeleteRows_management', 'clearrastertypetable',
+        [os.path.join(GeoPath, 'AMD_md_ART')],
+        [os.path.join(GeoPath, 'AMD_md_ART')]),
+    'CLT': ('arcpy.DeleteRows_management', 'clearlogstable',
+        [os.path.join(GeoPath, 'AMD_md_LOG')],
+        [os.path.join(GeoPath, 'AMD_md_LOG')]),
+    'CCM': ('arcpy.ComputeCameraModel_management', 'computecameramodel',
+        [MD],
+        [MD]),
+    'BSM': ('arcpy.BuildStereoModel_management', 'buildstereomodel',
+        [MD],
+        [MD]),
+    'GPC': ('arcpy.GeneratePointCloud_management', 'generatepointcloud',
+        [MD],
+        [MD]),
+    'IFPC': ('arcpy.InterpolateFromPointCloud_management', 'interpolatefrompointcloud',
+        [],
+        []),
+    'CRA': ('arcpy.CopyRaster_management', 'copyraster',
+        [],
+        []),
+    'DEL': ('arcpy.Delete_management', 'delete',
+        [],
+        []),
+    'BMI': ('arcpy.BuildMultidimensionalInfo_management', 'buildmultidimensionalinfo',
+        [MD],
+        [MD]),
+    'AMR': ('arcpy.ia.AggregateMultidimensionalRaster', 'aggregatemultidimensionalraster',
+        [],
+        []),
+    'ACUC': ('arcpy.ia.AnalyzeChangesUsingCCDC', 'analyzechangesusingccdc',
+        [],
+        []),
+    'DCUCAR': ('arcpy.ia.DetectChangeUsingChangeAnalysis', 'detectchangeusingchangeanalysis',
+        [],
+        []),
+    'FAS': ('arcpy.ia.FindArgumentStatistics', 'findargumentstatistics',
+        [],
+        []),
+    'GMA': ('arcpy.ia.GenerateMultidimensionalAnomaly', 'generatemultidimensionalanomaly',
+        [],
+        []),
+    'CF': ('arcpy.ComputeFiducials_management', 'computefiducials',
+        [MD],
+        [MD]),
+    'UIO': ('arcpy.UpdateInteriorOrientation_management', 'updateinteriororientation',
+        [MD],
+        [MD]),
+    'EFACP': ('arcpy.ExportFrameAndCameraParameters_management', 'exportframeandcameraparameters',
+        [MD],
+        [MD]),
+    'GBAR': ('arcpy.GenerateBlockAdjustmentReport_management', 'generateblockadjustmentreport',
+        [MD],
+        [MD]),
+    'GTR': ('arcpy.ia.GenerateTrendRaster', 'generatetrendraster',
+        [],
+        []),
+    'PUTR': ('arcpy.ia.PredictUsingTrendRaster', 'predictusingtrendraster',
+        [],
+        []),
+    'CPUDL': ('arcpy.ia.ClassifyPixelsUsingDeepLearning', 'classifypixelsusingdeeplearning',
+        [],
+        []),
+    'COUDL': ('arcpy.ia.ClassifyObjectsUsingDeepLearning', 'classifyobjectsusingdeeplearning',
+        [MD, MD + 'classifyobjectsusingdeeplearning', getDLPK('#'), '#', '#', '#', '#'],
+        ['in_raster', 'out_feature_class', getDLPK('model.dlpk'), 'in_features', 'class_label_field', 'processing_mode', 'model_arguments']),
+    'DOUDL': ('arcpy.ia.DetectObjectsUsingDeepLearning', 'detectobjectsusingdeeplearning',
+        [MD, MD + 'detectobjectsusingdeeplearning', getDLPK('#'), '#', '#', '#', '#', '#', '#'],
+        ['in_raster', 'out_detected_objects', getDLPK('model.dlpk'), 'arguments', 'run_nms', 'confidence_score_field', 'class_value_field', 'max_overlap_ratio', 'processing_mode']),
+    'EFUAIM': ('arcpy.geoai.ExtractFeaturesUsingAIModels', 'extractfeaturesusingaimodels',
+        [MD, '#', MD + 'extractfeaturesusingaimodels', MD + 'extractfeaturesusingaimodels', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
+        ['in_raster', 'mode', 'out_location', 'out_prefix', 'area_of_interest', 'pretrained_models', 'additional_models', 'confidence_threshold', 'save_intermediate_output', 'test_time_augmentation', 'buffer_distance', 'extend_length', 'smoothing_tolerance', 'dangle_length', 'in_road_features', 'road_buffer_width', 'regularize_parcels', 'post_processing_workflow', 'out_features', 'parcel_tolerance', 'regularization_method', 'poly_tolerance']),
+    'CL': ('arcpy.conversion.ConvertLas', 'convertlas',
+        [],
+        []),
+    'CLAS': ('arcpy.ddd.ColorizeLas', 'colorizelas',
+        [],
+        []),
+    'EL': ('arcpy.ddd.ExtractLas', 'extractlas',
+        [],
+        []),
+    'COID': ('arcpy.oi.CreateOrientedImageryDataset', 'createorientedimagerydataset',
+        [],
+        []),
+    'GSFOID': ('arcpy.oi.GenerateServiceFromOrientedImageryDataset', 'generateservicefromorientedimagerydataset',
+        [],
+        []),
+    'BOIF': ('arcpy.oi.BuildOrientedImageryFootprint', 'buildorientedimageryfootprint',
+        [],
+        []),
+    'AIFCIT': ('arcpy.oi.AddImagesFromCustomInputType', 'addimagesfromcustominputtype',
+        [],
+        []),
+    'AITOID': ('arcpy.oi.AddImagesToOrientedImageryDataset', 'addimagestoorientedimagerydataset',
+        [],
+        []),
+    'UOIDP': ('arcpy.oi.UpdateOrientedImageryDatasetProperties', 'updateorientedimagerydatasetproperties',
+        [],
+        []),
+    'CCSCF': ('arcpy.CreateCloudStorageConnectionFile_management', 'createcloudstorageconnectionfile',
+        [],
+        []),
+    'CSTCDL': ('arcpy.stpm.CreateSpaceTimeCubeDefinedLocations', 'createspacetimecubedefinedlocations',
+        [],
+        []),
+    'STCCPD': ('arcpy.stpm.ChangePointDetection', 'changepointdetection',
+        [],
+        []),
+    'STCTSC': ('arcpy.stpm.TimeSeriesClustering', 'timeseriesclustering',
+        [],
+        []),
+    'TF': ('arcpy.management.TransferFiles', 'transferfiles',
+        ['#', '#', '#'],
+        [os.path.join(WorkspacePath, 'Parameter/ACSFiles', 'a.acs') + ';c:/b.acs', 'output_folder', 'file_filter']),
+    'ZSAT': ('arcpy.ia.ZonalStatisticsAsTable', 'zonalstatisticsastable',
+        [],
+        []),
+    'PTDT': ('arcpy.management.Package3DTiles', 'package3dtiles',
+        [],
+        []),
+    'GRFRF': ('arcpy.management.GenerateRasterFromRasterFunction', 'generaterasterfromrasterfunction',
+        [],
+        []),
+}
+MDDefault = ['CSDD', 'CRA']     # an empty first arg defaults to the mosaic dataset.
+Values = {'input_paths': 'a.acs;c:/b.acs', 'in_model_definition': 'model.dlpk'}
+
+
+class Log(object):
+    const_general_text = 0
+    const_warning_text = 1
+    const_critical_text = 2
+
+    def Message(self, msg, level=0):
+        pass
+
+
+class FakeBase(object):
+    m_geoPath = GeoPath
+    m_mdName = 'md'
+    const_workspace_path_ = WorkspacePath
+
+    def __init__(self):
+        self.m_log = Log()
+
+
+class AllKeys(dict):
+    """Process info with every key set, values are the key names."""
+
+    def keys(self):
+        return self
+
+    def __contains__(self, key):
+        return True
+
+    def __missing__(self, key):
+        return Values.get(key, key)
+
+
+class Processes(dict):
+    """{process: [values]} of a single entry per process, all keys set if (full)"""
+
+    def __init__(self, full):
+        self.full = full
+
+    def __missing__(self, key):
+        return [AllKeys() if self.full else {}]
+
+
+def getSolutions(full):
+    solutions = Solutions(FakeBase())
+    solutions.processInfo = SimpleNamespace(processInfo=Processes(full))
+    return solutions
+
+
+def test_commands():
+    codes = [c for c, v in Solutions.commands.items() if v['fnc'] is Solutions._invokeToolCommand]
+    assert sorted(codes) == sorted(Commands)
+
+
+@pytest.mark.parametrize('code', sorted(Commands))
+@pytest.mark.parametrize('full', [False, True])
+def test_invokeToolCommand(monkeypatch, code, full):
+    calls = []
+
+    def invoke(self, args, processKey, fn_name, index, **kwargs):
+        calls.append((fn_name, processKey, args, kwargs))
+        return True
+    monkeypatch.setattr(Solutions, '_Solutions__invokeDynamicFn', invoke)
+    assert getSolutions(full).executeCommand(code) is True
+    (tool, process, emptyArgs, args) = Commands[code]
+    kwargs = {'info': {'md': MD}} if code in MDDefault else {}
+    assert calls == [(tool, process, args if full else emptyArgs, kwargs)]
+
+
+class FakeInvoke(object):
+    calls = []
+
+    def __init__(self, name, args, evnt_fnc_update_args=None, log=None):
+        self.name = name
+        self.args = args
+
+    def init(self, **kwargs):
+        return True
+
+    def invoke(self):
+        FakeInvoke.calls.append((self.name, list(self.args)))
+        return True
+
+
+def test_invokeToolCommand_mdDefault(monkeypatch, arcpy):
+    FakeInvoke.calls = []
+    monkeypatch.setattr(Base, 'DynaInvoke', FakeInvoke)
+    monkeypatch.setattr(Base, 'resolveTool', lambda name: (getattr(arcpy, name.split('.')[-1]), ['in_raster', 'out_rasterdataset']))
+    solutions = getSolutions(False)
+    solutions.processInfo.processInfo['copyraster'] = [{'returnvalue': '#'}]
+    assert solutions.executeCommand('CRA') is True
+    assert FakeInvoke.calls == [('arcpy.CopyRaster_management', [MD, None])]
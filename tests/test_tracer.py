@@ -0,0 +1,74 @@
+import os
+import csv
+import json
+from concurrent.futures import Future
+
+import pytest
+
+import tracer
+import MDCS
+
+
+@pytest.fixture
+def session(tmp_path):
+    yield tracer.enable(str(tmp_path / 'trace.json'))
+    tracer.disable()
+
+
+def test_finish(session, tmp_path):
+    with tracer.span('job', 'job'):
+        with tracer.span('AR', 'command', {'m': 'md'}) as sp:
+            sp.set('items', 2)
+    assert session.finish()
+    with open(str(tmp_path / 'trace.json')) as reader:
+        events = json.load(reader)['traceEvents']
+    assert [e['name'] for e in events] == ['job', 'AR']
+    assert events[1]['args']['parent'] == 'job'
+    assert events[1]['args']['items'] == 2
+    with open(str(tmp_path / 'trace.csv'), newline='') as reader:
+        assert [r['name'] for r in csv.DictReader(reader)] == ['job', 'AR']
+    assert not [f for f in os.listdir(str(tmp_path)) if f.endswith('.part')]
+    assert set(tracer.readDurations(str(tmp_path / 'trace'))) == {('job', 'job'), ('command', 'AR')}
+
+
+def test_disabled():
+    tracer.disable()
+    assert tracer.getPath() is None
+    assert tracer.span('AR', 'command') is tracer.g_null_span
+
+
+def traced():
+    with tracer.span('task', 'step'):
+        pass
+    return tracer.getPath()
+
+
+def test_runPooledTask(session):
+    tracer.disable()    # a pool worker without a session of its own.
+    resp = MDCS.runPooledTask(session.path, traced)
+    assert resp['result'] == session.path
+    assert tracer.get() is None
+    assert os.path.exists('{}.{}{}'.format(session.path, os.getpid(), tracer.const_fragment_ext))
+    assert MDCS.runPooledTask(None, traced)['result'] is None
+
+
+class FakeExecutor(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fnc, *args):
+        self.calls.append(args)
+        task = Future()
+        task.set_result({'result': None, 'rss': None})
+        return task
+
+
+def test_WarmPool_submit(tmp_path):
+    pool = MDCS.WarmPool()
+    pool._executor = executor = FakeExecutor()
+    path = tracer.enable(str(tmp_path / 'trace')).path
+    pool.submit(traced)
+    tracer.disable()    # a pool started while tracing stops tracing with the session.
+    pool.submit(traced)
+    assert [c[0] for c in executor.calls] == [path, None]